@@ -1,22 +1,76 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import hmac
+import importlib
+import io
+import json
 import logging
 import math
+import multiprocessing
 import os
+import re
+import sys
 import tempfile
 import threading
-from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
-from dataclasses import dataclass
+import time
+import tracemalloc
+import uuid
+import wave
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError, wait as wait_futures
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, replace
+from multiprocessing.connection import Connection
+from multiprocessing.context import BaseContext
 from pathlib import Path
-from typing import Callable, Iterable, Protocol
+from types import FrameType, ModuleType
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Literal, NoReturn, Protocol
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, WebSocket
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import FileResponse, JSONResponse
-from pydantic import BaseModel
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field, ValidationError
 from starlette.background import BackgroundTask
+from starlette.requests import HTTPConnection
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Marks the end of dependency imports, so the startup profile can tell
+# interpreter and framework import time apart from this module's own.
+_MODULE_LOAD_STARTED = time.perf_counter()
+_MODULE_LOADED: float | None = None
+_LAZY_IMPORT_SECONDS: dict[str, float] = {}
 
 LOGGER = logging.getLogger("chrome-readit-coqui")
+MAX_JOB_POLL_SECONDS = 30.0
+MAX_PROFILE_SECONDS = 60.0
+PROFILE_REPLY_GRACE_SECONDS = 5.0
+MODEL_WARMUP_TEXT = "Warming up."
+DEFAULT_CLIENT_ID = "anonymous"
+CLIENT_ID_HEADER = "X-Client-Id"
+MAX_CLIENT_ID_CHARS = 64
+MIN_RECOMMENDED_CHUNK_CHARS = 40
+MAX_CHUNK_TIME_FACTOR = 2.0
+MIN_MEASURED_OBSERVATIONS = 3
+MAX_AUDIO_IDENTITIES = 4096
+AUDIO_CACHE_CONTROL = "public, max-age=3600"
+MIN_SPEECH_RATE = 0.5
+MAX_SPEECH_RATE = 2.0
+TRIM_THRESHOLD_DBFS = -45.0
+PEAK_CEILING_DBFS = -1.0
+TEMPO_WINDOW_MS = 40
+TEMPO_TOLERANCE_MS = 10
+HEAVY_MODULES = ("TTS", "torch", "numpy")
+TUNABLE_SETTINGS = ("queue_capacity", "queue_work_seconds", "synthesis_timeout_seconds", "max_text_chars")
+MAX_CONFIG_CHANGE_EVENTS = 32
+PREWARM_IDLE_POLL_SECONDS = 0.05
+VOICE_SAMPLE_WINDOW = 128
+VOICE_LIST_CACHE_CONTROL = "public, max-age=300"
+VOICE_CATALOG_CACHE_CONTROL = "public, max-age=30"
+LONG_TEXT_RETRY_SECONDS = 0.25
 
 
 class TTSBackend(Protocol):
@@ -34,6 +88,17 @@ def _positive_int_environment(name: str, default: str) -> int:
     return value
 
 
+def _non_negative_int_environment(name: str, default: str) -> int:
+    raw = os.environ.get(name, default).strip()
+    try:
+        value = int(raw)
+    except ValueError as error:
+        raise ValueError(f"{name} must be a non-negative integer") from error
+    if value < 0:
+        raise ValueError(f"{name} must be a non-negative integer")
+    return value
+
+
 def _positive_float_environment(name: str, default: str) -> float:
     raw = os.environ.get(name, default).strip()
     try:
@@ -45,6 +110,45 @@ def _positive_float_environment(name: str, default: str) -> float:
     return value
 
 
+def _non_negative_float_environment(name: str, default: str) -> float:
+    raw = os.environ.get(name, default).strip()
+    try:
+        value = float(raw)
+    except ValueError as error:
+        raise ValueError(f"{name} must be a non-negative finite number") from error
+    if not math.isfinite(value) or value < 0:
+        raise ValueError(f"{name} must be a non-negative finite number")
+    return value
+
+
+def _non_positive_float_environment(name: str, default: str) -> float:
+    raw = os.environ.get(name, default).strip()
+    try:
+        value = float(raw)
+    except ValueError as error:
+        raise ValueError(f"{name} must be a finite number no greater than zero") from error
+    if not math.isfinite(value) or value > 0:
+        raise ValueError(f"{name} must be a finite number no greater than zero")
+    return value
+
+
+def _choice_environment(name: str, default: str, choices: Iterable[str]) -> str:
+    allowed = tuple(choices)
+    value = os.environ.get(name, default).strip().lower()
+    if value not in allowed:
+        raise ValueError(f"{name} must be one of: {', '.join(allowed)}")
+    return value
+
+
+def _boolean_environment(name: str, default: str) -> bool:
+    value = os.environ.get(name, default).strip().lower()
+    if value in ("1", "true", "yes", "on"):
+        return True
+    if value in ("0", "false", "no", "off"):
+        return False
+    raise ValueError(f"{name} must be a boolean")
+
+
 def _deduplicate_strings(values: Iterable[object]) -> list[str]:
     output: list[str] = []
     seen: set[str] = set()
@@ -63,6 +167,47 @@ class ServiceConfig:
     queue_capacity: int
     synthesis_timeout_seconds: float
     forced_voices: tuple[str, ...]
+    audio_cache_max_bytes: int = 64 * 1024 * 1024
+    sentence_silence_ms: int = 250
+    queue_work_seconds: float = 60.0
+    cost_seconds_per_char: float = 0.02
+    timed_out_result_ttl_seconds: float = 60.0
+    job_result_ttl_seconds: float = 300.0
+    max_retained_jobs: int = 256
+    max_document_chars: int = 200_000
+    session_target_chunk_chars: int = 280
+    session_lookahead_chunks: int = 3
+    session_idle_ttl_seconds: float = 600.0
+    max_sessions: int = 16
+    stream_max_in_flight: int = 2
+    stream_max_pending: int = 64
+    inference_isolation: str = "thread"
+    inference_hard_timeout_seconds: float = 180.0
+    inference_standby: bool = True
+    inference_start_method: str = "spawn"
+    liveness_stall_multiplier: float = 4.0
+    liveness_min_stall_seconds: float = 60.0
+    inference_recycle_after_jobs: int = 0
+    inference_recycle_rss_bytes: int = 0
+    admin_token: str = field(default="", repr=False)
+    available_models: tuple[str, ...] = ()
+    model_memory_budget_bytes: int = 0
+    spool_dir: str = ""
+    spool_max_bytes: int = 0
+    client_rate_per_second: float = 0.0
+    client_burst: int = 10
+    client_max_slots: int = 0
+    trusted_proxies: tuple[str, ...] = ()
+    target_first_audio_seconds: float = 5.0
+    postprocess: bool = False
+    trim_pad_ms: int = 80
+    loudness_target_dbfs: float = -20.0
+    trace_path: str = ""
+    trace_max_bytes: int = 64 * 1024 * 1024
+    prewarm_corpus_path: str = ""
+    prewarm_voices: tuple[str, ...] = ()
+    max_long_text_chars: int = 20000
+    long_text_max_in_flight: int = 2
 
     @classmethod
     def from_environment(cls) -> "ServiceConfig":
@@ -70,38 +215,170 @@ class ServiceConfig:
         if not model_name:
             raise ValueError("COQUI_MODEL must not be empty")
         forced_voices = tuple(_deduplicate_strings(os.environ.get("COQUI_VOICES", "").split(",")))
+        available_models = tuple(
+            _deduplicate_strings([model_name, *os.environ.get("COQUI_MODELS", "").split(",")])
+        )
         return cls(
             model_name=model_name,
             max_text_chars=_positive_int_environment("MAX_TEXT_CHARS", "500"),
-            queue_capacity=_positive_int_environment("SYNTH_QUEUE_CAPACITY", "4"),
+            queue_capacity=_positive_int_environment("SYNTH_QUEUE_CAPACITY", "16"),
             synthesis_timeout_seconds=_positive_float_environment("SYNTH_TIMEOUT_SECONDS", "120"),
             forced_voices=forced_voices,
+            audio_cache_max_bytes=_non_negative_int_environment("AUDIO_CACHE_MAX_BYTES", str(64 * 1024 * 1024)),
+            sentence_silence_ms=_non_negative_int_environment("SENTENCE_SILENCE_MS", "250"),
+            queue_work_seconds=_positive_float_environment("SYNTH_QUEUE_WORK_SECONDS", "60"),
+            cost_seconds_per_char=_positive_float_environment("SYNTH_COST_SECONDS_PER_CHAR", "0.02"),
+            timed_out_result_ttl_seconds=_positive_float_environment("TIMED_OUT_RESULT_TTL_SECONDS", "60"),
+            job_result_ttl_seconds=_positive_float_environment("JOB_RESULT_TTL_SECONDS", "300"),
+            max_retained_jobs=_positive_int_environment("MAX_RETAINED_JOBS", "256"),
+            max_document_chars=_positive_int_environment("MAX_DOCUMENT_CHARS", "200000"),
+            session_target_chunk_chars=_positive_int_environment("SESSION_TARGET_CHUNK_CHARS", "280"),
+            session_lookahead_chunks=_non_negative_int_environment("SESSION_LOOKAHEAD_CHUNKS", "3"),
+            session_idle_ttl_seconds=_positive_float_environment("SESSION_IDLE_TTL_SECONDS", "600"),
+            max_sessions=_positive_int_environment("MAX_SESSIONS", "16"),
+            stream_max_in_flight=_positive_int_environment("STREAM_MAX_IN_FLIGHT", "2"),
+            stream_max_pending=_positive_int_environment("STREAM_MAX_PENDING", "64"),
+            inference_isolation=_choice_environment("INFERENCE_ISOLATION", "thread", ("thread", "process")),
+            inference_hard_timeout_seconds=_positive_float_environment("INFERENCE_HARD_TIMEOUT_SECONDS", "180"),
+            inference_standby=_boolean_environment("INFERENCE_STANDBY", "1"),
+            inference_start_method=_choice_environment(
+                "INFERENCE_START_METHOD", "spawn", multiprocessing.get_all_start_methods()
+            ),
+            liveness_stall_multiplier=_positive_float_environment("LIVENESS_STALL_MULTIPLIER", "4"),
+            liveness_min_stall_seconds=_positive_float_environment("LIVENESS_MIN_STALL_SECONDS", "60"),
+            inference_recycle_after_jobs=_non_negative_int_environment("INFERENCE_RECYCLE_AFTER_JOBS", "0"),
+            inference_recycle_rss_bytes=_non_negative_int_environment("INFERENCE_RECYCLE_RSS_BYTES", "0"),
+            admin_token=os.environ.get("ADMIN_TOKEN", "").strip(),
+            available_models=available_models,
+            model_memory_budget_bytes=_non_negative_int_environment("MODEL_MEMORY_BUDGET_BYTES", "0"),
+            spool_dir=os.environ.get("SPOOL_DIR", "").strip(),
+            spool_max_bytes=_non_negative_int_environment("SPOOL_MAX_BYTES", "0"),
+            client_rate_per_second=_non_negative_float_environment("CLIENT_RATE_PER_SECOND", "0"),
+            client_burst=_positive_int_environment("CLIENT_BURST", "10"),
+            client_max_slots=_non_negative_int_environment("CLIENT_MAX_SLOTS", "0"),
+            trusted_proxies=tuple(_deduplicate_strings(os.environ.get("TRUSTED_PROXIES", "").split(","))),
+            target_first_audio_seconds=_positive_float_environment("TARGET_FIRST_AUDIO_SECONDS", "5"),
+            postprocess=_boolean_environment("POSTPROCESS", "0"),
+            trim_pad_ms=_non_negative_int_environment("TRIM_PAD_MS", "80"),
+            loudness_target_dbfs=_non_positive_float_environment("LOUDNESS_TARGET_DBFS", "-20"),
+            trace_path=os.environ.get("TRACE_PATH", "").strip(),
+            trace_max_bytes=_non_negative_int_environment("TRACE_MAX_BYTES", str(64 * 1024 * 1024)),
+            prewarm_corpus_path=os.environ.get("PREWARM_CORPUS", "").strip(),
+            prewarm_voices=tuple(_deduplicate_strings(os.environ.get("PREWARM_VOICES", "").split(","))),
+            max_long_text_chars=_non_negative_int_environment("MAX_LONG_TEXT_CHARS", "20000"),
+            long_text_max_in_flight=_positive_int_environment("LONG_TEXT_MAX_IN_FLIGHT", "2"),
         )
 
 
 class TTSRequest(BaseModel):
     text: str
     voice: str | None = None
+    model: str | None = None
+    deadline_seconds: float | None = Field(default=None, gt=0, allow_inf_nan=False)
+    rate: float | None = Field(default=None, ge=MIN_SPEECH_RATE, le=MAX_SPEECH_RATE, allow_inf_nan=False)
+
+
+class LongTextRequest(BaseModel):
+    text: str
+    voice: str | None = None
+    model: str | None = None
+    rate: float | None = Field(default=None, ge=MIN_SPEECH_RATE, le=MAX_SPEECH_RATE, allow_inf_nan=False)
+    stream: bool = False
+
+
+class SessionRequest(BaseModel):
+    text: str
+    voice: str | None = None
+    model: str | None = None
+    lookahead_chunks: int | None = Field(default=None, ge=0, le=64)
+
+
+class SessionSeekRequest(BaseModel):
+    index: int = Field(ge=0)
+    paused: bool | None = None
+
+
+class ModelReloadRequest(BaseModel):
+    model: str | None = None
+    make_default: bool = False
+
+
+class SettingsUpdateRequest(BaseModel):
+    queue_capacity: int | None = Field(default=None, ge=1, le=4096)
+    queue_work_seconds: float | None = Field(default=None, gt=0, allow_inf_nan=False)
+    synthesis_timeout_seconds: float | None = Field(default=None, gt=0, allow_inf_nan=False)
+    max_text_chars: int | None = Field(default=None, ge=1)
+
+
+class MemoryTracingRequest(BaseModel):
+    enabled: bool
+    frames: int = Field(default=1, ge=1, le=64)
+
+
+class StreamCommand(BaseModel):
+    type: Literal["synthesize", "pause", "resume", "seek", "cancel", "priority"]
+    id: str | None = None
+    ids: list[str] | None = None
+    text: str | None = None
+    voice: str | None = None
+    model: str | None = None
+    priority: int = 0
 
 
 class InvalidVoiceError(ValueError):
     pass
 
 
+class InvalidModelError(ValueError):
+    pass
+
+
+class ReloadInProgressError(RuntimeError):
+    pass
+
+
+class SpoolFullError(OverflowError):
+    pass
+
+
 class BackendNotReadyError(RuntimeError):
     pass
 
 
+class ClientLimitError(OverflowError):
+    def __init__(self, message: str, code: str, retry_after_seconds: float | None = None) -> None:
+        super().__init__(message)
+        self.code = code
+        self.retry_after_seconds = retry_after_seconds
+
+
+class RangeNotSatisfiableError(ValueError):
+    pass
+
+
+class DeadlineUnreachableError(OverflowError):
+    def __init__(self, message: str, retry_after_seconds: float) -> None:
+        super().__init__(message)
+        self.retry_after_seconds = retry_after_seconds
+
+
 ModelLoader = Callable[[ServiceConfig], TTSBackend]
 
 
+def _timed_import(name: str) -> ModuleType:
+    started = time.perf_counter()
+    module = importlib.import_module(name)
+    _LAZY_IMPORT_SECONDS.setdefault(name, time.perf_counter() - started)
+    return module
+
+
 def load_coqui_model(config: ServiceConfig) -> TTSBackend:
     try:
-        from TTS.api import TTS
+        tts_api = _timed_import("TTS.api")
     except Exception as error:  # pragma: no cover - exercised by real container smoke tests
         raise RuntimeError(f"Failed to import Coqui TTS: {error}") from error
 
-    return TTS(model_name=config.model_name, progress_bar=False, gpu=False)
+    return tts_api.TTS(model_name=config.model_name, progress_bar=False, gpu=False)
 
 
 def discover_voices(backend: object, forced_voices: tuple[str, ...] = ()) -> list[str]:
@@ -117,257 +394,3248 @@ def discover_voices(backend: object, forced_voices: tuple[str, ...] = ()) -> lis
     return []
 
 
-@dataclass(frozen=True)
-class RuntimeMetrics:
-    queue_capacity: int
-    slots_in_use: int
-    active_inference: int
-    queued_futures: int
-    timed_out_running: int
-    tracked_temp_files: int
-    cleanup_failures: int
-
-    @property
-    def accepting_requests(self) -> bool:
-        return self.slots_in_use < self.queue_capacity
+def model_language(model_id: str) -> str | None:
+    parts = model_id.split("/")
+    if len(parts) >= 3 and parts[0] == "tts_models" and parts[1] != "multilingual":
+        return parts[1]
+    return None
 
 
-class SynthesisRuntime:
-    def __init__(self, config: ServiceConfig, model_loader: ModelLoader) -> None:
-        self.config = config
-        self._model_loader = model_loader
-        self._backend: TTSBackend | None = None
-        self._voices: tuple[str, ...] = ()
-        self._executor: ThreadPoolExecutor | None = None
-        self._slots = threading.BoundedSemaphore(config.queue_capacity)
-        self._metrics_lock = threading.Lock()
-        self._slots_in_use = 0
-        self._active_inference = 0
-        self._queued_futures = 0
-        self._timed_out_futures: set[Future[str]] = set()
-        self._temp_paths: set[str] = set()
-        self._active_paths: set[str] = set()
-        self._cleanup_failures: dict[str, int] = {}
-        self._temp_paths_lock = threading.Lock()
-        self.ready = False
+def _process_age_seconds() -> float | None:
+    try:
+        fields = Path("/proc/self/stat").read_text().rsplit(")", 1)[1].split()
+        uptime = float(Path("/proc/uptime").read_text().split()[0])
+        return max(0.0, uptime - int(fields[19]) / os.sysconf("SC_CLK_TCK"))
+    except (OSError, ValueError, IndexError):
+        return None
 
-    def start(self) -> None:
-        backend = self._model_loader(self.config)
-        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="coqui-synthesis")
-        self._backend = backend
-        self._voices = tuple(discover_voices(backend, self.config.forced_voices))
-        self._executor = executor
-        self.ready = True
 
-    def shutdown(self) -> None:
-        self.ready = False
-        executor = self._executor
-        self._executor = None
-        if executor is not None:
-            # In-process Coqui inference cannot be force-cancelled safely. This
-            # returns promptly, cancels work that has not started, and leaves
-            # active paths tracked until their worker callback actually exits.
-            executor.shutdown(wait=False, cancel_futures=True)
-        with self._temp_paths_lock:
-            retryable_paths = list(self._temp_paths - self._active_paths)
-        for path in retryable_paths:
-            self.cleanup_path(path)
-        self._backend = None
-        self._voices = ()
+def _measure_startup(runtime_start_seconds: float) -> dict[str, object]:
+    now = time.perf_counter()
+    process_age = _process_age_seconds()
+    before_app = None if process_age is None else max(0.0, _MODULE_LOAD_STARTED - (now - process_age))
+    return {
+        "before_app_import_seconds": before_app,
+        "app_module_seconds": (_MODULE_LOADED or now) - _MODULE_LOAD_STARTED,
+        "runtime_start_seconds": runtime_start_seconds,
+        "process_ready_seconds": process_age,
+        "lazy_imports": dict(_LAZY_IMPORT_SECONDS),
+        "heavy_modules_loaded": [name for name in HEAVY_MODULES if name in sys.modules],
+    }
 
-    def voices(self) -> list[str]:
-        return list(self._voices)
 
-    def metrics(self) -> RuntimeMetrics:
-        with self._metrics_lock, self._temp_paths_lock:
-            return RuntimeMetrics(
-                queue_capacity=self.config.queue_capacity,
-                slots_in_use=self._slots_in_use,
-                active_inference=self._active_inference,
-                queued_futures=self._queued_futures,
-                timed_out_running=len(self._timed_out_futures),
-                tracked_temp_files=len(self._temp_paths),
-                cleanup_failures=sum(self._cleanup_failures.values()),
-            )
+def _process_rss_bytes(pid: int | None = None) -> int | None:
+    try:
+        fields = Path(f"/proc/{pid or 'self'}/statm").read_text().split()
+        return int(fields[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
 
-    def tracked_temp_paths(self) -> tuple[str, ...]:
-        with self._temp_paths_lock:
-            return tuple(sorted(self._temp_paths))
 
-    def cleanup_failures(self) -> dict[str, int]:
-        with self._temp_paths_lock:
-            return dict(self._cleanup_failures)
+class InferenceProcessError(RuntimeError):
+    pass
 
-    def cleanup_path(self, path: str) -> bool:
-        with self._temp_paths_lock:
-            if path in self._active_paths:
-                return False
-        candidate = Path(path)
-        try:
-            candidate.unlink(missing_ok=True)
-        except OSError:
-            with self._temp_paths_lock:
-                self._temp_paths.add(path)
-                self._cleanup_failures[path] = self._cleanup_failures.get(path, 0) + 1
-            LOGGER.exception("Temporary audio cleanup failed")
-            return False
 
-        with self._temp_paths_lock:
-            self._temp_paths.discard(path)
-            self._cleanup_failures.pop(path, None)
-        return True
+class InferenceKilledError(InferenceProcessError):
+    pass
 
-    def _resolve_voice(self, voice: str | None) -> str | None:
-        if not self._voices:
-            return None
-        selected = voice.strip() if isinstance(voice, str) and voice.strip() else self._voices[0]
-        if selected not in self._voices:
-            raise InvalidVoiceError(f"Voice '{selected}' is not available")
-        return selected
 
-    def _acquire_slot(self) -> None:
-        if not self._slots.acquire(blocking=False):
-            raise OverflowError("Synthesis queue is full")
-        with self._metrics_lock:
-            self._slots_in_use += 1
-            if self._slots_in_use > self.config.queue_capacity:
-                self._slots_in_use -= 1
-                self._slots.release()
-                raise RuntimeError("Synthesis queue accounting exceeded capacity")
+def _serve_profiles(connection: Connection, thread_id: int) -> None:  # pragma: no cover - inference child
+    while True:
+        try:
+            request_id, label, seconds, interval = connection.recv()
+        except (EOFError, OSError):
+            return
+        stacks, _samples = sample_stacks(lambda: {thread_id: label}, seconds, interval)
+        connection.send((request_id, dict(stacks)))
 
-    def _release_slot(self, future: Future[str] | None = None) -> None:
-        with self._metrics_lock:
-            if future is not None:
-                self._timed_out_futures.discard(future)
-            if self._slots_in_use <= 0:
-                raise RuntimeError("Synthesis queue accounting became negative")
-            self._slots_in_use -= 1
-        self._slots.release()
 
-    def _run_synthesis(
-        self,
-        backend: TTSBackend,
-        text: str,
-        selected_voice: str | None,
-        output_path: str,
-    ) -> str:
-        with self._metrics_lock:
-            if self._queued_futures <= 0:
-                raise RuntimeError("Queued synthesis accounting became negative")
-            self._queued_futures -= 1
-            self._active_inference += 1
-        with self._temp_paths_lock:
-            self._active_paths.add(output_path)
+def _inference_worker_main(  # pragma: no cover - runs in the inference child process
+    connection: Connection, profiler: Connection, model_loader: ModelLoader, config: ServiceConfig
+) -> None:
+    threading.Thread(
+        target=_serve_profiles, args=(profiler, threading.get_ident()), name="coqui-profiler", daemon=True
+    ).start()
+    try:
+        backend = model_loader(config)
+        voices = discover_voices(backend, config.forced_voices)
+    except Exception as error:
+        connection.send(("failed", f"{type(error).__name__}: {error}"))
+        return
+    connection.send(("ready", voices))
+    while True:
         try:
-            if selected_voice is None:
-                backend.tts_to_file(text=text, file_path=output_path)
+            request = connection.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+        text, file_path, speaker = request
+        try:
+            if speaker is None:
+                backend.tts_to_file(text=text, file_path=file_path)
             else:
-                backend.tts_to_file(text=text, file_path=output_path, speaker=selected_voice)
+                backend.tts_to_file(text=text, file_path=file_path, speaker=speaker)
+        except Exception as error:
+            connection.send(("error", f"{type(error).__name__}: {error}"))
+        else:
+            connection.send(("ok", None))
 
-            output = Path(output_path)
-            if not output.exists() or output.stat().st_size <= 0:
-                raise RuntimeError("TTS backend produced an empty audio file")
-            return output_path
-        finally:
-            with self._temp_paths_lock:
-                self._active_paths.discard(output_path)
-            with self._metrics_lock:
-                if self._active_inference <= 0:
-                    raise RuntimeError("Active inference accounting became negative")
-                self._active_inference -= 1
 
-    def _future_completed(self, future: Future[str], output_path: str) -> None:
-        if future.cancelled():
-            with self._metrics_lock:
-                if self._queued_futures <= 0:
-                    raise RuntimeError("Queued synthesis accounting became negative")
-                self._queued_futures -= 1
-            self.cleanup_path(output_path)
-        self._release_slot(future)
+class _InferenceProcess:
+    def __init__(self, context: BaseContext, model_loader: ModelLoader, config: ServiceConfig) -> None:
+        self.connection, child_connection = context.Pipe()
+        self.profiler, child_profiler = context.Pipe()
+        self.process = context.Process(
+            target=_inference_worker_main,
+            args=(child_connection, child_profiler, model_loader, config),
+            name="coqui-inference",
+            daemon=True,
+        )
+        self.process.start()
+        child_connection.close()
+        child_profiler.close()
+        self.voices: list[str] = []
+        self.jobs = 0
+        self._closed = False
 
-    def submit(self, text: str, voice: str | None) -> tuple[Future[str], str]:
-        backend = self._backend
-        executor = self._executor
-        if not self.ready or backend is None or executor is None:
-            raise BackendNotReadyError("TTS backend is not ready")
+    def wait_ready(self) -> None:
+        while not self.connection.poll(0.5):
+            if not self.process.is_alive():
+                raise InferenceProcessError("Inference process exited during startup")
+        try:
+            status, detail = self.connection.recv()
+        except EOFError as error:
+            raise InferenceProcessError("Inference process exited during startup") from error
+        if status != "ready":
+            raise InferenceProcessError(f"Inference process failed to load the model: {detail}")
+        self.voices = list(detail)
 
-        selected_voice = self._resolve_voice(voice)
-        self._acquire_slot()
-        output_path: str | None = None
-        descriptor: int | None = None
-        future: Future[str] | None = None
+    def rss_bytes(self) -> int | None:
+        return None if self._closed else _process_rss_bytes(self.process.pid)
+
+    def retire(self) -> None:
+        if self._closed:
+            return
         try:
-            descriptor, output_path = tempfile.mkstemp(suffix=".wav", prefix="chrome-readit-")
-            os.close(descriptor)
-            descriptor = None
-            with self._temp_paths_lock:
-                self._temp_paths.add(output_path)
-            with self._metrics_lock:
-                self._queued_futures += 1
-            try:
-                future = executor.submit(self._run_synthesis, backend, text, selected_voice, output_path)
-            except Exception:
-                with self._metrics_lock:
-                    self._queued_futures -= 1
-                raise
-            future.add_done_callback(lambda completed: self._future_completed(completed, output_path))
-            return future, output_path
-        except Exception:
-            if descriptor is not None:
-                try:
-                    os.close(descriptor)
-                except OSError:
-                    LOGGER.exception("Temporary descriptor cleanup failed")
-            if output_path is not None:
-                self.cleanup_path(output_path)
-            if future is None:
-                self._release_slot()
-            raise
+            self.connection.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=5)
+        self.kill()
 
-    def mark_timed_out(self, future: Future[str]) -> None:
-        with self._metrics_lock:
-            if not future.done():
-                self._timed_out_futures.add(future)
+    def kill(self) -> None:
+        if self._closed:
+            return
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=5)
+        self.connection.close()
+        self.profiler.close()
+        if not self.process.is_alive():
+            self.process.close()
+            self._closed = True
 
 
-def error_payload(code: str, message: str) -> dict[str, object]:
-    return {"ok": False, "error": {"code": code, "message": message}}
+@dataclass(frozen=True)
+class InferenceProcessStats:
+    kills: int
+    respawns: int
+    last_recovery_seconds: float | None
+    recycles: int
+    jobs: int
+    rss_bytes: int | None
 
 
-def raise_api_error(status_code: int, code: str, message: str) -> None:
-    raise HTTPException(status_code=status_code, detail={"code": code, "message": message})
+def _kill_when_ready(standby: Future[_InferenceProcess]) -> None:
+    if standby.exception() is None:
+        standby.result().kill()
 
 
-def create_app(
-    *,
-    config: ServiceConfig | None = None,
-    model_loader: ModelLoader = load_coqui_model,
-) -> FastAPI:
-    service_config = config or ServiceConfig.from_environment()
-    application = FastAPI(title="Chrome Read It Coqui TTS", docs_url=None, redoc_url=None)
-    runtime = SynthesisRuntime(service_config, model_loader)
-    application.state.runtime = runtime
+class IsolatedBackend:
+    def __init__(self, config: ServiceConfig, model_loader: ModelLoader) -> None:
+        self._config = config
+        self._model_loader = model_loader
+        self._context = multiprocessing.get_context(config.inference_start_method)
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._profile_lock = threading.Lock()
+        self._profile_requests = 0
+        self._standby: Future[_InferenceProcess] | None = None
+        self._closed = False
+        self._kills = 0
+        self._respawns = 0
+        self._last_recovery_seconds: float | None = None
+        self._recycles = 0
+        self._recycle_events: deque[dict[str, object]] = deque(maxlen=16)
+        self._active = self._spawn()
+        self.speakers = list(self._active.voices)
+        if config.inference_standby:
+            self._start_standby()
 
-    @application.on_event("startup")
-    def startup_event() -> None:
-        runtime.start()
+    def _spawn(self) -> _InferenceProcess:
+        worker = _InferenceProcess(self._context, self._model_loader, self._config)
+        try:
+            worker.wait_ready()
+        except BaseException:
+            worker.kill()
+            raise
+        return worker
 
-    @application.on_event("shutdown")
-    def shutdown_event() -> None:
-        runtime.shutdown()
+    def _start_standby(self) -> None:
+        standby: Future[_InferenceProcess] = Future()
 
-    @application.exception_handler(HTTPException)
-    async def http_exception_handler(_request: Request, exception: HTTPException) -> JSONResponse:
-        detail = exception.detail
-        if isinstance(detail, dict) and isinstance(detail.get("code"), str):
-            payload = error_payload(str(detail["code"]), str(detail.get("message", "Request failed")))
-        else:
-            payload = error_payload("HTTP_ERROR", str(detail))
-        return JSONResponse(status_code=exception.status_code, content=payload)
+        def warm() -> None:
+            try:
+                standby.set_result(self._spawn())
+            except BaseException as error:
+                standby.set_exception(error)
 
-    @application.exception_handler(RequestValidationError)
-    async def validation_exception_handler(_request: Request, _exception: RequestValidationError) -> JSONResponse:
-        return JSONResponse(status_code=422, content=error_payload("INVALID_REQUEST", "The request body is invalid."))
+        self._standby = standby
+        threading.Thread(target=warm, name="coqui-inference-standby", daemon=True).start()
+
+    def tts_to_file(self, *, text: str, file_path: str, speaker: str | None = None) -> None:
+        with self._lock:
+            if self._closed:
+                raise InferenceProcessError("Inference process is shut down")
+            self._recycle_if_due(self._active)
+            worker = self._active
+            try:
+                worker.connection.send((text, file_path, speaker))
+                finished = worker.connection.poll(self._config.inference_hard_timeout_seconds)
+                reply = worker.connection.recv() if finished else None
+            except (EOFError, OSError) as error:
+                if self._closed:
+                    raise InferenceProcessError("Inference process is shut down") from error
+                LOGGER.error("Inference process exited unexpectedly; respawning")
+                self._replace(worker)
+                raise InferenceProcessError("Inference process exited unexpectedly") from error
+            if reply is None:
+                LOGGER.warning(
+                    "Killing inference process after the %.1fs hard deadline",
+                    self._config.inference_hard_timeout_seconds,
+                )
+                with self._stats_lock:
+                    self._kills += 1
+                self._replace(worker)
+                raise InferenceKilledError("Inference exceeded the hard deadline and was killed")
+            worker.jobs += 1
+            self._recycle_if_due(worker)
+        status, detail = reply
+        if status != "ok":
+            raise RuntimeError(detail)
+
+    def profile(self, seconds: float, interval: float, label: str) -> Counter[str]:
+        with self._profile_lock:
+            if self._closed:
+                raise InferenceProcessError("Inference process is shut down")
+            worker = self._active
+            self._profile_requests += 1
+            request_id = self._profile_requests
+            deadline = time.monotonic() + seconds + PROFILE_REPLY_GRACE_SECONDS
+            try:
+                worker.profiler.send((request_id, label, seconds, interval))
+                while True:
+                    # Replies to earlier requests that timed out are still in the pipe.
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not worker.profiler.poll(remaining):
+                        raise InferenceProcessError("Inference process did not return a profile")
+                    reply_id, stacks = worker.profiler.recv()
+                    if reply_id == request_id:
+                        return Counter(stacks)
+            except (EOFError, OSError) as error:
+                raise InferenceProcessError("Inference process exited while profiling") from error
+
+    def _recycle_reason(self, worker: _InferenceProcess) -> tuple[str | None, int | None]:
+        rss_bytes = worker.rss_bytes()
+        if self._config.inference_recycle_after_jobs and worker.jobs >= self._config.inference_recycle_after_jobs:
+            return "jobs", rss_bytes
+        if self._config.inference_recycle_rss_bytes and (rss_bytes or 0) >= self._config.inference_recycle_rss_bytes:
+            return "rss", rss_bytes
+        return None, rss_bytes
+
+    def _recycle_if_due(self, worker: _InferenceProcess) -> None:
+        reason, rss_bytes = self._recycle_reason(worker)
+        if reason is None:
+            return
+        standby = self._standby
+        if standby is None:
+            self._start_standby()
+            return
+        if not standby.done():
+            return
+        self._standby = None
+        try:
+            replacement = standby.result()
+        except Exception:
+            LOGGER.exception("Replacement inference process failed to start")
+            return
+        self._active = replacement
+        worker.retire()
+        if self._config.inference_standby:
+            self._start_standby()
+        with self._stats_lock:
+            self._recycles += 1
+            self._recycle_events.append(
+                {"reason": reason, "jobs": worker.jobs, "rss_bytes": rss_bytes, "recycled_at": time.time()}
+            )
+        LOGGER.info("Recycled inference process after %d jobs (%s)", worker.jobs, reason)
+
+    def _replace(self, worker: _InferenceProcess) -> None:
+        started = time.monotonic()
+        worker.kill()
+        standby, self._standby = self._standby, None
+        replacement: _InferenceProcess | None = None
+        if standby is not None:
+            try:
+                replacement = standby.result()
+            except Exception:
+                LOGGER.exception("Standby inference process failed to start")
+        if replacement is None:
+            replacement = self._spawn()
+        self._active = replacement
+        if self._config.inference_standby:
+            self._start_standby()
+        recovery_seconds = time.monotonic() - started
+        with self._stats_lock:
+            self._respawns += 1
+            self._last_recovery_seconds = recovery_seconds
+        LOGGER.warning("Inference process respawned in %.3fs", recovery_seconds)
+
+    def stats(self) -> InferenceProcessStats:
+        worker = self._active
+        with self._stats_lock:
+            return InferenceProcessStats(
+                kills=self._kills,
+                respawns=self._respawns,
+                last_recovery_seconds=self._last_recovery_seconds,
+                recycles=self._recycles,
+                jobs=worker.jobs,
+                rss_bytes=worker.rss_bytes(),
+            )
+
+    def recycle_events(self) -> list[dict[str, object]]:
+        with self._stats_lock:
+            return list(self._recycle_events)
+
+    def close(self) -> None:
+        self._closed = True
+        standby, self._standby = self._standby, None
+        if standby is not None:
+            standby.add_done_callback(_kill_when_ready)
+        self._active.kill()
+
+
+_SENTENCE_CLOSERS = "\"')]}\u201d\u2019"
+_SENTENCE_BOUNDARY = re.compile(r"[.!?\u2026]+[\"')\]}\u201d\u2019]*\s+")
+_CONTINUE_ABBREVIATIONS = frozenset(
+    {"mr.", "mrs.", "ms.", "dr.", "prof.", "rev.", "hon.", "st.", "vs.", "e.g.", "i.e."}
+)
+
+
+def segment_sentences(text: str) -> list[str]:
+    sentences: list[str] = []
+    start = 0
+    for match in _SENTENCE_BOUNDARY.finditer(text):
+        candidate = text[start : match.end()].strip()
+        last_word = candidate.rsplit(None, 1)[-1].rstrip(_SENTENCE_CLOSERS).lower()
+        if last_word in _CONTINUE_ABBREVIATIONS or re.fullmatch(r"[a-z]\.", last_word):
+            continue
+        sentences.append(" ".join(candidate.split()))
+        start = match.end()
+    tail = text[start:].strip()
+    if tail:
+        sentences.append(" ".join(tail.split()))
+    return sentences
+
+
+def load_prewarm_corpus(path: str) -> list[str]:
+    sentences: list[str] = []
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            sentences.extend(segment_sentences(line))
+    return _deduplicate_strings(sentences)
+
+
+def _split_long_sentence(sentence: str, max_chars: int) -> list[str]:
+    pieces: list[str] = []
+    current = ""
+    for word in sentence.split():
+        while len(word) > max_chars:
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(word[:max_chars])
+            word = word[max_chars:]
+        if not word:
+            continue
+        candidate = f"{current} {word}" if current else word
+        if len(candidate) > max_chars:
+            pieces.append(current)
+            current = word
+        else:
+            current = candidate
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def pack_chunks(text: str, target_chars: int, max_chars: int) -> list[str]:
+    chunks: list[str] = []
+    for paragraph in re.split(r"\n\s*\n", text):
+        current = ""
+        for sentence in segment_sentences(paragraph):
+            for piece in _split_long_sentence(sentence, max_chars):
+                candidate = f"{current} {piece}" if current else piece
+                if current and len(candidate) > target_chars:
+                    chunks.append(current)
+                    current = piece
+                else:
+                    current = candidate
+        if current:
+            chunks.append(current)
+    return chunks
+
+
+def read_pcm_wav(audio: bytes) -> tuple[tuple[int, int, int], bytes]:
+    with wave.open(io.BytesIO(audio), "rb") as reader:
+        audio_format = (reader.getnchannels(), reader.getsampwidth(), reader.getframerate())
+        return audio_format, reader.readframes(reader.getnframes())
+
+
+def write_pcm_wav(audio_format: tuple[int, int, int], frames: bytes) -> bytes:
+    channels, sample_width, frame_rate = audio_format
+    output = io.BytesIO()
+    with wave.open(output, "wb") as writer:
+        writer.setnchannels(channels)
+        writer.setsampwidth(sample_width)
+        writer.setframerate(frame_rate)
+        writer.writeframes(frames)
+    return output.getvalue()
+
+
+def stitch_wav(segments: list[bytes], silence_ms: int) -> bytes:
+    if not segments:
+        raise ValueError("No sentence audio to stitch")
+    if len(segments) == 1:
+        return segments[0]
+    decoded = [read_pcm_wav(segment) for segment in segments]
+    audio_format = decoded[0][0]
+    if any(current != audio_format for current, _frames in decoded):
+        raise ValueError("Sentence audio formats do not match")
+    channels, sample_width, frame_rate = audio_format
+    silence_frames = frame_rate * silence_ms // 1000
+    silence = (b"\x80" if sample_width == 1 else b"\x00") * (silence_frames * channels * sample_width)
+    return write_pcm_wav(audio_format, silence.join(frames for _format, frames in decoded))
+
+
+def streamed_wav(segments: Iterable[bytes], silence_ms: int) -> Iterator[bytes]:
+    audio_format: tuple[int, int, int] | None = None
+    silence = b""
+    for segment in segments:
+        current, frames = read_pcm_wav(segment)
+        if audio_format is None:
+            audio_format = current
+            channels, sample_width, frame_rate = current
+            silence_frames = frame_rate * silence_ms // 1000
+            silence = (b"\x80" if sample_width == 1 else b"\x00") * (silence_frames * channels * sample_width)
+            # The total length is unknown until the last segment, so the RIFF
+            # and data sizes use the conventional streaming placeholder.
+            header = bytearray(write_pcm_wav(current, b""))
+            header[4:8] = header[-4:] = b"\xff\xff\xff\xff"
+            yield bytes(header)
+        elif current != audio_format:
+            raise ValueError("Segment audio formats do not match")
+        else:
+            yield silence
+        yield frames
+
+
+# Sample width -> (NumPy dtype, zero offset, full scale) for PCM WAV frames.
+_PCM_SAMPLE_TYPES = {1: ("u1", 128.0, 128.0), 2: ("<i2", 0.0, 32768.0), 4: ("<i4", 0.0, 2147483648.0)}
+
+
+def trim_silence(samples: np.ndarray, frame_rate: int, pad_ms: int) -> np.ndarray:
+    import numpy as np
+
+    amplitude = np.abs(samples).max(axis=1) if samples.size else np.zeros(0)
+    loud = np.flatnonzero(amplitude > 10 ** (TRIM_THRESHOLD_DBFS / 20))
+    if loud.size == 0:
+        return samples
+    pad = frame_rate * pad_ms // 1000
+    return samples[max(0, int(loud[0]) - pad) : int(loud[-1]) + 1 + pad]
+
+
+def normalize_loudness(samples: np.ndarray, target_dbfs: float) -> np.ndarray:
+    import numpy as np
+
+    if samples.size == 0:
+        return samples
+    rms = float(np.sqrt(np.mean(np.square(samples))))
+    peak = float(np.abs(samples).max())
+    if rms <= 0 or peak <= 0:
+        return samples
+    gain = min(10 ** (target_dbfs / 20) / rms, 10 ** (PEAK_CEILING_DBFS / 20) / peak)
+    return samples * gain
+
+
+def time_stretch(samples: np.ndarray, rate: float, frame_rate: int) -> np.ndarray:
+    import numpy as np
+
+    # WSOLA: frame k is read near k * hop * rate and written at k * hop, but its
+    # read position is shifted within the tolerance to the offset that best
+    # correlates with the natural continuation of the previous frame. Frames
+    # then overlap in phase, so pitch periods are neither smeared nor doubled.
+    window_size = max(64, frame_rate * TEMPO_WINDOW_MS // 1000 // 2 * 2)
+    hop = window_size // 2
+    tolerance = max(1, frame_rate * TEMPO_TOLERANCE_MS // 1000)
+    padded = np.pad(samples, ((tolerance, window_size + tolerance), (0, 0)))
+    mono = padded.mean(axis=1)
+    count = max(1, int((samples.shape[0] - window_size) / (hop * rate)) + 1)
+    window = np.hanning(window_size)
+    length = (count - 1) * hop + window_size
+    output = np.zeros((length, samples.shape[1]))
+    weights = np.zeros(length)
+    previous = 0
+    for index in range(count):
+        start = int(round(index * hop * rate))
+        if index:
+            continuation = mono[previous + hop + tolerance:previous + hop + tolerance + window_size]
+            candidates = mono[start:start + window_size + 2 * tolerance]
+            start += int(np.argmax(np.correlate(candidates, continuation, mode="valid"))) - tolerance
+        position = index * hop
+        frame = padded[start + tolerance:start + tolerance + window_size]
+        output[position:position + window_size] += frame * window[:, None]
+        weights[position:position + window_size] += window
+        previous = start
+    return output / np.maximum(weights, 1e-3)[:, None]
+
+
+class AudioPostProcessor:
+    def __init__(self, enabled: bool, trim_pad_ms: int, loudness_target_dbfs: float) -> None:
+        self.enabled = enabled
+        self._trim_pad_ms = trim_pad_ms
+        self._loudness_target_dbfs = loudness_target_dbfs
+        self._lock = threading.Lock()
+        self._stages: dict[str, dict[str, float | int]] = {}
+
+    def applies(self, rate: float | None) -> bool:
+        return self.enabled or (rate is not None and rate != 1.0)
+
+    def process(self, audio: bytes, rate: float | None = None) -> bytes:
+        if not self.applies(rate):
+            return audio
+        import numpy as np
+
+        audio_format, frames = read_pcm_wav(audio)
+        channels, sample_width, frame_rate = audio_format
+        sample_type = _PCM_SAMPLE_TYPES.get(sample_width)
+        if sample_type is None or not frames:
+            return audio
+        dtype, offset, scale = sample_type
+        started = time.monotonic()
+        samples = (np.frombuffer(frames, dtype=dtype).astype(np.float64) - offset).reshape(-1, channels) / scale
+        self._record("decode", time.monotonic() - started)
+        stages: list[tuple[str, Callable[[np.ndarray], np.ndarray]]] = []
+        if self.enabled:
+            stages.append(("trim", lambda current: trim_silence(current, frame_rate, self._trim_pad_ms)))
+            stages.append(("loudness", lambda current: normalize_loudness(current, self._loudness_target_dbfs)))
+        if rate is not None and rate != 1.0:
+            stages.append(("tempo", lambda current: time_stretch(current, rate, frame_rate)))
+        for name, stage in stages:
+            started = time.monotonic()
+            samples = stage(samples)
+            self._record(name, time.monotonic() - started)
+        started = time.monotonic()
+        encoded = np.clip(np.round(samples * scale + offset), offset - scale, offset + scale - 1).astype(dtype)
+        output = write_pcm_wav(audio_format, encoded.tobytes())
+        self._record("encode", time.monotonic() - started)
+        return output
+
+    def _record(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            stats = self._stages.setdefault(stage, {"runs": 0, "total_seconds": 0.0, "max_seconds": 0.0})
+            stats["runs"] += 1
+            stats["total_seconds"] += seconds
+            stats["max_seconds"] = max(stats["max_seconds"], seconds)
+
+    def snapshot(self) -> dict[str, dict[str, float | int]]:
+        with self._lock:
+            return {stage: dict(stats) for stage, stats in self._stages.items()}
+
+
+CacheKey = tuple[str, str | None, str]
+
+
+class AudioCache:
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[CacheKey, bytes] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: CacheKey) -> bytes | None:
+        with self._lock:
+            audio = self._entries.get(key)
+            if audio is not None:
+                self._entries.move_to_end(key)
+            return audio
+
+    def put(self, key: CacheKey, audio: bytes) -> None:
+        if len(audio) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = audio
+            self._size += len(audio)
+            while self._size > self.max_bytes:
+                _evicted_key, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def contains(self, key: CacheKey) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def discard_model(self, model_id: str) -> int:
+        with self._lock:
+            stale = [key for key in self._entries if key[0] == model_id]
+            for key in stale:
+                self._size -= len(self._entries.pop(key))
+            return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def usage(self) -> tuple[int, int]:
+        with self._lock:
+            return len(self._entries), self._size
+
+
+LatencyKey = tuple[str, str | None]
+
+
+@dataclass
+class _LinearFit:
+    weight: float = 0.0
+    sum_x: float = 0.0
+    sum_y: float = 0.0
+    sum_xx: float = 0.0
+    sum_xy: float = 0.0
+    observations: int = 0
+
+    def observe(self, x: float, y: float, decay: float) -> None:
+        self.weight = self.weight * decay + 1.0
+        self.sum_x = self.sum_x * decay + x
+        self.sum_y = self.sum_y * decay + y
+        self.sum_xx = self.sum_xx * decay + x * x
+        self.sum_xy = self.sum_xy * decay + x * y
+        self.observations += 1
+
+    def coefficients(self) -> tuple[float, float]:
+        mean_x = self.sum_x / self.weight
+        mean_y = self.sum_y / self.weight
+        variance = self.sum_xx / self.weight - mean_x * mean_x
+        slope = (self.sum_xy / self.weight - mean_x * mean_y) / variance if variance > 1e-9 else 0.0
+        if slope <= 0:
+            return 0.0, mean_y / mean_x
+        intercept = mean_y - slope * mean_x
+        if intercept < 0:
+            return 0.0, mean_y / mean_x
+        return intercept, slope
+
+
+class LatencyModel:
+    def __init__(self, prior_seconds_per_char: float, decay: float = 0.95) -> None:
+        self._prior_seconds_per_char = prior_seconds_per_char
+        self._decay = decay
+        self._fits: dict[LatencyKey, _LinearFit] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, key: LatencyKey, characters: int, seconds: float) -> None:
+        if characters <= 0 or not math.isfinite(seconds) or seconds < 0:
+            return
+        with self._lock:
+            self._fits.setdefault(key, _LinearFit()).observe(float(characters), seconds, self._decay)
+
+    def coefficients(self, key: LatencyKey) -> tuple[float, float]:
+        with self._lock:
+            fit = self._fits.get(key)
+            if fit is None:
+                return 0.0, self._prior_seconds_per_char
+            return fit.coefficients()
+
+    def observations(self, key: LatencyKey) -> int:
+        with self._lock:
+            fit = self._fits.get(key)
+            return 0 if fit is None else fit.observations
+
+    def characters_within(self, key: LatencyKey, seconds: float) -> int:
+        intercept, slope = self.coefficients(key)
+        if slope <= 0:
+            return sys.maxsize
+        return math.floor(max(0.0, seconds - intercept) / slope)
+
+    def estimate(self, key: LatencyKey, characters: int) -> float:
+        if characters <= 0:
+            return 0.0
+        intercept, slope = self.coefficients(key)
+        return intercept + slope * characters
+
+    def snapshot(self) -> dict[str, dict[str, float | int]]:
+        with self._lock:
+            fits = {key: (fit.coefficients(), fit.observations) for key, fit in self._fits.items()}
+        return {
+            f"{model}:{voice or 'default'}": {
+                "intercept_seconds": intercept,
+                "seconds_per_char": slope,
+                "observations": observations,
+            }
+            for (model, voice), ((intercept, slope), observations) in sorted(
+                fits.items(), key=lambda item: (item[0][0], item[0][1] or "")
+            )
+        }
+
+
+@dataclass(frozen=True)
+class VoiceProfile:
+    name: str
+    language: str | None
+    sample_rate: int | None
+    observations: int
+    real_time_factor: float | None
+    p95_seconds: float | None
+
+
+class VoicePerformance:
+    def __init__(self, window: int = VOICE_SAMPLE_WINDOW) -> None:
+        self._window = window
+        self._samples: dict[LatencyKey, deque[tuple[float, float | None]]] = {}
+        self._sample_rates: dict[LatencyKey, int] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, key: LatencyKey, seconds: float, audio: bytes) -> None:
+        if not math.isfinite(seconds) or seconds < 0:
+            return
+        try:
+            with wave.open(io.BytesIO(audio), "rb") as reader:
+                sample_rate = reader.getframerate()
+                audio_seconds: float | None = reader.getnframes() / sample_rate if sample_rate else None
+        except (wave.Error, EOFError):
+            sample_rate, audio_seconds = 0, None
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self._window)
+            samples.append((seconds, audio_seconds or None))
+            if sample_rate:
+                self._sample_rates[key] = sample_rate
+
+    def profile(self, key: LatencyKey, name: str, language: str | None) -> VoiceProfile:
+        with self._lock:
+            samples = list(self._samples.get(key, ()))
+            sample_rate = self._sample_rates.get(key)
+        timed = [(seconds, audio_seconds) for seconds, audio_seconds in samples if audio_seconds]
+        real_time_factor = (
+            sum(seconds for seconds, _audio in timed) / sum(audio for _seconds, audio in timed) if timed else None
+        )
+        latencies = sorted(seconds for seconds, _audio in samples)
+        p95 = latencies[max(0, math.ceil(0.95 * len(latencies)) - 1)] if latencies else None
+        return VoiceProfile(name, language, sample_rate, len(samples), real_time_factor, p95)
+
+
+@dataclass(frozen=True)
+class ChunkRecommendation:
+    model: str
+    voice: str | None
+    target_chars: int
+    max_chars: int
+    target_first_audio_seconds: float
+    intercept_seconds: float
+    seconds_per_char: float
+    observations: int
+    measured: bool
+
+
+@dataclass
+class _RetainedResult:
+    future: Future[str]
+    output_path: str
+    expires_at: float | None = None
+
+
+@dataclass(frozen=True)
+class RuntimeMetrics:
+    queue_capacity: int
+    slots_in_use: int
+    queue_work_seconds: float
+    queued_work_seconds: float
+    service_rate: float
+    estimated_wait_seconds: float
+    deadline_rejections: int
+    active_inference: int
+    queued_futures: int
+    timed_out_running: int
+    retained_results: int
+    retained_result_hits: int
+    tracked_temp_files: int
+    cleanup_failures: int
+    audio_cache_entries: int
+    audio_cache_bytes: int
+    request_cache_hits: int
+    request_cache_misses: int
+    sentence_cache_hits: int
+    sentence_cache_misses: int
+    inference_isolation: str = "thread"
+    inference_kills: int = 0
+    inference_respawns: int = 0
+    inference_last_recovery_seconds: float | None = None
+    inference_recycles: int = 0
+    inference_jobs: int = 0
+    inference_rss_bytes: int | None = None
+    process_rss_bytes: int | None = None
+    spool_bytes: int = 0
+    spool_max_bytes: int = 0
+    spool_rejections: int = 0
+    spool_swept_files: int = 0
+    client_rejections: int = 0
+    trace_records: int = 0
+    trace_dropped: int = 0
+    config_changes: int = 0
+    long_text_requests: int = 0
+    long_text_segments: int = 0
+
+    @property
+    def accepting_requests(self) -> bool:
+        return self.slots_in_use < self.queue_capacity and self.queued_work_seconds < self.queue_work_seconds
+
+    @property
+    def request_cache_hit_rate(self) -> float:
+        lookups = self.request_cache_hits + self.request_cache_misses
+        return self.request_cache_hits / lookups if lookups else 0.0
+
+    @property
+    def sentence_cache_hit_rate(self) -> float:
+        lookups = self.sentence_cache_hits + self.sentence_cache_misses
+        return self.sentence_cache_hits / lookups if lookups else 0.0
+
+
+@dataclass(frozen=True)
+class RuntimeLiveness:
+    alive: bool
+    reason: str | None
+    heartbeat_age_seconds: float
+    active_job_seconds: float | None
+    progress_age_seconds: float | None
+    stall_limit_seconds: float | None
+    oldest_queued_seconds: float
+
+
+@dataclass
+class LoadedModel:
+    model_id: str
+    backend: TTSBackend
+    voices: tuple[str, ...]
+    load_seconds: float
+    memory_bytes: int
+    generation: str = ""
+    hits: int = 0
+    in_flight: int = 0
+    retired: bool = False
+    voice_index: frozenset[str] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Voice validation runs on every request; the tuple keeps catalog order.
+        self.voice_index = frozenset(self.voices)
+
+
+def _close_backend(backend: TTSBackend) -> None:
+    if isinstance(backend, IsolatedBackend):
+        backend.close()
+
+
+def _warm_up(model: LoadedModel, spool_dir: str | None) -> None:
+    descriptor, path = tempfile.mkstemp(suffix=".wav", prefix="chrome-readit-warmup-", dir=spool_dir)
+    os.close(descriptor)
+    try:
+        if model.voices:
+            model.backend.tts_to_file(text=MODEL_WARMUP_TEXT, file_path=path, speaker=model.voices[0])
+        else:
+            model.backend.tts_to_file(text=MODEL_WARMUP_TEXT, file_path=path)
+        if Path(path).stat().st_size <= 0:
+            raise RuntimeError("Warm-up synthesis produced an empty audio file")
+    finally:
+        Path(path).unlink(missing_ok=True)
+
+
+class ModelRegistry:
+    def __init__(self, config: ServiceConfig, model_loader: ModelLoader) -> None:
+        self._config = config
+        self._model_loader = model_loader
+        self._allowed = set(config.available_models) | {config.model_name}
+        self._default = config.model_name
+        self._models: OrderedDict[str, LoadedModel] = OrderedDict()
+        self._lock = threading.Lock()
+        self._load_locks: dict[str, threading.Lock] = {}
+        self._loads: dict[str, int] = {}
+        self._generations: dict[str, str] = {}
+        self._evictions: dict[str, int] = {}
+        self._hits: dict[str, int] = {}
+        self._closed = False
+
+    @property
+    def default_model(self) -> str:
+        return self._default
+
+    def _selected(self, model_id: str | None) -> str:
+        selected = model_id.strip() if isinstance(model_id, str) and model_id.strip() else self._default
+        if selected not in self._allowed:
+            raise InvalidModelError(f"Model '{selected}' is not available")
+        return selected
+
+    def get(self, model_id: str | None = None, checkout: bool = False) -> LoadedModel:
+        # With checkout=True the model is counted in flight before the lock is
+        # released, so neither eviction nor a reload can close its backend
+        # between the lookup and its use. Callers must release() it.
+        selected = self._selected(model_id)
+        with self._lock:
+            if self._closed:
+                raise BackendNotReadyError("TTS backend is not ready")
+            loaded = self._models.get(selected)
+            if loaded is not None:
+                self._models.move_to_end(selected)
+                if checkout:
+                    self._checkout_locked(loaded)
+                return loaded
+            load_lock = self._load_locks.setdefault(selected, threading.Lock())
+        with load_lock:
+            with self._lock:
+                loaded = self._models.get(selected)
+                if loaded is not None:
+                    if checkout:
+                        self._checkout_locked(loaded)
+                    return loaded
+            # Reloading an evicted model reads the same weights, so it keeps its
+            # generation; only reload() and a restart start a new one.
+            loaded = self._load(selected, self._generations.get(selected))
+            with self._lock:
+                self._models[selected] = loaded
+                self._generations[selected] = loaded.generation
+                self._loads[selected] = self._loads.get(selected, 0) + 1
+                if checkout:
+                    self._checkout_locked(loaded)
+                evicted = self._evict_locked(keep=selected)
+        for model in evicted:
+            _close_backend(model.backend)
+        return loaded
+
+    def _load(self, model_id: str, generation: str | None = None) -> LoadedModel:
+        model_config = replace(self._config, model_name=model_id)
+        started = time.monotonic()
+        rss_before = _process_rss_bytes() or 0
+        if self._config.inference_isolation == "process":
+            backend: TTSBackend = IsolatedBackend(model_config, self._model_loader)
+            # The standby child loads the same model, so it costs as much as the
+            # active one; it is still warming up here, so it cannot be measured.
+            processes = 2 if self._config.inference_standby else 1
+            memory_bytes = (backend.stats().rss_bytes or 0) * processes
+        else:
+            backend = self._model_loader(model_config)
+            memory_bytes = max(0, (_process_rss_bytes() or 0) - rss_before)
+        forced_voices = self._config.forced_voices if model_id == self._config.model_name else ()
+        voices = tuple(discover_voices(backend, forced_voices))
+        load_seconds = time.monotonic() - started
+        LOGGER.info("Loaded model %s in %.1fs (%d bytes)", model_id, load_seconds, memory_bytes)
+        return LoadedModel(model_id, backend, voices, load_seconds, memory_bytes, generation or uuid.uuid4().hex[:12])
+
+    def reload(self, model_id: str, make_default: bool = False) -> LoadedModel:
+        with self._lock:
+            if self._closed:
+                raise BackendNotReadyError("TTS backend is not ready")
+            load_lock = self._load_locks.setdefault(model_id, threading.Lock())
+        with load_lock:
+            replacement = self._load(model_id)
+            try:
+                _warm_up(replacement, self._config.spool_dir or None)
+            except BaseException:
+                _close_backend(replacement.backend)
+                raise
+            with self._lock:
+                if self._closed:
+                    _close_backend(replacement.backend)
+                    raise BackendNotReadyError("TTS backend is not ready")
+                previous = self._models.pop(model_id, None)
+                self._models[model_id] = replacement
+                self._generations[model_id] = replacement.generation
+                self._allowed.add(model_id)
+                if make_default:
+                    self._default = model_id
+                self._loads[model_id] = self._loads.get(model_id, 0) + 1
+                drained: list[LoadedModel] = []
+                if previous is not None:
+                    previous.retired = True
+                    if previous.in_flight == 0:
+                        drained.append(previous)
+                evicted = self._evict_locked(keep=model_id)
+        for model in [*drained, *evicted]:
+            _close_backend(model.backend)
+        return replacement
+
+    def is_current(self, model: LoadedModel) -> bool:
+        with self._lock:
+            return self._models.get(model.model_id) is model
+
+    def _evict_locked(self, keep: str) -> list[LoadedModel]:
+        budget = self._config.model_memory_budget_bytes
+        evicted: list[LoadedModel] = []
+        while budget and sum(model.memory_bytes for model in self._models.values()) > budget:
+            victim = next(
+                (model for model in self._models.values() if model.model_id != keep and model.in_flight == 0),
+                None,
+            )
+            if victim is None:
+                break
+            del self._models[victim.model_id]
+            self._evictions[victim.model_id] = self._evictions.get(victim.model_id, 0) + 1
+            evicted.append(victim)
+            LOGGER.info("Evicted model %s to stay within the memory budget", victim.model_id)
+        return evicted
+
+    def _checkout_locked(self, model: LoadedModel) -> None:
+        model.in_flight += 1
+        model.hits += 1
+        self._hits[model.model_id] = self._hits.get(model.model_id, 0) + 1
+
+    def release(self, model: LoadedModel) -> None:
+        with self._lock:
+            model.in_flight -= 1
+            if model.retired:
+                evicted = [model] if model.in_flight == 0 else []
+            else:
+                evicted = self._evict_locked(keep="") if model.model_id in self._models else []
+        for victim in evicted:
+            _close_backend(victim.backend)
+
+    def loaded(self) -> list[LoadedModel]:
+        with self._lock:
+            return list(self._models.values())
+
+    def snapshot(self) -> dict[str, dict[str, object]]:
+        with self._lock:
+            report: dict[str, dict[str, object]] = {}
+            for model_id in sorted(self._allowed):
+                loaded = self._models.get(model_id)
+                report[model_id] = {
+                    "loaded": loaded is not None,
+                    "load_seconds": None if loaded is None else loaded.load_seconds,
+                    "memory_bytes": None if loaded is None else loaded.memory_bytes,
+                    "in_flight": 0 if loaded is None else loaded.in_flight,
+                    "hits": self._hits.get(model_id, 0),
+                    "loads": self._loads.get(model_id, 0),
+                    "evictions": self._evictions.get(model_id, 0),
+                }
+            return report
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            models = list(self._models.values())
+            self._models.clear()
+        for model in models:
+            _close_backend(model.backend)
+
+
+@dataclass
+class _PrewarmProgress:
+    state: str = "disabled"
+    sentences: int = 0
+    warmed: int = 0
+    already_cached: int = 0
+    failed: int = 0
+    yielded: int = 0
+    started_at: float | None = None
+    finished_at: float | None = None
+    error: str | None = None
+
+
+@dataclass
+class _ClientState:
+    tokens: float
+    refilled_at: float
+    slots: int = 0
+    submitted: int = 0
+    rate_limited: int = 0
+    slot_rejections: int = 0
+
+
+@dataclass
+class _PendingJob:
+    client_id: str
+    output_path: str
+    future: Future[str]
+    model: LoadedModel
+    text: str
+    voice: str | None
+    cost: float
+    rate: float | None = None
+    deadline_seconds: float | None = None
+    arrived_at: float = field(default_factory=time.time)
+    enqueued_at: float = field(default_factory=time.monotonic)
+    started_at: float | None = None
+    inference_seconds: float | None = None
+
+
+class ClientScheduler:
+    def __init__(self, rate_per_second: float, burst: int, max_slots: int, max_clients: int = 1024) -> None:
+        self._rate = rate_per_second
+        self._burst = float(max(1, burst))
+        self._max_slots = max_slots
+        self._max_clients = max_clients
+        self._lock = threading.Lock()
+        self._clients: OrderedDict[str, _ClientState] = OrderedDict()
+        # Clients with pending work, in round-robin order: the head is served
+        # next and moves to the tail, so one client's backlog cannot delay
+        # another client's next request by more than one job per client.
+        self._pending: OrderedDict[str, deque[_PendingJob]] = OrderedDict()
+
+    def _state_locked(self, client_id: str, now: float) -> _ClientState:
+        state = self._clients.get(client_id)
+        if state is not None:
+            self._clients.move_to_end(client_id)
+            return state
+        while len(self._clients) >= self._max_clients:
+            idle = next((known for known, candidate in self._clients.items() if candidate.slots == 0), None)
+            if idle is None:
+                break
+            del self._clients[idle]
+        state = _ClientState(tokens=self._burst, refilled_at=now)
+        self._clients[client_id] = state
+        return state
+
+    def admit(self, client_id: str) -> None:
+        now = time.monotonic()
+        with self._lock:
+            state = self._state_locked(client_id, now)
+            if self._max_slots and state.slots >= self._max_slots:
+                state.slot_rejections += 1
+                raise ClientLimitError("Client has too many synthesis requests in flight", "CLIENT_QUEUE_FULL")
+            if self._rate > 0:
+                state.tokens = min(self._burst, state.tokens + (now - state.refilled_at) * self._rate)
+                state.refilled_at = now
+                if state.tokens < 1:
+                    state.rate_limited += 1
+                    raise ClientLimitError(
+                        "Client request rate exceeded",
+                        "RATE_LIMITED",
+                        (1 - state.tokens) / self._rate,
+                    )
+                state.tokens -= 1
+            state.slots += 1
+            state.submitted += 1
+
+    def release(self, client_id: str) -> None:
+        with self._lock:
+            state = self._clients.get(client_id)
+            if state is not None and state.slots > 0:
+                state.slots -= 1
+
+    def push(self, job: _PendingJob) -> None:
+        with self._lock:
+            self._pending.setdefault(job.client_id, deque()).append(job)
+
+    def pop(self) -> _PendingJob | None:
+        with self._lock:
+            if not self._pending:
+                return None
+            client_id, queue = self._pending.popitem(last=False)
+            job = queue.popleft()
+            if queue:
+                self._pending[client_id] = queue
+            return job
+
+    def remove(self, client_id: str, output_path: str) -> bool:
+        with self._lock:
+            queue = self._pending.get(client_id)
+            if queue is None:
+                return False
+            for job in queue:
+                if job.output_path == output_path:
+                    queue.remove(job)
+                    if not queue:
+                        del self._pending[client_id]
+                    return True
+            return False
+
+    def drain(self) -> list[_PendingJob]:
+        with self._lock:
+            drained = [job for queue in self._pending.values() for job in queue]
+            self._pending.clear()
+        return drained
+
+    def position(self, output_path: str) -> int | None:
+        with self._lock:
+            queues = [list(queue) for queue in self._pending.values()]
+        position = 0
+        for depth in range(max((len(queue) for queue in queues), default=0)):
+            for queue in queues:
+                if depth >= len(queue):
+                    continue
+                if queue[depth].output_path == output_path:
+                    return position
+                position += 1
+        return None
+
+    def rejections(self) -> int:
+        with self._lock:
+            return sum(state.rate_limited + state.slot_rejections for state in self._clients.values())
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {
+                client_id: {
+                    "queued": len(self._pending.get(client_id, ())),
+                    "in_flight": state.slots,
+                    "submitted": state.submitted,
+                    "rate_limited": state.rate_limited,
+                    "slot_rejections": state.slot_rejections,
+                }
+                for client_id, state in self._clients.items()
+            }
+
+
+class TraceRecorder:
+    def __init__(self, path: str, max_bytes: int) -> None:
+        self.path = path
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._handle: io.TextIOBase | None = None
+        self._size = 0
+        self.records = 0
+        self.dropped = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._handle is not None
+
+    def open(self) -> None:
+        if not self.path:
+            return
+        trace = Path(self.path)
+        trace.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self._handle = trace.open("a", encoding="utf-8")
+            self._size = trace.stat().st_size
+
+    def record(
+        self,
+        arrived_at: float,
+        outcome: str,
+        text: str,
+        model_id: str,
+        voice: str | None,
+        **fields: float | bool | None,
+    ) -> None:
+        if self._handle is None:
+            return
+        # Text is reduced to its shape so traces can be shared for capacity
+        # planning without exposing what anybody was reading.
+        entry: dict[str, object] = {
+            "at": round(arrived_at, 3),
+            "chars": len(text),
+            "sentences": len(segment_sentences(text)),
+            "model": model_id,
+            "voice": voice,
+            "outcome": outcome,
+        }
+        for name, value in fields.items():
+            entry[name] = round(value, 4) if isinstance(value, float) else value
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        with self._lock:
+            if self._handle is None:
+                return
+            if self._max_bytes and self._size + len(line) > self._max_bytes:
+                self.dropped += 1
+                return
+            self._handle.write(line)
+            self._handle.flush()
+            self._size += len(line)
+            self.records += 1
+
+    def close(self) -> None:
+        with self._lock:
+            handle, self._handle = self._handle, None
+        if handle is not None:
+            handle.close()
+
+
+def _rejection_outcome(error: OverflowError) -> str:
+    if isinstance(error, ClientLimitError):
+        return error.code.lower()
+    if isinstance(error, SpoolFullError):
+        return "spool_full"
+    if isinstance(error, DeadlineUnreachableError):
+        return "deadline_unreachable"
+    return "queue_full"
+
+
+class SynthesisRuntime:
+    def __init__(self, config: ServiceConfig, model_loader: ModelLoader) -> None:
+        self.config = config
+        self._models = ModelRegistry(config, model_loader)
+        self._reload_lock = threading.Lock()
+        self._reload_status: dict[str, object] = {"state": "idle"}
+        self.spool_dir = config.spool_dir or tempfile.gettempdir()
+        self._spool_rejections = 0
+        self._spool_swept_files = 0
+        self._executor: ThreadPoolExecutor | None = None
+        self._postprocessor = AudioPostProcessor(config.postprocess, config.trim_pad_ms, config.loudness_target_dbfs)
+        self._output_signature = f"silence={config.sentence_silence_ms}"
+        if config.postprocess:
+            self._output_signature += f";trim={config.trim_pad_ms};loudness={config.loudness_target_dbfs:g}"
+        self._postprocess_executor: ThreadPoolExecutor | None = None
+        self._readahead_executor: ThreadPoolExecutor | None = None
+        self._trace = TraceRecorder(config.trace_path, config.trace_max_bytes)
+        self._prewarm = _PrewarmProgress()
+        self._prewarm_keys: list[CacheKey] = []
+        self._prewarm_stop = threading.Event()
+        self._scheduler = ClientScheduler(config.client_rate_per_second, config.client_burst, config.client_max_slots)
+        self._metrics_lock = threading.Lock()
+        self._slots_in_use = 0
+        self._config_changes: deque[dict[str, object]] = deque(maxlen=MAX_CONFIG_CHANGE_EVENTS)
+        self._config_change_count = 0
+        self._long_text_requests = 0
+        self._long_text_segments = 0
+        self._queued_work_seconds = 0.0
+        self._service_rate = 1.0
+        self._active_jobs: dict[str, tuple[float, float]] = {}
+        self._deadline_rejections = 0
+        self._active_inference = 0
+        self._queued_futures = 0
+        self._submission_sequence = 0
+        self._queued_order: dict[str, tuple[int, float]] = {}
+        self._job_progress: dict[str, float] = {}
+        self._heartbeat = time.monotonic()
+        self._timed_out_futures: set[Future[str]] = set()
+        self._retained_results: dict[str, _RetainedResult] = {}
+        self._retained_result_hits = 0
+        self._audio_identities: OrderedDict[str, tuple[str, str, str | None, str, float | None]] = OrderedDict()
+        self._temp_paths: set[str] = set()
+        self._active_paths: set[str] = set()
+        self._cleanup_failures: dict[str, int] = {}
+        self._temp_paths_lock = threading.Lock()
+        self._audio_cache = AudioCache(config.audio_cache_max_bytes)
+        self._latency_model = LatencyModel(config.cost_seconds_per_char)
+        self._voice_performance = VoicePerformance()
+        self._request_cache_hits = 0
+        self._request_cache_misses = 0
+        self._sentence_cache_hits = 0
+        self._sentence_cache_misses = 0
+        self._startup: dict[str, object] = {}
+        self.ready = False
+
+    def startup_profile(self) -> dict[str, object]:
+        return dict(self._startup)
+
+    def start(self) -> None:
+        started = time.perf_counter()
+        self._spool_swept_files = self._sweep_spool()
+        self._models.get()
+        if self.config.postprocess:
+            try:
+                _timed_import("numpy")
+            except ImportError as error:
+                raise RuntimeError("POSTPROCESS requires NumPy") from error
+        self._trace.open()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="coqui-synthesis")
+        self._postprocess_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="coqui-postprocess")
+        self._readahead_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="coqui-readahead")
+        self._heartbeat = time.monotonic()
+        self.ready = True
+        self._startup = _measure_startup(time.perf_counter() - started)
+        LOGGER.info("Service ready: %s", self._startup)
+        if self.config.prewarm_corpus_path:
+            self._prewarm_stop.clear()
+            threading.Thread(target=self._prewarm_cache, name="coqui-prewarm", daemon=True).start()
+
+    def shutdown(self) -> None:
+        self.ready = False
+        self._prewarm_stop.set()
+        executor = self._executor
+        self._executor = None
+        if executor is not None:
+            # In-process Coqui inference cannot be force-cancelled safely. This
+            # returns promptly, cancels work that has not started, and leaves
+            # active paths tracked until their worker callback actually exits.
+            # With process isolation the child is killed below, which fails the
+            # active job instead of letting it run on.
+            executor.shutdown(wait=False, cancel_futures=True)
+        postprocess_executor = self._postprocess_executor
+        self._postprocess_executor = None
+        if postprocess_executor is not None:
+            # Post-processing is short; letting it finish resolves its jobs.
+            postprocess_executor.shutdown(wait=False)
+        readahead_executor = self._readahead_executor
+        self._readahead_executor = None
+        if readahead_executor is not None:
+            readahead_executor.shutdown(wait=False, cancel_futures=True)
+        for pending in self._scheduler.drain():
+            pending.future.cancel()
+        self._trace.close()
+        self._models.close()
+        with self._metrics_lock:
+            self._retained_results.clear()
+        with self._temp_paths_lock:
+            retryable_paths = list(self._temp_paths - self._active_paths)
+        for path in retryable_paths:
+            self.cleanup_path(path)
+        self._audio_cache.clear()
+
+    def schedule_readahead(self, refill: Callable[[], None]) -> None:
+        # Refills submit new work, which can load a model or stat the spool, so
+        # they must not run on the inference or post-processing thread that
+        # completed the previous chunk.
+        executor = self._readahead_executor
+        if executor is None:
+            return
+        try:
+            executor.submit(refill)
+        except RuntimeError:
+            pass
+
+    def _orphan_min_age_seconds(self) -> float:
+        # The shared temp dir may hold live output of other instances on this
+        # host, so only files older than any job there can still need are
+        # orphans: queued work, a hard-killed run, then the longest retention.
+        if self.config.spool_dir:
+            return 0.0
+        config = self.config
+        retention = max(config.timed_out_result_ttl_seconds, config.job_result_ttl_seconds)
+        return config.queue_work_seconds + config.inference_hard_timeout_seconds + retention
+
+    def _sweep_spool(self) -> int:
+        spool = Path(self.spool_dir)
+        spool.mkdir(parents=True, exist_ok=True)
+        with self._temp_paths_lock:
+            tracked = set(self._temp_paths)
+        min_age = self._orphan_min_age_seconds()
+        now = time.time()
+        swept = 0
+        for candidate in spool.glob("chrome-readit-*.wav"):
+            if str(candidate) in tracked:
+                continue
+            try:
+                if min_age and now - candidate.stat().st_mtime < min_age:
+                    continue
+                candidate.unlink()
+            except OSError:
+                LOGGER.warning("Could not remove orphaned spool file %s", candidate)
+            else:
+                swept += 1
+        if swept:
+            LOGGER.info("Removed %d orphaned spool files from %s", swept, spool)
+        return swept
+
+    def clients(self) -> dict[str, dict[str, int]]:
+        return self._scheduler.snapshot()
+
+    def spool_usage_bytes(self) -> int:
+        with self._temp_paths_lock:
+            paths = list(self._temp_paths)
+        usage = 0
+        for path in paths:
+            try:
+                usage += os.stat(path).st_size
+            except OSError:
+                continue
+        return usage
+
+    def _check_spool(self) -> None:
+        limit = self.config.spool_max_bytes
+        if limit and self.spool_usage_bytes() >= limit:
+            with self._metrics_lock:
+                self._spool_rejections += 1
+            raise SpoolFullError("Audio spool is full")
+
+    def voices(self, model: str | None = None) -> list[str]:
+        return list(self._models.get(model).voices)
+
+    def voice_catalog(self, model: str | None = None) -> tuple[str, list[VoiceProfile]]:
+        loaded = self._models.get(model)
+        language = model_language(loaded.model_id)
+        return loaded.model_id, [
+            self._voice_performance.profile((loaded.model_id, voice), voice, language) for voice in loaded.voices
+        ]
+
+    def model_profile(self) -> dict[str, dict[str, object]]:
+        return self._models.snapshot()
+
+    def default_model(self) -> str:
+        return self._models.default_model
+
+    def reload_model(self, model_id: str | None, make_default: bool = False) -> dict[str, object]:
+        if not self.ready:
+            raise BackendNotReadyError("TTS backend is not ready")
+        target = model_id.strip() if isinstance(model_id, str) and model_id.strip() else self.default_model()
+        with self._reload_lock:
+            if self._reload_status["state"] == "loading":
+                raise ReloadInProgressError("A model reload is already running")
+            self._reload_status = {
+                "state": "loading",
+                "model": target,
+                "make_default": make_default,
+                "started_at": time.time(),
+                "finished_at": None,
+                "load_seconds": None,
+                "error": None,
+            }
+        threading.Thread(
+            target=self._run_reload,
+            args=(target, make_default),
+            name="coqui-model-reload",
+            daemon=True,
+        ).start()
+        return self.reload_status()
+
+    def _run_reload(self, model_id: str, make_default: bool) -> None:
+        try:
+            loaded = self._models.reload(model_id, make_default)
+        except Exception as error:
+            LOGGER.exception("Model reload failed")
+            outcome: dict[str, object] = {"state": "failed", "error": f"{type(error).__name__}: {error}"}
+        else:
+            self._audio_cache.discard_model(model_id)
+            outcome = {"state": "completed", "load_seconds": loaded.load_seconds}
+        with self._reload_lock:
+            self._reload_status = {**self._reload_status, **outcome, "finished_at": time.time()}
+
+    def reload_status(self) -> dict[str, object]:
+        with self._reload_lock:
+            return dict(self._reload_status)
+
+    def _isolated_backends(self) -> list[tuple[str, IsolatedBackend]]:
+        return [
+            (model.model_id, model.backend)
+            for model in self._models.loaded()
+            if isinstance(model.backend, IsolatedBackend)
+        ]
+
+    def inference_profilers(self) -> dict[str, Callable[[float, float, str], Counter[str]]]:
+        return {f"coqui-inference[{model_id}]": backend.profile for model_id, backend in self._isolated_backends()}
+
+    def metrics(self) -> RuntimeMetrics:
+        cache_entries, cache_bytes = self._audio_cache.usage()
+        isolated = [backend.stats() for _model_id, backend in self._isolated_backends()]
+        recoveries = [stats.last_recovery_seconds for stats in isolated if stats.last_recovery_seconds is not None]
+        process_rss = _process_rss_bytes()
+        spool_bytes = self.spool_usage_bytes()
+        with self._metrics_lock, self._temp_paths_lock:
+            return RuntimeMetrics(
+                queue_capacity=self.config.queue_capacity,
+                slots_in_use=self._slots_in_use,
+                queue_work_seconds=self.config.queue_work_seconds,
+                queued_work_seconds=self._queued_work_seconds,
+                service_rate=self._service_rate,
+                estimated_wait_seconds=self._predicted_wait_locked(time.monotonic()),
+                deadline_rejections=self._deadline_rejections,
+                active_inference=self._active_inference,
+                queued_futures=self._queued_futures,
+                timed_out_running=len(self._timed_out_futures),
+                retained_results=len(self._retained_results),
+                retained_result_hits=self._retained_result_hits,
+                tracked_temp_files=len(self._temp_paths),
+                cleanup_failures=sum(self._cleanup_failures.values()),
+                audio_cache_entries=cache_entries,
+                audio_cache_bytes=cache_bytes,
+                request_cache_hits=self._request_cache_hits,
+                request_cache_misses=self._request_cache_misses,
+                sentence_cache_hits=self._sentence_cache_hits,
+                sentence_cache_misses=self._sentence_cache_misses,
+                inference_isolation=self.config.inference_isolation,
+                inference_kills=sum(stats.kills for stats in isolated),
+                inference_respawns=sum(stats.respawns for stats in isolated),
+                inference_last_recovery_seconds=max(recoveries, default=None),
+                inference_recycles=sum(stats.recycles for stats in isolated),
+                inference_jobs=sum(stats.jobs for stats in isolated),
+                inference_rss_bytes=(
+                    sum(stats.rss_bytes or 0 for stats in isolated) if isolated else process_rss
+                ),
+                process_rss_bytes=process_rss,
+                spool_bytes=spool_bytes,
+                spool_max_bytes=self.config.spool_max_bytes,
+                spool_rejections=self._spool_rejections,
+                spool_swept_files=self._spool_swept_files,
+                client_rejections=self._scheduler.rejections(),
+                trace_records=self._trace.records,
+                trace_dropped=self._trace.dropped,
+                config_changes=self._config_change_count,
+                long_text_requests=self._long_text_requests,
+                long_text_segments=self._long_text_segments,
+            )
+
+    def settings(self) -> dict[str, object]:
+        config = self.config
+        return {name: getattr(config, name) for name in TUNABLE_SETTINGS}
+
+    def update_settings(self, changes: dict[str, object]) -> dict[str, object]:
+        with self._metrics_lock:
+            previous = self.config
+            self.config = replace(previous, **changes)
+            changed = {
+                name: {"from": getattr(previous, name), "to": value}
+                for name, value in changes.items()
+                if getattr(previous, name) != value
+            }
+            if changed:
+                self._config_change_count += 1
+                self._config_changes.append({"at": time.time(), "changes": changed})
+                LOGGER.info("Runtime settings changed: %s", changed)
+        return self.settings()
+
+    def record_long_text(self, segments: int) -> None:
+        with self._metrics_lock:
+            self._long_text_requests += 1
+            self._long_text_segments += segments
+
+    def config_change_events(self) -> list[dict[str, object]]:
+        with self._metrics_lock:
+            return list(self._config_changes)
+
+    def latency_profile(self) -> dict[str, dict[str, float | int]]:
+        return self._latency_model.snapshot()
+
+    def chunk_recommendation(self, model: str | None = None, voice: str | None = None) -> ChunkRecommendation:
+        loaded = self._models.get(model)
+        selected_voice = self._resolve_voice(loaded, voice)
+        key = (loaded.model_id, selected_voice)
+        target_seconds = self.config.target_first_audio_seconds
+        limit = self.config.max_text_chars
+        # Sizes are what one chunk can synthesize within the time budget on
+        # this host, so slow hosts get small chunks and fast hosts large ones.
+        target = self._latency_model.characters_within(key, target_seconds)
+        target = min(limit, max(min(MIN_RECOMMENDED_CHUNK_CHARS, limit), target))
+        maximum = self._latency_model.characters_within(key, target_seconds * MAX_CHUNK_TIME_FACTOR)
+        maximum = min(limit, max(target, maximum))
+        intercept, slope = self._latency_model.coefficients(key)
+        observations = self._latency_model.observations(key)
+        return ChunkRecommendation(
+            model=loaded.model_id,
+            voice=selected_voice,
+            target_chars=target,
+            max_chars=maximum,
+            target_first_audio_seconds=target_seconds,
+            intercept_seconds=intercept,
+            seconds_per_char=slope,
+            observations=observations,
+            measured=observations >= MIN_MEASURED_OBSERVATIONS,
+        )
+
+    def structure_sizes(self) -> dict[str, int]:
+        cache_entries, cache_bytes = self._audio_cache.usage()
+        with self._metrics_lock, self._temp_paths_lock:
+            return {
+                "temp_paths": len(self._temp_paths),
+                "active_paths": len(self._active_paths),
+                "cleanup_failures": len(self._cleanup_failures),
+                "timed_out_futures": len(self._timed_out_futures),
+                "retained_results": len(self._retained_results),
+                "queued_order": len(self._queued_order),
+                "audio_identities": len(self._audio_identities),
+                "active_jobs": len(self._active_jobs),
+                "audio_cache_entries": cache_entries,
+                "audio_cache_bytes": cache_bytes,
+                "latency_model_keys": len(self._latency_model.snapshot()),
+            }
+
+    def recycle_events(self) -> list[dict[str, object]]:
+        return [
+            {**event, "model": model_id}
+            for model_id, backend in self._isolated_backends()
+            for event in backend.recycle_events()
+        ]
+
+    def tracked_temp_paths(self) -> tuple[str, ...]:
+        with self._temp_paths_lock:
+            return tuple(sorted(self._temp_paths))
+
+    def cleanup_failures(self) -> dict[str, int]:
+        with self._temp_paths_lock:
+            return dict(self._cleanup_failures)
+
+    def cleanup_path(self, path: str) -> bool:
+        with self._temp_paths_lock:
+            if path in self._active_paths:
+                return False
+        candidate = Path(path)
+        try:
+            candidate.unlink(missing_ok=True)
+        except OSError:
+            with self._temp_paths_lock:
+                self._temp_paths.add(path)
+                self._cleanup_failures[path] = self._cleanup_failures.get(path, 0) + 1
+            LOGGER.exception("Temporary audio cleanup failed")
+            return False
+
+        with self._temp_paths_lock:
+            self._temp_paths.discard(path)
+            self._cleanup_failures.pop(path, None)
+        return True
+
+    def _resolve_voice(self, model: LoadedModel, voice: str | None) -> str | None:
+        if not model.voices:
+            return None
+        selected = voice.strip() if isinstance(voice, str) and voice.strip() else model.voices[0]
+        if selected not in model.voice_index:
+            raise InvalidVoiceError(f"Voice '{selected}' is not available")
+        return selected
+
+    def _estimate_cost(self, model_id: str, selected_voice: str | None, text: str) -> float:
+        # The latency fit is per sentence, so each uncached sentence pays the
+        # intercept once.
+        return sum(
+            self._latency_model.estimate((model_id, selected_voice), len(sentence))
+            for sentence in segment_sentences(text)
+            if not self._audio_cache.contains(self._cache_key(model_id, selected_voice, sentence))
+        )
+
+    def _predicted_wait_locked(self, now: float) -> float:
+        progressed = sum(
+            min(cost, (now - started) * self._service_rate) for started, cost in self._active_jobs.values()
+        )
+        return max(0.0, self._queued_work_seconds - progressed) / self._service_rate
+
+    def estimated_wait_seconds(self) -> float:
+        with self._metrics_lock:
+            return self._predicted_wait_locked(time.monotonic())
+
+    def _acquire_slot(self, cost: float = 0.0, deadline_seconds: float | None = None) -> None:
+        with self._metrics_lock:
+            # Capacity is compared rather than held in a semaphore so it can be
+            # resized live; a shrink below the slots in use only stops admission
+            # until enough running jobs drain.
+            if self._slots_in_use >= self.config.queue_capacity:
+                raise OverflowError("Synthesis queue is full")
+            # An idle queue always admits one job so a request costlier than the
+            # whole work budget is slow rather than permanently rejected.
+            if self._slots_in_use > 0 and self._queued_work_seconds + cost > self.config.queue_work_seconds:
+                raise OverflowError("Synthesis queue work budget is exhausted")
+            # Unlike the work budget, the deadline also applies to an idle
+            # queue: a request that cannot finish in time on its own would only
+            # fail later with a timeout.
+            if deadline_seconds is not None:
+                predicted = self._predicted_wait_locked(time.monotonic()) + cost / self._service_rate
+                if predicted > deadline_seconds:
+                    self._deadline_rejections += 1
+                    raise DeadlineUnreachableError(
+                        "Synthesis cannot finish within the request deadline",
+                        predicted - deadline_seconds,
+                    )
+            self._slots_in_use += 1
+            self._queued_work_seconds += cost
+
+    def _release_slot(self, future: Future[str] | None = None, cost: float = 0.0) -> None:
+        with self._metrics_lock:
+            if future is not None:
+                self._timed_out_futures.discard(future)
+            if self._slots_in_use <= 0:
+                raise RuntimeError("Synthesis queue accounting became negative")
+            self._slots_in_use -= 1
+            self._queued_work_seconds -= cost
+            if self._slots_in_use == 0 or self._queued_work_seconds < 0:
+                self._queued_work_seconds = 0.0
+
+    def _run_synthesis(
+        self,
+        model: LoadedModel,
+        text: str,
+        selected_voice: str | None,
+        output_path: str,
+        cost: float = 0.0,
+    ) -> str:
+        started = time.monotonic()
+        with self._metrics_lock:
+            if self._queued_futures <= 0:
+                raise RuntimeError("Queued synthesis accounting became negative")
+            self._queued_futures -= 1
+            self._queued_order.pop(output_path, None)
+            self._active_inference += 1
+            self._active_jobs[output_path] = (started, cost)
+            self._job_progress[output_path] = started
+            self._heartbeat = started
+        with self._temp_paths_lock:
+            self._active_paths.add(output_path)
+        try:
+            sentences = segment_sentences(text)
+            segments: list[bytes] = []
+            output_is_final = False
+            for sentence in sentences:
+                key = self._cache_key(model.model_id, selected_voice, sentence)
+                audio = self._audio_cache.get(key)
+                with self._metrics_lock:
+                    if audio is None:
+                        self._sentence_cache_misses += 1
+                    else:
+                        self._sentence_cache_hits += 1
+                output_is_final = audio is None and len(sentences) == 1
+                if audio is None:
+                    sentence_started = time.monotonic()
+                    audio = self._synthesize_sentence(model.backend, sentence, selected_voice, output_path)
+                    elapsed = time.monotonic() - sentence_started
+                    self._latency_model.observe((model.model_id, selected_voice), len(sentence), elapsed)
+                    self._voice_performance.observe((model.model_id, selected_voice), elapsed, audio)
+                    if self._models.is_current(model):
+                        self._audio_cache.put(key, audio)
+                    self._record_progress(output_path)
+                segments.append(audio)
+
+            if not output_is_final:
+                Path(output_path).write_bytes(stitch_wav(segments, self.config.sentence_silence_ms))
+            self._observe_service_rate(cost, time.monotonic() - started)
+            return output_path
+        finally:
+            with self._temp_paths_lock:
+                self._active_paths.discard(output_path)
+            with self._metrics_lock:
+                self._active_jobs.pop(output_path, None)
+                self._job_progress.pop(output_path, None)
+                self._heartbeat = time.monotonic()
+                if self._active_inference <= 0:
+                    raise RuntimeError("Active inference accounting became negative")
+                self._active_inference -= 1
+
+    def _record_progress(self, output_path: str) -> None:
+        now = time.monotonic()
+        with self._metrics_lock:
+            self._heartbeat = now
+            if output_path in self._job_progress:
+                self._job_progress[output_path] = now
+
+    def liveness(self) -> RuntimeLiveness:
+        now = time.monotonic()
+        multiplier = self.config.liveness_stall_multiplier
+        minimum = self.config.liveness_min_stall_seconds
+        with self._metrics_lock:
+            heartbeat_age = now - self._heartbeat
+            active = [
+                (
+                    now - started,
+                    now - self._job_progress.get(output_path, started),
+                    max(minimum, multiplier * cost / self._service_rate),
+                )
+                for output_path, (started, cost) in self._active_jobs.items()
+            ]
+            oldest_queued = max((now - queued_at for _sequence, queued_at in self._queued_order.values()), default=0.0)
+            worker_idle = self._active_inference == 0
+        stalled_job = max(active, key=lambda job: job[1] - job[2], default=None)
+        if stalled_job is not None and stalled_job[1] > stalled_job[2]:
+            reason: str | None = "INFERENCE_STALLED"
+        elif worker_idle and min(oldest_queued, heartbeat_age) > minimum:
+            # A recent heartbeat means the worker just finished a job and is
+            # about to pick up the next one, not that it has stopped draining.
+            reason = "WORKER_NOT_DRAINING"
+        else:
+            reason = None
+        return RuntimeLiveness(
+            alive=reason is None,
+            reason=reason,
+            heartbeat_age_seconds=heartbeat_age,
+            active_job_seconds=None if stalled_job is None else stalled_job[0],
+            progress_age_seconds=None if stalled_job is None else stalled_job[1],
+            stall_limit_seconds=None if stalled_job is None else stalled_job[2],
+            oldest_queued_seconds=oldest_queued,
+        )
+
+    def _observe_service_rate(self, cost: float, elapsed_seconds: float) -> None:
+        if cost <= 0 or elapsed_seconds <= 0:
+            return
+        sample = min(max(cost / elapsed_seconds, 0.05), 20.0)
+        with self._metrics_lock:
+            self._service_rate = 0.8 * self._service_rate + 0.2 * sample
+
+    def _synthesize_sentence(
+        self,
+        backend: TTSBackend,
+        sentence: str,
+        selected_voice: str | None,
+        output_path: str,
+    ) -> bytes:
+        if selected_voice is None:
+            backend.tts_to_file(text=sentence, file_path=output_path)
+        else:
+            backend.tts_to_file(text=sentence, file_path=output_path, speaker=selected_voice)
+
+        output = Path(output_path)
+        if not output.exists() or output.stat().st_size <= 0:
+            raise RuntimeError("TTS backend produced an empty audio file")
+        return output.read_bytes()
+
+    def _cache_key(self, model_id: str, selected_voice: str | None, sentence: str) -> CacheKey:
+        return (model_id, selected_voice, sentence)
+
+    def cached_audio(
+        self,
+        text: str,
+        voice: str | None,
+        model: str | None = None,
+        rate: float | None = None,
+    ) -> bytes | None:
+        if not self.ready:
+            raise BackendNotReadyError("TTS backend is not ready")
+        loaded = self._models.get(model)
+        selected_voice = self._resolve_voice(loaded, voice)
+        sentences = segment_sentences(text)
+        segments: list[bytes] = []
+        for sentence in sentences:
+            audio = self._audio_cache.get(self._cache_key(loaded.model_id, selected_voice, sentence))
+            if audio is None:
+                with self._metrics_lock:
+                    self._request_cache_misses += 1
+                return None
+            segments.append(audio)
+        with self._metrics_lock:
+            self._request_cache_hits += 1
+            self._sentence_cache_hits += len(segments)
+        self._trace.record(time.time(), "cached", text, loaded.model_id, selected_voice)
+        return self._postprocessor.process(stitch_wav(segments, self.config.sentence_silence_ms), rate)
+
+    def _future_completed(
+        self,
+        future: Future[str],
+        output_path: str,
+        cost: float,
+        model: LoadedModel,
+        client_id: str,
+    ) -> None:
+        self._models.release(model)
+        self._scheduler.release(client_id)
+        if future.cancelled():
+            self._scheduler.remove(client_id, output_path)
+            with self._metrics_lock:
+                if self._queued_futures <= 0:
+                    raise RuntimeError("Queued synthesis accounting became negative")
+                self._queued_futures -= 1
+                self._queued_order.pop(output_path, None)
+            self.cleanup_path(output_path)
+        self._release_slot(future, cost)
+
+    def submit(
+        self,
+        text: str,
+        voice: str | None,
+        deadline_seconds: float | None = None,
+        model: str | None = None,
+        client_id: str = DEFAULT_CLIENT_ID,
+        rate: float | None = None,
+    ) -> tuple[Future[str], str]:
+        executor = self._executor
+        if not self.ready or executor is None:
+            raise BackendNotReadyError("TTS backend is not ready")
+
+        arrived_at = time.time()
+        loaded = self._models.get(model, checkout=True)
+        try:
+            selected_voice = self._resolve_voice(loaded, voice)
+            cost = self._estimate_cost(loaded.model_id, selected_voice, text)
+            try:
+                self._check_spool()
+                self._scheduler.admit(client_id)
+                try:
+                    self._acquire_slot(cost, deadline_seconds)
+                except Exception:
+                    self._scheduler.release(client_id)
+                    raise
+            except OverflowError as error:
+                self._trace.record(
+                    arrived_at,
+                    _rejection_outcome(error),
+                    text,
+                    loaded.model_id,
+                    selected_voice,
+                    deadline=deadline_seconds,
+                    cost=cost,
+                )
+                raise
+        except BaseException:
+            self._models.release(loaded)
+            raise
+        output_path: str | None = None
+        descriptor: int | None = None
+        future: Future[str] | None = None
+        try:
+            descriptor, output_path = tempfile.mkstemp(suffix=".wav", prefix="chrome-readit-", dir=self.spool_dir)
+            os.close(descriptor)
+            descriptor = None
+            with self._temp_paths_lock:
+                self._temp_paths.add(output_path)
+            with self._metrics_lock:
+                self._queued_futures += 1
+                self._submission_sequence += 1
+                self._queued_order[output_path] = (self._submission_sequence, time.monotonic())
+            pending = _PendingJob(
+                client_id,
+                output_path,
+                Future(),
+                loaded,
+                text,
+                selected_voice,
+                cost,
+                rate=rate,
+                deadline_seconds=deadline_seconds,
+                arrived_at=arrived_at,
+            )
+            self._scheduler.push(pending)
+            try:
+                executor.submit(self._run_next)
+            except Exception:
+                self._scheduler.remove(client_id, output_path)
+                with self._metrics_lock:
+                    self._queued_futures -= 1
+                    self._queued_order.pop(output_path, None)
+                raise
+            future = pending.future
+            if self._trace.enabled:
+                future.add_done_callback(lambda completed: self._trace_job(completed, pending))
+            future.add_done_callback(
+                lambda completed: self._future_completed(completed, output_path, cost, loaded, client_id)
+            )
+            return future, output_path
+        except Exception:
+            if descriptor is not None:
+                try:
+                    os.close(descriptor)
+                except OSError:
+                    LOGGER.exception("Temporary descriptor cleanup failed")
+            if output_path is not None:
+                self.cleanup_path(output_path)
+            if future is None:
+                self._models.release(loaded)
+                self._scheduler.release(client_id)
+                self._release_slot(cost=cost)
+            raise
+
+    def _run_next(self) -> None:
+        # Each submission enqueues one of these, but the job it runs is picked
+        # round-robin across clients rather than in submission order.
+        while True:
+            pending = self._scheduler.pop()
+            if pending is None:
+                return
+            if pending.future.set_running_or_notify_cancel():
+                break
+        pending.started_at = time.monotonic()
+        try:
+            result = self._run_synthesis(pending.model, pending.text, pending.voice, pending.output_path, pending.cost)
+        except BaseException as error:
+            pending.inference_seconds = time.monotonic() - pending.started_at
+            pending.future.set_exception(error)
+            return
+        pending.inference_seconds = time.monotonic() - pending.started_at
+        if not self._postprocessor.applies(pending.rate):
+            pending.future.set_result(result)
+            return
+        postprocess_executor = self._postprocess_executor
+        if postprocess_executor is not None:
+            # Handing the file to another thread frees the inference worker to
+            # start the next job while this one is trimmed and normalized.
+            try:
+                postprocess_executor.submit(self._finish_postprocess, pending.future, result, pending.rate)
+                return
+            except RuntimeError:
+                pass
+        self._finish_postprocess(pending.future, result, pending.rate)
+
+    def _finish_postprocess(self, future: Future[str], output_path: str, rate: float | None) -> None:
+        try:
+            output = Path(output_path)
+            output.write_bytes(self._postprocessor.process(output.read_bytes(), rate))
+        except BaseException as error:
+            future.set_exception(error)
+        else:
+            future.set_result(output_path)
+
+    def _trace_job(self, future: Future[str], pending: _PendingJob) -> None:
+        if future.cancelled():
+            outcome = "cancelled"
+        elif future.exception() is not None:
+            outcome = "failed"
+        else:
+            outcome = "completed"
+        with self._metrics_lock:
+            timed_out = future in self._timed_out_futures
+        started_at = pending.started_at
+        self._trace.record(
+            pending.arrived_at,
+            outcome,
+            pending.text,
+            pending.model.model_id,
+            pending.voice,
+            deadline=pending.deadline_seconds,
+            cost=pending.cost,
+            queue_wait=None if started_at is None else started_at - pending.enqueued_at,
+            inference=pending.inference_seconds,
+            total=time.monotonic() - pending.enqueued_at,
+            timed_out=timed_out,
+        )
+
+    def postprocess_profile(self) -> dict[str, dict[str, float | int]]:
+        return self._postprocessor.snapshot()
+
+    def _prewarm_cache(self) -> None:
+        progress = self._prewarm
+        try:
+            sentences = load_prewarm_corpus(self.config.prewarm_corpus_path)
+            loaded = self._models.get()
+            voices = {self._resolve_voice(loaded, voice): None for voice in self.config.prewarm_voices or (None,)}
+        except Exception as error:
+            LOGGER.exception("Cache pre-warming could not start")
+            with self._metrics_lock:
+                progress.state = "failed"
+                progress.error = f"{type(error).__name__}: {error}"
+            return
+        keys = [self._cache_key(loaded.model_id, voice, sentence) for voice in voices for sentence in sentences]
+        with self._metrics_lock:
+            self._prewarm_keys = keys
+            progress.state = "running"
+            progress.sentences = len(keys)
+            progress.started_at = time.time()
+        for key in keys:
+            if self._audio_cache.contains(key):
+                with self._metrics_lock:
+                    progress.already_cached += 1
+                continue
+            outcome = self._prewarm_sentence(key)
+            if outcome is None:
+                with self._metrics_lock:
+                    progress.state = "stopped"
+                return
+            with self._metrics_lock:
+                if outcome:
+                    progress.warmed += 1
+                else:
+                    progress.failed += 1
+        with self._metrics_lock:
+            progress.state = "completed"
+            progress.finished_at = time.time()
+        LOGGER.info("Cache pre-warming finished: %d synthesized, %d failed", progress.warmed, progress.failed)
+
+    def _prewarm_sentence(self, key: CacheKey) -> bool | None:
+        # Pre-warming only runs while no request holds a slot, and yields again
+        # if one arrived while this sentence waited for the worker, so real
+        # traffic waits at most for a single sentence already being synthesized.
+        while not self._prewarm_stop.is_set():
+            with self._metrics_lock:
+                idle = self._slots_in_use == 0
+            if not idle:
+                self._prewarm_stop.wait(PREWARM_IDLE_POLL_SECONDS)
+                continue
+            executor = self._executor
+            if executor is None:
+                return None
+            try:
+                warmed = executor.submit(self._run_prewarm, key).result()
+            except Exception:
+                if self._prewarm_stop.is_set():
+                    return None
+                LOGGER.warning("Cache pre-warming failed for one sentence", exc_info=True)
+                return False
+            if warmed is not None:
+                return warmed
+            with self._metrics_lock:
+                self._prewarm.yielded += 1
+        return None
+
+    def _run_prewarm(self, key: CacheKey) -> bool | None:
+        model_id, selected_voice, sentence = key
+        cost = self._latency_model.estimate((model_id, selected_voice), len(sentence))
+        with self._metrics_lock:
+            if self._slots_in_use > 0:
+                return None
+        model = self._models.get(model_id, checkout=True)
+        try:
+            descriptor, output_path = tempfile.mkstemp(suffix=".wav", prefix="chrome-readit-", dir=self.spool_dir)
+        except BaseException:
+            self._models.release(model)
+            raise
+        os.close(descriptor)
+        with self._temp_paths_lock:
+            self._temp_paths.add(output_path)
+        # A prewarm sentence holds the only inference worker, so it is
+        # accounted like a running job: liveness can see it stall, and its
+        # remaining work counts toward the predicted wait of new requests.
+        started = time.monotonic()
+        with self._metrics_lock:
+            self._active_inference += 1
+            self._active_jobs[output_path] = (started, cost)
+            self._job_progress[output_path] = started
+            self._queued_work_seconds += cost
+            self._heartbeat = started
+        try:
+            audio = self._synthesize_sentence(model.backend, sentence, selected_voice, output_path)
+            elapsed = time.monotonic() - started
+            self._latency_model.observe((model_id, selected_voice), len(sentence), elapsed)
+            self._voice_performance.observe((model_id, selected_voice), elapsed, audio)
+            self._observe_service_rate(cost, elapsed)
+            if self._models.is_current(model):
+                self._audio_cache.put(key, audio)
+        finally:
+            self._models.release(model)
+            self.cleanup_path(output_path)
+            with self._metrics_lock:
+                self._active_jobs.pop(output_path, None)
+                self._job_progress.pop(output_path, None)
+                self._queued_work_seconds = max(0.0, self._queued_work_seconds - cost)
+                self._heartbeat = time.monotonic()
+                if self._active_inference <= 0:
+                    raise RuntimeError("Active inference accounting became negative")
+                self._active_inference -= 1
+        return True
+
+    def prewarm_status(self) -> dict[str, object]:
+        with self._metrics_lock:
+            status = asdict(self._prewarm)
+            keys = list(self._prewarm_keys)
+        cached = sum(1 for key in keys if self._audio_cache.contains(key))
+        status["coverage"] = cached / len(keys) if keys else 0.0
+        return status
+
+    def validate_voice(self, voice: str | None, model: str | None = None) -> str | None:
+        return self._resolve_voice(self._models.get(model), voice)
+
+    def queue_position(self, output_path: str) -> int | None:
+        return self._scheduler.position(output_path)
+
+    def is_running(self, output_path: str) -> bool:
+        with self._metrics_lock:
+            return output_path in self._active_jobs
+
+    def mark_timed_out(self, future: Future[str]) -> None:
+        with self._metrics_lock:
+            if not future.done():
+                self._timed_out_futures.add(future)
+
+    def result_key(
+        self,
+        text: str,
+        voice: str | None,
+        model: str | None = None,
+        rate: float | None = None,
+    ) -> str:
+        loaded = self._models.get(model)
+        selected_voice = self._resolve_voice(loaded, voice)
+        # The model generation and output settings are part of the identity, so
+        # a reload or a restart with different post-processing changes the key.
+        parts = [
+            loaded.model_id,
+            loaded.generation,
+            self._output_signature,
+            selected_voice or "",
+            " ".join(text.split()),
+        ]
+        if rate is not None and rate != 1.0:
+            parts.append(f"rate={rate:g}")
+        identity = "\0".join(parts)
+        key = hashlib.sha256(identity.encode("utf-8")).hexdigest()[:32]
+        with self._metrics_lock:
+            self._audio_identities[key] = (loaded.model_id, loaded.generation, selected_voice, text, rate)
+            self._audio_identities.move_to_end(key)
+            while len(self._audio_identities) > MAX_AUDIO_IDENTITIES:
+                self._audio_identities.popitem(last=False)
+        return key
+
+    def has_audio_identity(self, key: str) -> bool:
+        with self._metrics_lock:
+            return key in self._audio_identities
+
+    def addressed_audio(self, key: str) -> bytes | None:
+        with self._metrics_lock:
+            identity = self._audio_identities.get(key)
+        if identity is None:
+            return None
+        model_id, generation, voice, text, rate = identity
+        try:
+            if self._models.get(model_id).generation != generation:
+                return None
+            return self.cached_audio(text, voice, model_id, rate)
+        except (InvalidModelError, InvalidVoiceError):
+            return None
+
+    def retain_result(self, key: str, future: Future[str], output_path: str) -> None:
+        self.sweep_retained_results()
+        with self._metrics_lock:
+            existing = self._retained_results.get(key)
+            duplicate = existing is not None and existing.future is not future
+            if not duplicate:
+                self._retained_results[key] = _RetainedResult(future, output_path)
+        if duplicate:
+            # An identical timed-out request is already retained, so nobody can
+            # claim this output: drop it if still queued, else delete it once done.
+            if not future.cancel():
+                future.add_done_callback(lambda _completed: self.cleanup_path(output_path))
+            return
+        future.add_done_callback(lambda completed: self._retained_result_completed(key, completed))
+
+    def _retained_result_completed(self, key: str, future: Future[str]) -> None:
+        with self._metrics_lock:
+            entry = self._retained_results.get(key)
+            if entry is None or entry.future is not future:
+                return
+            failed = future.cancelled() or future.exception() is not None
+            if failed:
+                del self._retained_results[key]
+            else:
+                entry.expires_at = time.monotonic() + self.config.timed_out_result_ttl_seconds
+        if failed:
+            self.cleanup_path(entry.output_path)
+
+    def claim_result(self, key: str, *, completed_only: bool = False) -> tuple[Future[str], str] | None:
+        self.sweep_retained_results()
+        with self._metrics_lock:
+            entry = self._retained_results.get(key)
+            if entry is None or (completed_only and not entry.future.done()):
+                return None
+            del self._retained_results[key]
+            self._retained_result_hits += 1
+        return entry.future, entry.output_path
+
+    def has_retained_result(self, key: str) -> bool:
+        with self._metrics_lock:
+            return key in self._retained_results
+
+    def sweep_retained_results(self) -> None:
+        now = time.monotonic()
+        with self._metrics_lock:
+            expired = [
+                key
+                for key, entry in self._retained_results.items()
+                if entry.expires_at is not None and entry.expires_at <= now
+            ]
+            paths = [self._retained_results.pop(key).output_path for key in expired]
+        for path in paths:
+            self.cleanup_path(path)
+
+
+@dataclass
+class SynthesisJob:
+    job_id: str
+    future: Future[str] | None
+    output_path: str | None
+    audio: bytes | None = None
+    completed_at: float | None = None
+
+
+class JobRegistry:
+    def __init__(self, runtime: SynthesisRuntime, ttl_seconds: float, max_jobs: int) -> None:
+        self._runtime = runtime
+        self._ttl_seconds = ttl_seconds
+        self._max_jobs = max_jobs
+        self._jobs: OrderedDict[str, SynthesisJob] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add_completed(self, audio: bytes) -> SynthesisJob:
+        job = SynthesisJob(uuid.uuid4().hex, None, None, audio=audio, completed_at=time.monotonic())
+        self._store(job)
+        return job
+
+    def add(self, future: Future[str], output_path: str) -> SynthesisJob:
+        job = SynthesisJob(uuid.uuid4().hex, future, output_path)
+        self._store(job)
+        future.add_done_callback(lambda completed: self._completed(job, completed))
+        return job
+
+    def _store(self, job: SynthesisJob) -> None:
+        self.sweep()
+        evicted: list[SynthesisJob] = []
+        with self._lock:
+            self._jobs[job.job_id] = job
+            for candidate in list(self._jobs.values()):
+                if len(self._jobs) <= self._max_jobs:
+                    break
+                if candidate.completed_at is not None:
+                    evicted.append(self._jobs.pop(candidate.job_id))
+        self._discard(evicted)
+
+    def _completed(self, job: SynthesisJob, future: Future[str]) -> None:
+        with self._lock:
+            job.completed_at = time.monotonic()
+        if job.output_path is not None and (future.cancelled() or future.exception() is not None):
+            self._runtime.cleanup_path(job.output_path)
+
+    def get(self, job_id: str) -> SynthesisJob | None:
+        self.sweep()
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def sweep(self) -> None:
+        cutoff = time.monotonic() - self._ttl_seconds
+        with self._lock:
+            expired = [
+                job for job in self._jobs.values() if job.completed_at is not None and job.completed_at <= cutoff
+            ]
+            for job in expired:
+                del self._jobs[job.job_id]
+        self._discard(expired)
+
+    def clear(self) -> None:
+        with self._lock:
+            jobs = list(self._jobs.values())
+            self._jobs.clear()
+        self._discard(jobs)
+
+    def _discard(self, jobs: list[SynthesisJob]) -> None:
+        for job in jobs:
+            if job.output_path is not None and job.future is not None and job.future.done():
+                self._runtime.cleanup_path(job.output_path)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._jobs)
+
+
+@dataclass
+class _SessionChunk:
+    text: str
+    future: Future[str] | None = None
+    output_path: str | None = None
+    audio: bytes | None = None
+
+    def state(self, runtime: SynthesisRuntime) -> str:
+        if self.audio is not None:
+            return "ready"
+        if self.future is None:
+            return "pending"
+        if not self.future.done():
+            return "running" if self.output_path is not None and runtime.is_running(self.output_path) else "queued"
+        if self.future.cancelled() or self.future.exception() is not None:
+            return "failed"
+        return "ready"
+
+
+class ReadingSession:
+    def __init__(
+        self,
+        runtime: SynthesisRuntime,
+        chunks: list[str],
+        voice: str | None,
+        lookahead_chunks: int,
+        model: str | None = None,
+        client_id: str = DEFAULT_CLIENT_ID,
+    ) -> None:
+        self.session_id = uuid.uuid4().hex
+        self.voice = voice
+        self.model = model
+        self.client_id = client_id
+        self.lookahead_chunks = lookahead_chunks
+        self.position = 0
+        self.paused = False
+        self.last_access = time.monotonic()
+        self._runtime = runtime
+        self._chunks = [_SessionChunk(text) for text in chunks]
+        self._lock = threading.RLock()
+        self._closed = False
+
+    @property
+    def chunk_count(self) -> int:
+        return len(self._chunks)
+
+    def chunk_texts(self) -> list[str]:
+        return [chunk.text for chunk in self._chunks]
+
+    def seek(self, index: int, paused: bool | None = None) -> None:
+        with self._lock:
+            self.last_access = time.monotonic()
+            self.position = index
+            if paused is not None:
+                self.paused = paused
+            window_end = index + self.lookahead_chunks
+            for chunk_index, chunk in enumerate(self._chunks):
+                if chunk_index < index - 1 or chunk_index > window_end:
+                    self._release(chunk)
+            self.fill()
+
+    def fill(self) -> None:
+        with self._lock:
+            if self._closed or self.paused:
+                return
+            window_end = min(self.position + self.lookahead_chunks, len(self._chunks) - 1)
+            for chunk_index in range(self.position, window_end + 1):
+                chunk = self._chunks[chunk_index]
+                # Failed chunks are only retried by an explicit fetch so a
+                # persistently failing input cannot loop through read-ahead.
+                if chunk.state(self._runtime) != "pending":
+                    continue
+                try:
+                    self._schedule(chunk)
+                except (OverflowError, BackendNotReadyError):
+                    return
+                except Exception:
+                    LOGGER.exception("Session read-ahead submission failed")
+                    return
+
+    def request(self, index: int) -> _SessionChunk:
+        with self._lock:
+            self.seek(index)
+            chunk = self._chunks[index]
+            if chunk.state(self._runtime) in {"pending", "failed"}:
+                self._schedule(chunk)
+            return chunk
+
+    def _schedule(self, chunk: _SessionChunk) -> None:
+        self._release(chunk)
+        cached = self._runtime.cached_audio(chunk.text, self.voice, self.model)
+        if cached is not None:
+            chunk.audio = cached
+            return
+        future, output_path = self._runtime.submit(
+            chunk.text, self.voice, model=self.model, client_id=self.client_id
+        )
+        chunk.future = future
+        chunk.output_path = output_path
+        future.add_done_callback(lambda _completed: self._runtime.schedule_readahead(self.fill))
+
+    def _release(self, chunk: _SessionChunk) -> None:
+        future = chunk.future
+        output_path = chunk.output_path
+        if future is not None and not future.done() and not future.cancel():
+            return
+        chunk.future = None
+        chunk.output_path = None
+        chunk.audio = None
+        if output_path is not None and future is not None and future.done():
+            self._runtime.cleanup_path(output_path)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            for chunk in self._chunks:
+                future = chunk.future
+                if future is not None and not future.done() and not future.cancel():
+                    path = chunk.output_path
+                    if path is not None:
+                        future.add_done_callback(lambda _completed, path=path: self._runtime.cleanup_path(path))
+                    continue
+                self._release(chunk)
+
+    def status(self) -> dict[str, object]:
+        with self._lock:
+            states = [chunk.state(self._runtime) for chunk in self._chunks]
+            return {
+                "ok": True,
+                "session_id": self.session_id,
+                "chunk_count": len(self._chunks),
+                "position": self.position,
+                "paused": self.paused,
+                "lookahead_chunks": self.lookahead_chunks,
+                "chunk_states": states,
+            }
+
+
+class LongTextSynthesis:
+    def __init__(
+        self,
+        runtime: SynthesisRuntime,
+        segments: list[str],
+        voice: str | None,
+        model: str | None,
+        rate: float | None,
+        client_id: str,
+    ) -> None:
+        self._runtime = runtime
+        self._segments = segments
+        self._voice = voice
+        self._model = model
+        self._rate = rate
+        self._client_id = client_id
+        self._scheduled: deque[tuple[Future[str] | None, str | None, bytes | None]] = deque()
+        self._next = 0
+
+    @property
+    def segment_count(self) -> int:
+        return len(self._segments)
+
+    def start(self) -> None:
+        # The first segment is submitted before any response is sent, so a
+        # full queue or an invalid voice still maps to an ordinary HTTP error.
+        self._fill(required=True)
+
+    def audio(self) -> Iterator[bytes]:
+        try:
+            for _index in range(len(self._segments)):
+                if not self._scheduled:
+                    self._fill(required=True)
+                future, output_path, audio = self._scheduled.popleft()
+                if audio is None and future is not None and output_path is not None:
+                    try:
+                        completed_path = future.result(timeout=self._runtime.config.synthesis_timeout_seconds)
+                        audio = Path(completed_path).read_bytes()
+                    finally:
+                        if future.done():
+                            self._runtime.cleanup_path(output_path)
+                self._fill(required=False)
+                yield audio or b""
+        finally:
+            self.close()
+
+    def _fill(self, required: bool) -> None:
+        # Keeping a few segments queued lets the next one start the moment the
+        # worker is free, while the round-robin scheduler still interleaves
+        # other clients between them.
+        waited_until = time.monotonic() + self._runtime.config.synthesis_timeout_seconds
+        window = self._runtime.config.long_text_max_in_flight
+        while self._next < len(self._segments) and len(self._scheduled) < window:
+            text = self._segments[self._next]
+            cached = self._runtime.cached_audio(text, self._voice, self._model, self._rate)
+            if cached is not None:
+                self._scheduled.append((None, None, cached))
+                self._next += 1
+                continue
+            try:
+                future, output_path = self._runtime.submit(
+                    text, self._voice, model=self._model, client_id=self._client_id, rate=self._rate
+                )
+            except OverflowError as error:
+                if self._scheduled or not required:
+                    return
+                delay = LONG_TEXT_RETRY_SECONDS
+                if isinstance(error, ClientLimitError) and error.retry_after_seconds is not None:
+                    delay = max(delay, error.retry_after_seconds)
+                if self._next == 0 or time.monotonic() + delay > waited_until:
+                    raise
+                time.sleep(delay)
+                continue
+            self._scheduled.append((future, output_path, None))
+            self._next += 1
+
+    def close(self) -> None:
+        while self._scheduled:
+            future, output_path, _audio = self._scheduled.popleft()
+            if future is None or output_path is None:
+                continue
+            if future.done() or future.cancel():
+                self._runtime.cleanup_path(output_path)
+            else:
+                future.add_done_callback(lambda _completed, path=output_path: self._runtime.cleanup_path(path))
+
+
+class SessionRegistry:
+    def __init__(self, idle_ttl_seconds: float, max_sessions: int) -> None:
+        self._idle_ttl_seconds = idle_ttl_seconds
+        self._max_sessions = max_sessions
+        self._sessions: OrderedDict[str, ReadingSession] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, session: ReadingSession) -> None:
+        self.sweep()
+        with self._lock:
+            self._sessions[session.session_id] = session
+            evicted = []
+            while len(self._sessions) > self._max_sessions:
+                evicted.append(self._sessions.popitem(last=False)[1])
+        for stale in evicted:
+            stale.close()
+
+    def get(self, session_id: str) -> ReadingSession | None:
+        self.sweep()
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                self._sessions.move_to_end(session_id)
+            return session
+
+    def remove(self, session_id: str) -> bool:
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+        if session is None:
+            return False
+        session.close()
+        return True
+
+    def sweep(self) -> None:
+        cutoff = time.monotonic() - self._idle_ttl_seconds
+        with self._lock:
+            expired = [session for session in self._sessions.values() if session.last_access <= cutoff]
+            for session in expired:
+                del self._sessions[session.session_id]
+        for session in expired:
+            session.close()
+
+    def clear(self) -> None:
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+
+@dataclass
+class _StreamItem:
+    item_id: str
+    text: str
+    voice: str | None
+    model: str | None
+    priority: int
+    sequence: int
+    cancelled: bool = False
+
+
+class StreamChannel:
+    def __init__(
+        self,
+        websocket: WebSocket,
+        runtime: SynthesisRuntime,
+        config: ServiceConfig,
+        client_id: str = DEFAULT_CLIENT_ID,
+    ) -> None:
+        self._websocket = websocket
+        self._runtime = runtime
+        self._config = config
+        self._client_id = client_id
+        self._pending: list[_StreamItem] = []
+        self._in_flight: dict[str, tuple[Future[str], str, asyncio.Task[None]]] = {}
+        self._held: list[tuple[str, bytes]] = []
+        self._paused = False
+        self._closed = False
+        self._sequence = 0
+        self._dispatching: _StreamItem | None = None
+        self._dispatcher: asyncio.Task[None] | None = None
+        self._send_lock = asyncio.Lock()
+
+    async def run(self) -> None:
+        try:
+            while True:
+                message = await self._websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    return
+                raw = message.get("text")
+                if raw is None:
+                    await self._error(None, "INVALID_REQUEST", "Messages must be JSON text frames.")
+                    continue
+                try:
+                    command = StreamCommand.model_validate_json(raw)
+                except ValidationError:
+                    await self._error(None, "INVALID_REQUEST", "The message is invalid.")
+                    continue
+                await self._handle(command)
+        finally:
+            self._close()
+
+    async def _handle(self, command: StreamCommand) -> None:
+        if command.type == "synthesize":
+            await self._accept(command)
+        elif command.type == "pause":
+            self._paused = True
+            await self._send_json({"type": "paused"})
+        elif command.type == "resume":
+            self._paused = False
+            held, self._held = self._held, []
+            await self._send_json({"type": "resumed"})
+            for item_id, audio in held:
+                await self._deliver(item_id, audio)
+        elif command.type == "cancel":
+            await self._cancel(set(command.ids) if command.ids is not None else None)
+        elif command.type == "seek":
+            await self._cancel(None)
+            await self._send_json({"type": "seeked"})
+        else:
+            for item in self._pending:
+                if item.item_id == command.id:
+                    item.priority = command.priority
+                    await self._send_json({"type": "priority", "id": item.item_id, "priority": item.priority})
+                    break
+            else:
+                await self._error(command.id, "NOT_PENDING", "Only chunks waiting for dispatch can be reprioritized.")
+        self._schedule_dispatch()
+
+    async def _accept(self, command: StreamCommand) -> None:
+        item_id = command.id
+        text = (command.text or "").strip()
+        if not item_id:
+            await self._error(None, "INVALID_REQUEST", "Synthesize messages require an id.")
+            return
+        if item_id in self._in_flight or any(item.item_id == item_id for item in self._pending):
+            await self._error(item_id, "DUPLICATE_ID", "A chunk with this id is already pending.")
+            return
+        if not text:
+            await self._error(item_id, "EMPTY_TEXT", "Text must not be empty.")
+            return
+        limit = self._runtime.config.max_text_chars
+        if len(text) > limit:
+            await self._error(item_id, "TEXT_TOO_LONG", f"Text exceeds the {limit}-character limit.")
+            return
+        try:
+            await asyncio.to_thread(self._runtime.validate_voice, command.voice, command.model)
+        except InvalidModelError as error:
+            await self._error(item_id, "INVALID_MODEL", str(error))
+            return
+        except InvalidVoiceError as error:
+            await self._error(item_id, "INVALID_VOICE", str(error))
+            return
+        if len(self._pending) >= self._config.stream_max_pending:
+            await self._error(item_id, "QUEUE_FULL", "The stream has too many pending chunks.")
+            return
+        self._sequence += 1
+        self._pending.append(
+            _StreamItem(item_id, text, command.voice, command.model, command.priority, self._sequence)
+        )
+        await self._send_json({"type": "accepted", "id": item_id, "pending": len(self._pending)})
+
+    def _schedule_dispatch(self) -> None:
+        # Lookups and submissions may load a model or touch the spool, so one
+        # background task dispatches while the receive loop keeps handling
+        # control frames. A running dispatcher re-checks the pending list and
+        # the in-flight limit before every item, so it picks up new work itself.
+        if self._closed or (self._dispatcher is not None and not self._dispatcher.done()):
+            return
+        self._dispatcher = asyncio.create_task(self._dispatch())
+
+    async def _dispatch(self) -> None:
+        while not self._paused and self._pending and len(self._in_flight) < self._config.stream_max_in_flight:
+            item = min(self._pending, key=lambda candidate: (-candidate.priority, candidate.sequence))
+            self._pending.remove(item)
+            self._dispatching = item
+            try:
+                dispatched = await self._dispatch_item(item)
+            finally:
+                self._dispatching = None
+            if not dispatched:
+                return
+
+    async def _dispatch_item(self, item: _StreamItem) -> bool:
+        try:
+            cached = await asyncio.to_thread(self._runtime.cached_audio, item.text, item.voice, item.model)
+            if cached is not None:
+                if not item.cancelled:
+                    await self._deliver(item.item_id, cached)
+                return True
+            submission = asyncio.ensure_future(
+                asyncio.to_thread(
+                    self._runtime.submit, item.text, item.voice, model=item.model, client_id=self._client_id
+                )
+            )
+            try:
+                future, output_path = await asyncio.shield(submission)
+            except asyncio.CancelledError:
+                # The submitting thread cannot be interrupted, so whatever it
+                # queues after the stream closes is dropped when it returns.
+                submission.add_done_callback(self._discard_submission)
+                raise
+        except OverflowError as error:
+            if item.cancelled:
+                return True
+            if self._in_flight:
+                # Retried when one of this stream's in-flight chunks completes.
+                self._pending.append(item)
+                return False
+            retry_after = self._runtime.estimated_wait_seconds()
+            if isinstance(error, ClientLimitError):
+                if error.retry_after_seconds is not None:
+                    retry_after = error.retry_after_seconds
+                await self._error(item.item_id, error.code, str(error), retry_after_seconds=retry_after)
+            else:
+                await self._error(
+                    item.item_id,
+                    "QUEUE_FULL",
+                    "The synthesis queue is full.",
+                    retry_after_seconds=retry_after,
+                )
+            return True
+        except BackendNotReadyError:
+            await self._error(item.item_id, "NOT_READY", "The TTS model is not ready.")
+            return True
+        except Exception:
+            LOGGER.exception("Stream submission failed")
+            await self._error(item.item_id, "INTERNAL_ERROR", "The TTS service failed unexpectedly.")
+            return True
+        if item.cancelled or self._closed:
+            self._discard(future, output_path)
+            return True
+        task = asyncio.create_task(self._await_result(item.item_id, future, output_path))
+        self._in_flight[item.item_id] = (future, output_path, task)
+        await self._send_json({"type": "progress", "id": item.item_id, "state": "submitted"})
+        return True
+
+    async def _await_result(self, item_id: str, future: Future[str], output_path: str) -> None:
+        audio: bytes | None = None
+        try:
+            completed_path = await asyncio.wrap_future(future)
+            audio = await asyncio.to_thread(Path(completed_path).read_bytes)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            await self._error(item_id, "SYNTHESIS_FAILED", "Speech synthesis failed.")
+        self._runtime.cleanup_path(output_path)
+        self._in_flight.pop(item_id, None)
+        if audio is not None:
+            await self._deliver(item_id, audio)
+        self._schedule_dispatch()
+
+    async def _cancel(self, item_ids: set[str] | None) -> None:
+        cancelled = [item for item in self._pending if item_ids is None or item.item_id in item_ids]
+        self._pending = [item for item in self._pending if item not in cancelled]
+        cancelled_ids = [item.item_id for item in cancelled]
+        dispatching = self._dispatching
+        if dispatching is not None and not dispatching.cancelled:
+            if item_ids is None or dispatching.item_id in item_ids:
+                dispatching.cancelled = True
+                cancelled_ids.append(dispatching.item_id)
+        for item_id in list(self._in_flight):
+            if item_ids is None or item_id in item_ids:
+                self._abandon(item_id)
+                cancelled_ids.append(item_id)
+        self._held = [
+            (item_id, audio) for item_id, audio in self._held if item_ids is not None and item_id not in item_ids
+        ]
+        for item_id in cancelled_ids:
+            await self._send_json({"type": "cancelled", "id": item_id})
+
+    def _abandon(self, item_id: str) -> None:
+        future, output_path, task = self._in_flight.pop(item_id)
+        task.cancel()
+        self._discard(future, output_path)
+
+    def _discard(self, future: Future[str], output_path: str) -> None:
+        if not future.cancel():
+            future.add_done_callback(lambda _completed: self._runtime.cleanup_path(output_path))
+
+    def _discard_submission(self, submission: asyncio.Future[tuple[Future[str], str]]) -> None:
+        if not submission.cancelled() and submission.exception() is None:
+            self._discard(*submission.result())
+
+    async def _deliver(self, item_id: str, audio: bytes) -> None:
+        if self._paused:
+            self._held.append((item_id, audio))
+            return
+        async with self._send_lock:
+            if self._closed:
+                return
+            await self._websocket.send_text(json.dumps({"type": "audio", "id": item_id, "bytes": len(audio)}))
+            await self._websocket.send_bytes(audio)
+
+    async def _error(self, item_id: str | None, code: str, message: str, **details: object) -> None:
+        await self._send_json({"type": "error", "id": item_id, "error": {"code": code, "message": message, **details}})
+
+    async def _send_json(self, payload: dict[str, object]) -> None:
+        async with self._send_lock:
+            if not self._closed:
+                await self._websocket.send_text(json.dumps(payload))
+
+    def _close(self) -> None:
+        self._closed = True
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+        self._pending.clear()
+        self._held.clear()
+        for item_id in list(self._in_flight):
+            self._abandon(item_id)
+
+
+def _torch_memory_stats() -> dict[str, object] | None:
+    torch = sys.modules.get("torch")
+    if torch is None:
+        return None
+    # torch only exposes allocator statistics for CUDA; on CPU its tensors come
+    # from the system allocator and show up in process RSS instead.
+    cuda = torch.cuda.is_available()
+    stats: dict[str, object] = {
+        "device": "cuda" if cuda else "cpu",
+        "num_threads": torch.get_num_threads(),
+        "allocator_stats_available": cuda,
+    }
+    if cuda:  # pragma: no cover - the service image is CPU-only
+        stats["cuda_allocated_bytes"] = torch.cuda.memory_allocated()
+        stats["cuda_reserved_bytes"] = torch.cuda.memory_reserved()
+        stats["cuda_max_allocated_bytes"] = torch.cuda.max_memory_allocated()
+    return stats
+
+
+class MemoryProfiler:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._owns_tracing = False
+        self._baseline: tracemalloc.Snapshot | None = None
+
+    def start(self, frames: int) -> None:
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(frames)
+                self._owns_tracing = True
+            self._baseline = self._snapshot()
+
+    def reset_baseline(self) -> bool:
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                return False
+            self._baseline = self._snapshot()
+            return True
+
+    def stop(self) -> None:
+        with self._lock:
+            if self._owns_tracing:
+                tracemalloc.stop()
+            self._owns_tracing = False
+            self._baseline = None
+
+    @staticmethod
+    def _snapshot() -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            )
+        )
+
+    def report(self, top: int) -> dict[str, object]:
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                return {"tracing": False}
+            snapshot = self._snapshot()
+            baseline = self._baseline
+        current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+        allocations = [
+            {"site": _format_traceback(statistic.traceback), "size_bytes": statistic.size, "count": statistic.count}
+            for statistic in snapshot.statistics("lineno")[:top]
+        ]
+        growth = [
+            {
+                "site": _format_traceback(difference.traceback),
+                "size_bytes": difference.size,
+                "size_diff_bytes": difference.size_diff,
+                "count_diff": difference.count_diff,
+            }
+            for difference in (snapshot.compare_to(baseline, "lineno")[:top] if baseline is not None else [])
+        ]
+        return {
+            "tracing": True,
+            "traced_bytes": current_bytes,
+            "peak_traced_bytes": peak_bytes,
+            "top_allocations": allocations,
+            "growth_since_baseline": growth,
+        }
+
+
+def _format_traceback(traceback: tracemalloc.Traceback) -> str:
+    frame = traceback[0]
+    return f"{frame.filename}:{frame.lineno}"
+
+
+def collapse_stack(frame: FrameType | None) -> str:
+    names: list[str] = []
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "?")
+        names.append(f"{module}:{frame.f_code.co_name}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+def sample_stacks(targets: Callable[[], dict[int, str]], seconds: float, interval: float) -> tuple[Counter[str], int]:
+    stacks: Counter[str] = Counter()
+    samples = 0
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        frames = sys._current_frames()
+        for ident, label in targets().items():
+            frame = frames.get(ident)
+            if frame is not None:
+                stacks[f"{label};{collapse_stack(frame)}"] += 1
+        samples += 1
+        time.sleep(interval)
+    return stacks, samples
+
+
+class StackSampler:
+    def __init__(self, thread_prefix: str = "coqui-synthesis") -> None:
+        self._thread_prefix = thread_prefix
+        self._lock = threading.Lock()
+
+    def _targets(self, extra_threads: dict[int, str]) -> dict[int, str]:
+        targets = dict(extra_threads)
+        for thread in threading.enumerate():
+            if thread.ident is not None and thread.name.startswith(self._thread_prefix):
+                targets[thread.ident] = thread.name
+        return targets
+
+    def sample(
+        self,
+        seconds: float,
+        interval: float,
+        extra_threads: dict[int, str],
+        children: dict[str, Callable[[float, float, str], Counter[str]]] | None = None,
+    ) -> tuple[Counter[str], int] | None:
+        if not self._lock.acquire(blocking=False):
+            return None
+        try:
+            children = children or {}
+            # Inference child processes sample their own main thread over the
+            # profiling pipe while this process samples its threads.
+            with ThreadPoolExecutor(max_workers=max(1, len(children)), thread_name_prefix="coqui-profile") as pool:
+                remote = {label: pool.submit(profile, seconds, interval, label) for label, profile in children.items()}
+                stacks, samples = sample_stacks(lambda: self._targets(extra_threads), seconds, interval)
+            for label, future in remote.items():
+                try:
+                    stacks.update(future.result())
+                except InferenceProcessError as error:
+                    LOGGER.warning("Could not profile %s: %s", label, error)
+            return stacks, samples
+        finally:
+            self._lock.release()
+
+
+def error_payload(code: str, message: str, **details: object) -> dict[str, object]:
+    return {"ok": False, "error": {"code": code, "message": message, **details}}
+
+
+def raise_api_error(
+    status_code: int,
+    code: str,
+    message: str,
+    headers: dict[str, str] | None = None,
+    **details: object,
+) -> NoReturn:
+    raise HTTPException(
+        status_code=status_code,
+        detail={"code": code, "message": message, **details},
+        headers=headers,
+    )
+
+
+def retry_after_header(seconds: float) -> dict[str, str]:
+    return {"Retry-After": str(max(1, math.ceil(seconds)))}
+
+
+def client_identity(connection: HTTPConnection, trusted_proxies: Iterable[str] = ()) -> str:
+    # A client could rotate or borrow a self-declared id to dodge its own
+    # limits, so the header only counts when a trusted proxy sets it.
+    peer = connection.client.host if connection.client is not None else None
+    if peer is not None and peer in trusted_proxies:
+        claimed = connection.headers.get(CLIENT_ID_HEADER, "").strip()
+        if claimed:
+            return claimed[:MAX_CLIENT_ID_CHARS]
+    return peer or DEFAULT_CLIENT_ID
+
+
+def audio_headers(result_key: str) -> dict[str, str]:
+    # Coqui synthesis is not bit-for-bit deterministic, so the validator names
+    # the request identity rather than the exact bytes and is marked weak.
+    return {"ETag": f'W/"{result_key}"', "Content-Location": f"/api/audio/{result_key}"}
+
+
+def etag_matches(if_none_match: str | None, etag: str, wildcard: bool = True) -> bool:
+    # Pass wildcard=False where the validator is checked before knowing that
+    # any audio exists, so "*" cannot turn an unsynthesized request into a 304.
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if (wildcard and candidate == "*") or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def cacheable_json(request: Request, payload: dict[str, object], cache_control: str) -> Response:
+    body = json.dumps(payload, separators=(",", ":")).encode()
+    headers = {"ETag": f'"{hashlib.sha256(body).hexdigest()[:32]}"', "Cache-Control": cache_control}
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def parse_byte_range(header: str | None, length: int) -> tuple[int, int] | None:
+    if header is None:
+        return None
+    unit, _separator, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, separator, last = (part.strip() for part in spec.partition("-"))
+    if not separator or not (first or last) or not (first or "0").isdigit() or not (last or "0").isdigit():
+        return None
+    if first:
+        start = int(first)
+        end = length - 1 if not last else min(int(last), length - 1)
+        if last and int(last) < start:
+            return None
+    else:
+        start = length - int(last) if int(last) else length
+        start, end = max(0, start), length - 1
+    if start >= length:
+        raise RangeNotSatisfiableError(f"Range is outside the {length}-byte body")
+    return start, end
+
+
+def audio_response(request: Request, audio: bytes, headers: dict[str, str]) -> Response:
+    headers = {**headers, "Accept-Ranges": "bytes"}
+    byte_range: tuple[int, int] | None = None
+    # If-Range needs a strong match (RFC 9110 13.1.5), and the audio ETag is
+    # weak, so a conditional resume always gets the full body back.
+    if_range = request.headers.get("if-range")
+    etag = headers.get("ETag", "")
+    if if_range is None or (if_range == etag and not etag.startswith("W/")):
+        try:
+            byte_range = parse_byte_range(request.headers.get("range"), len(audio))
+        except RangeNotSatisfiableError as error:
+            unsatisfiable = {**headers, "Content-Range": f"bytes */{len(audio)}"}
+            raise_api_error(416, "RANGE_NOT_SATISFIABLE", str(error), unsatisfiable)
+    if byte_range is None:
+        return Response(content=audio, media_type="audio/wav", headers=headers)
+    start, end = byte_range
+    return Response(
+        content=audio[start : end + 1],
+        status_code=206,
+        media_type="audio/wav",
+        headers={**headers, "Content-Range": f"bytes {start}-{end}/{len(audio)}"},
+    )
+
+
+def create_app(
+    *,
+    config: ServiceConfig | None = None,
+    model_loader: ModelLoader = load_coqui_model,
+) -> FastAPI:
+    service_config = config or ServiceConfig.from_environment()
+    application = FastAPI(title="Chrome Read It Coqui TTS", docs_url=None, redoc_url=None)
+    runtime = SynthesisRuntime(service_config, model_loader)
+    jobs = JobRegistry(runtime, service_config.job_result_ttl_seconds, service_config.max_retained_jobs)
+    sessions = SessionRegistry(service_config.session_idle_ttl_seconds, service_config.max_sessions)
+    application.state.runtime = runtime
+    application.state.jobs = jobs
+    application.state.sessions = sessions
+    memory_profiler = MemoryProfiler()
+    stack_sampler = StackSampler()
+
+    def client_id_of(connection: HTTPConnection) -> str:
+        return client_identity(connection, service_config.trusted_proxies)
+
+    @application.on_event("startup")
+    def startup_event() -> None:
+        runtime.start()
+
+    @application.on_event("shutdown")
+    def shutdown_event() -> None:
+        sessions.clear()
+        jobs.clear()
+        runtime.shutdown()
+        memory_profiler.stop()
+
+    @application.exception_handler(HTTPException)
+    async def http_exception_handler(_request: Request, exception: HTTPException) -> JSONResponse:
+        detail = exception.detail
+        if isinstance(detail, dict) and isinstance(detail.get("code"), str):
+            details = {key: value for key, value in detail.items() if key not in {"code", "message"}}
+            payload = error_payload(str(detail["code"]), str(detail.get("message", "Request failed")), **details)
+        else:
+            payload = error_payload("HTTP_ERROR", str(detail))
+        return JSONResponse(status_code=exception.status_code, content=payload, headers=exception.headers)
+
+    @application.exception_handler(RequestValidationError)
+    async def validation_exception_handler(_request: Request, _exception: RequestValidationError) -> JSONResponse:
+        return JSONResponse(status_code=422, content=error_payload("INVALID_REQUEST", "The request body is invalid."))
 
     @application.exception_handler(Exception)
     async def unexpected_exception_handler(_request: Request, _exception: Exception) -> JSONResponse:
@@ -385,9 +3653,15 @@ def create_app(
     def ready() -> dict[str, object]:
         if not runtime.ready:
             raise_api_error(503, "NOT_READY", "The TTS model is not ready.")
+        runtime.sweep_retained_results()
         metrics = runtime.metrics()
         if not metrics.accepting_requests:
-            raise_api_error(503, "QUEUE_FULL", "The synthesis queue is full.")
+            raise_api_error(
+                503,
+                "QUEUE_FULL",
+                "The synthesis queue is full.",
+                retry_after_header(metrics.estimated_wait_seconds),
+            )
         return {
             "ok": True,
             "ready": True,
@@ -397,42 +3671,530 @@ def create_app(
             "active_inference": metrics.active_inference,
             "queued_futures": metrics.queued_futures,
             "timed_out_running": metrics.timed_out_running,
+            "estimated_wait_seconds": metrics.estimated_wait_seconds,
+            "startup": runtime.startup_profile(),
+        }
+
+    @application.get("/api/live")
+    def live() -> dict[str, object]:
+        if not runtime.ready:
+            raise_api_error(503, "NOT_READY", "The TTS model is not ready.")
+        liveness = runtime.liveness()
+        details = asdict(liveness)
+        del details["alive"], details["reason"]
+        if liveness.reason is not None:
+            raise_api_error(503, liveness.reason, "The synthesis worker is not making progress.", **details)
+        return {"ok": True, "alive": True, **details}
+
+    @application.get("/api/metrics")
+    def metrics() -> dict[str, object]:
+        snapshot = runtime.metrics()
+        return {
+            "ok": True,
+            "ready": runtime.ready,
+            **asdict(snapshot),
+            "request_cache_hit_rate": snapshot.request_cache_hit_rate,
+            "sentence_cache_hit_rate": snapshot.sentence_cache_hit_rate,
+            "latency_model": runtime.latency_profile(),
+            "postprocess": runtime.postprocess_profile(),
+            "prewarm": runtime.prewarm_status(),
+            "models": runtime.model_profile(),
+            "clients": runtime.clients(),
+            "liveness": asdict(runtime.liveness()),
+            "inference_recycle_events": runtime.recycle_events(),
+            "settings": runtime.settings(),
+            "config_change_events": runtime.config_change_events(),
+            "retained_jobs": len(jobs),
+            "active_sessions": len(sessions),
+        }
+
+    def require_admin(request: Request) -> None:
+        if not service_config.admin_token:
+            raise_api_error(404, "NOT_FOUND", "Admin endpoints are disabled.")
+        supplied = request.headers.get("authorization", "").encode()
+        if not hmac.compare_digest(supplied, f"Bearer {service_config.admin_token}".encode()):
+            raise_api_error(401, "UNAUTHORIZED", "A valid admin token is required.", {"WWW-Authenticate": "Bearer"})
+
+    @application.post("/api/admin/memory/tracing")
+    def memory_tracing(request: Request, settings: MemoryTracingRequest) -> dict[str, object]:
+        require_admin(request)
+        if settings.enabled:
+            memory_profiler.start(settings.frames)
+        else:
+            memory_profiler.stop()
+        return {"ok": True, "tracing": tracemalloc.is_tracing()}
+
+    @application.post("/api/admin/memory/baseline")
+    def memory_baseline(request: Request) -> dict[str, object]:
+        require_admin(request)
+        if not memory_profiler.reset_baseline():
+            raise_api_error(409, "TRACING_DISABLED", "Memory tracing is not enabled.")
+        return {"ok": True}
+
+    @application.get("/api/admin/settings")
+    def read_settings(request: Request) -> dict[str, object]:
+        require_admin(request)
+        return {"ok": True, "settings": runtime.settings()}
+
+    @application.post("/api/admin/settings")
+    def update_settings(request: Request, update: SettingsUpdateRequest) -> dict[str, object]:
+        require_admin(request)
+        changes = update.model_dump(exclude_none=True)
+        if not changes:
+            raise_api_error(400, "EMPTY_UPDATE", "At least one setting must be provided.")
+        return {"ok": True, "settings": runtime.update_settings(changes)}
+
+    @application.get("/api/admin/memory")
+    def memory(request: Request, top: int = 20) -> dict[str, object]:
+        require_admin(request)
+        top = min(max(top, 1), 200)
+        metrics = runtime.metrics()
+        return {
+            "ok": True,
+            "process_rss_bytes": metrics.process_rss_bytes,
+            "inference_rss_bytes": metrics.inference_rss_bytes,
+            "torch": _torch_memory_stats(),
+            "structures": {**runtime.structure_sizes(), "retained_jobs": len(jobs), "active_sessions": len(sessions)},
+            "tracemalloc": memory_profiler.report(top),
         }
 
+    @application.get("/api/admin/profile")
+    async def cpu_profile(
+        request: Request,
+        seconds: float = 5.0,
+        interval_ms: float = 10.0,
+        event_loop: bool = True,
+    ) -> Response:
+        require_admin(request)
+        seconds = min(max(seconds, 0.1), MAX_PROFILE_SECONDS)
+        interval = min(max(interval_ms, 1.0), 1000.0) / 1000
+        extra_threads = {threading.get_ident(): "event-loop"} if event_loop else {}
+        result = await asyncio.to_thread(
+            stack_sampler.sample, seconds, interval, extra_threads, runtime.inference_profilers()
+        )
+        if result is None:
+            raise_api_error(409, "PROFILE_IN_PROGRESS", "Another profile is already running.")
+        stacks, samples = result
+        body = "".join(f"{stack} {count}\n" for stack, count in sorted(stacks.items()))
+        return Response(body, media_type="text/plain", headers={"X-Profile-Samples": str(samples)})
+
     @application.get("/api/voices")
-    def voices() -> dict[str, list[str]]:
+    def voices(request: Request, model: str | None = None) -> Response:
         if not runtime.ready:
             raise_api_error(503, "NOT_READY", "The TTS model is not ready.")
-        return {"voices": runtime.voices()}
+        try:
+            voice_names = runtime.voices(model)
+        except InvalidModelError as error:
+            raise_api_error(400, "INVALID_MODEL", str(error))
+        except BackendNotReadyError:
+            raise_api_error(503, "NOT_READY", "The TTS model is not ready.")
+        return cacheable_json(request, {"voices": voice_names}, VOICE_LIST_CACHE_CONTROL)
 
-    @application.post("/api/tts")
-    def synthesize(request: TTSRequest) -> FileResponse:
+    @application.get("/api/voices/catalog")
+    def voice_catalog(request: Request, model: str | None = None) -> Response:
+        if not runtime.ready:
+            raise_api_error(503, "NOT_READY", "The TTS model is not ready.")
+        try:
+            model_id, profiles = runtime.voice_catalog(model)
+        except InvalidModelError as error:
+            raise_api_error(400, "INVALID_MODEL", str(error))
+        except BackendNotReadyError:
+            raise_api_error(503, "NOT_READY", "The TTS model is not ready.")
+        payload = {
+            "ok": True,
+            "model": model_id,
+            "default_voice": profiles[0].name if profiles else None,
+            "voices": [asdict(profile) for profile in profiles],
+        }
+        return cacheable_json(request, payload, VOICE_CATALOG_CACHE_CONTROL)
+
+    @application.get("/api/capabilities")
+    def capabilities(model: str | None = None, voice: str | None = None) -> dict[str, object]:
+        if not runtime.ready:
+            raise_api_error(503, "NOT_READY", "The TTS model is not ready.")
+        try:
+            recommendation = runtime.chunk_recommendation(model, voice)
+        except InvalidModelError as error:
+            raise_api_error(400, "INVALID_MODEL", str(error))
+        except InvalidVoiceError as error:
+            raise_api_error(400, "INVALID_VOICE", str(error))
+        except BackendNotReadyError:
+            raise_api_error(503, "NOT_READY", "The TTS model is not ready.")
+        return {
+            "ok": True,
+            "max_text_chars": runtime.config.max_text_chars,
+            "max_document_chars": service_config.max_document_chars,
+            "estimated_wait_seconds": runtime.estimated_wait_seconds(),
+            "chunking": asdict(recommendation),
+        }
+
+    @application.get("/api/models")
+    def models() -> dict[str, object]:
+        return {"ok": True, "default": runtime.default_model(), "models": runtime.model_profile()}
+
+    @application.post("/api/admin/models/reload", status_code=202)
+    def reload_model(request: Request, reload: ModelReloadRequest) -> dict[str, object]:
+        require_admin(request)
+        try:
+            status = runtime.reload_model(reload.model, reload.make_default)
+        except ReloadInProgressError:
+            raise_api_error(409, "RELOAD_IN_PROGRESS", "A model reload is already running.")
+        except BackendNotReadyError:
+            raise_api_error(503, "NOT_READY", "The TTS model is not ready.")
+        return {"ok": True, "reload": status}
+
+    @application.get("/api/admin/models/reload")
+    def reload_status(request: Request) -> dict[str, object]:
+        require_admin(request)
+        return {"ok": True, "reload": runtime.reload_status()}
+
+    def validated_text(request: TTSRequest) -> str:
         text = request.text.strip()
         if not text:
             raise_api_error(400, "EMPTY_TEXT", "Text must not be empty.")
-        if len(text) > service_config.max_text_chars:
-            raise_api_error(413, "TEXT_TOO_LONG", f"Text exceeds the {service_config.max_text_chars}-character limit.")
+        limit = runtime.config.max_text_chars
+        if len(text) > limit:
+            raise_api_error(413, "TEXT_TOO_LONG", f"Text exceeds the {limit}-character limit.")
         if not runtime.ready:
             raise_api_error(503, "NOT_READY", "The TTS model is not ready.")
+        return text
+
+    def lookup_cached(
+        text: str,
+        voice: str | None,
+        model: str | None,
+        rate: float | None = None,
+    ) -> bytes | None:
+        try:
+            return runtime.cached_audio(text, voice, model, rate)
+        except InvalidModelError as error:
+            raise_api_error(400, "INVALID_MODEL", str(error))
+        except InvalidVoiceError as error:
+            raise_api_error(400, "INVALID_VOICE", str(error))
+        except BackendNotReadyError:
+            raise_api_error(503, "NOT_READY", "The TTS model is not ready.")
+
+    def reject_client(error: ClientLimitError) -> NoReturn:
+        retry_after = error.retry_after_seconds
+        if retry_after is None:
+            retry_after = runtime.estimated_wait_seconds()
+        raise_api_error(429, error.code, str(error), retry_after_header(retry_after))
 
+    def reject_admission(error: OverflowError) -> NoReturn:
+        if isinstance(error, DeadlineUnreachableError):
+            raise_api_error(
+                429,
+                "DEADLINE_UNREACHABLE",
+                "The synthesis queue cannot finish this request within its deadline.",
+                retry_after_header(error.retry_after_seconds),
+            )
+        if isinstance(error, ClientLimitError):
+            reject_client(error)
+        if isinstance(error, SpoolFullError):
+            raise_api_error(
+                503,
+                "SPOOL_FULL",
+                "The audio spool is full.",
+                retry_after_header(runtime.estimated_wait_seconds()),
+            )
+        raise_api_error(
+            429,
+            "QUEUE_FULL",
+            "The synthesis queue is full.",
+            retry_after_header(runtime.estimated_wait_seconds()),
+        )
+
+    @contextmanager
+    def submission_errors() -> Iterator[None]:
         try:
-            future, output_path = runtime.submit(text, request.voice)
+            yield
+        except InvalidModelError as error:
+            raise_api_error(400, "INVALID_MODEL", str(error))
         except InvalidVoiceError as error:
             raise_api_error(400, "INVALID_VOICE", str(error))
-        except OverflowError:
-            raise_api_error(429, "QUEUE_FULL", "The synthesis queue is full.")
+        except OverflowError as error:
+            reject_admission(error)
         except BackendNotReadyError:
             raise_api_error(503, "NOT_READY", "The TTS model is not ready.")
         except Exception:
             LOGGER.exception("Synthesis submission failed")
             raise_api_error(500, "INTERNAL_ERROR", "The TTS service failed unexpectedly.")
 
+    def submit_or_reject(
+        text: str,
+        voice: str | None,
+        deadline_seconds: float | None,
+        model: str | None,
+        client_id: str,
+        rate: float | None = None,
+    ) -> tuple[Future[str], str]:
+        with submission_errors():
+            submitted = runtime.submit(text, voice, deadline_seconds, model, client_id, rate)
+        return submitted
+
+    @application.post("/api/tts")
+    def synthesize(request: TTSRequest, http_request: Request) -> Response:
+        text = validated_text(request)
+        try:
+            result_key = runtime.result_key(text, request.voice, request.model, request.rate)
+        except InvalidModelError as error:
+            raise_api_error(400, "INVALID_MODEL", str(error))
+        except InvalidVoiceError as error:
+            raise_api_error(400, "INVALID_VOICE", str(error))
+        except BackendNotReadyError:
+            raise_api_error(503, "NOT_READY", "The TTS model is not ready.")
+        validators = audio_headers(result_key)
+        if etag_matches(http_request.headers.get("if-none-match"), validators["ETag"], wildcard=False):
+            return Response(status_code=304, headers=validators)
+        retained = runtime.claim_result(result_key)
+        if retained is not None:
+            return wait_for_audio(*retained, result_key)
+        cached = lookup_cached(text, request.voice, request.model, request.rate)
+        if cached is not None:
+            return audio_response(http_request, cached, validators)
+
+        deadline_seconds = runtime.config.synthesis_timeout_seconds
+        if request.deadline_seconds is not None:
+            deadline_seconds = min(deadline_seconds, request.deadline_seconds)
+        future, output_path = submit_or_reject(
+            text, request.voice, deadline_seconds, request.model, client_id_of(http_request), request.rate
+        )
+        return wait_for_audio(future, output_path, result_key)
+
+    def stream_long_text(synthesis: LongTextSynthesis) -> Iterator[bytes]:
+        try:
+            yield from streamed_wav(synthesis.audio(), runtime.config.sentence_silence_ms)
+        except Exception:
+            # Headers are already sent, so a failed segment can only end the
+            # stream early; clients see a shorter WAV than the text implies.
+            LOGGER.exception("Long-text stream ended early")
+        finally:
+            synthesis.close()
+
+    @application.post("/api/tts/long")
+    def synthesize_long(request: LongTextRequest, http_request: Request) -> Response:
+        limit = runtime.config.max_long_text_chars
+        if not limit:
+            raise_api_error(404, "LONG_TEXT_DISABLED", "Long-text synthesis is disabled.")
+        text = request.text.strip()
+        if not text:
+            raise_api_error(400, "EMPTY_TEXT", "Text must not be empty.")
+        if len(text) > limit:
+            raise_api_error(413, "TEXT_TOO_LONG", f"Text exceeds the {limit}-character long-text limit.")
+        if not runtime.ready:
+            raise_api_error(503, "NOT_READY", "The TTS model is not ready.")
+        with submission_errors():
+            # Segments are sized from the fitted latency curve, so the first
+            # one is ready quickly and the rest follow in worker-sized steps.
+            target_chars = runtime.chunk_recommendation(request.model, request.voice).target_chars
+            segments = pack_chunks(text, target_chars, runtime.config.max_text_chars)
+            synthesis = LongTextSynthesis(
+                runtime, segments, request.voice, request.model, request.rate, client_id_of(http_request)
+            )
+            synthesis.start()
+        runtime.record_long_text(synthesis.segment_count)
+        headers = {"X-Segment-Count": str(synthesis.segment_count)}
+        if request.stream:
+            return StreamingResponse(stream_long_text(synthesis), media_type="audio/wav", headers=headers)
         try:
-            completed_path = future.result(timeout=service_config.synthesis_timeout_seconds)
+            audio = stitch_wav(list(synthesis.audio()), runtime.config.sentence_silence_ms)
+        except FutureTimeoutError:
+            raise_api_error(504, "SYNTHESIS_TIMEOUT", "Speech synthesis timed out.")
+        except OverflowError as error:
+            reject_admission(error)
+        except Exception:
+            raise_api_error(500, "SYNTHESIS_FAILED", "Speech synthesis failed.")
+        return Response(content=audio, media_type="audio/wav", headers=headers)
+
+    def job_status(job: SynthesisJob) -> dict[str, object]:
+        payload: dict[str, object] = {"ok": True, "job_id": job.job_id, "queue_position": None}
+        future = job.future
+        if future is None or (future.done() and not future.cancelled() and future.exception() is None):
+            payload["state"] = "completed"
+            payload["audio_url"] = f"/api/jobs/{job.job_id}/audio"
+        elif future.cancelled():
+            payload["state"] = "cancelled"
+        elif future.done():
+            payload["state"] = "failed"
+            payload["error"] = {"code": "SYNTHESIS_FAILED", "message": "Speech synthesis failed."}
+        elif job.output_path is not None and runtime.is_running(job.output_path):
+            payload["state"] = "running"
+        else:
+            payload["state"] = "queued"
+            payload["queue_position"] = runtime.queue_position(job.output_path or "")
+        return payload
+
+    def find_job(job_id: str) -> SynthesisJob:
+        job = jobs.get(job_id)
+        if job is None:
+            raise_api_error(404, "JOB_NOT_FOUND", "No job exists for this id.")
+        return job
+
+    @application.post("/api/jobs", status_code=202)
+    def submit_job(request: TTSRequest, http_request: Request) -> dict[str, object]:
+        text = validated_text(request)
+        cached = lookup_cached(text, request.voice, request.model, request.rate)
+        if cached is not None:
+            return job_status(jobs.add_completed(cached))
+        future, output_path = submit_or_reject(
+            text,
+            request.voice,
+            request.deadline_seconds,
+            request.model,
+            client_id_of(http_request),
+            request.rate,
+        )
+        return job_status(jobs.add(future, output_path))
+
+    @application.get("/api/jobs/{job_id}")
+    def get_job(job_id: str, wait: float = 0.0) -> dict[str, object]:
+        job = find_job(job_id)
+        if job.future is not None and wait > 0:
+            wait_futures([job.future], timeout=min(wait, MAX_JOB_POLL_SECONDS))
+        return job_status(job)
+
+    @application.get("/api/jobs/{job_id}/audio")
+    def get_job_audio(job_id: str) -> Response:
+        job = find_job(job_id)
+        status = job_status(job)
+        if status["state"] in {"queued", "running"}:
+            raise_api_error(409, "JOB_PENDING", "Speech synthesis is still running.")
+        if status["state"] != "completed":
+            raise_api_error(500, "SYNTHESIS_FAILED", "Speech synthesis failed.")
+        if job.audio is not None:
+            return Response(content=job.audio, media_type="audio/wav")
+        try:
+            audio = Path(job.output_path or "").read_bytes()
+        except OSError:
+            raise_api_error(404, "JOB_NOT_FOUND", "No job exists for this id.")
+        return Response(content=audio, media_type="audio/wav")
+
+    def find_session(session_id: str) -> ReadingSession:
+        session = sessions.get(session_id)
+        if session is None:
+            raise_api_error(404, "SESSION_NOT_FOUND", "No reading session exists for this id.")
+        return session
+
+    @application.post("/api/sessions", status_code=201)
+    def create_session(request: SessionRequest, http_request: Request) -> dict[str, object]:
+        text = request.text.strip()
+        if not text:
+            raise_api_error(400, "EMPTY_TEXT", "Text must not be empty.")
+        if len(text) > service_config.max_document_chars:
+            raise_api_error(
+                413,
+                "TEXT_TOO_LONG",
+                f"Document exceeds the {service_config.max_document_chars}-character limit.",
+            )
+        if not runtime.ready:
+            raise_api_error(503, "NOT_READY", "The TTS model is not ready.")
+        try:
+            runtime.validate_voice(request.voice, request.model)
+        except InvalidModelError as error:
+            raise_api_error(400, "INVALID_MODEL", str(error))
+        except InvalidVoiceError as error:
+            raise_api_error(400, "INVALID_VOICE", str(error))
+        except BackendNotReadyError:
+            raise_api_error(503, "NOT_READY", "The TTS model is not ready.")
+        chunks = pack_chunks(
+            text,
+            min(service_config.session_target_chunk_chars, runtime.config.max_text_chars),
+            runtime.config.max_text_chars,
+        )
+        lookahead = (
+            service_config.session_lookahead_chunks if request.lookahead_chunks is None else request.lookahead_chunks
+        )
+        session = ReadingSession(
+            runtime, chunks, request.voice, lookahead, request.model, client_id_of(http_request)
+        )
+        sessions.add(session)
+        session.fill()
+        return {**session.status(), "chunks": session.chunk_texts()}
+
+    @application.get("/api/sessions/{session_id}")
+    def get_session(session_id: str) -> dict[str, object]:
+        return find_session(session_id).status()
+
+    @application.post("/api/sessions/{session_id}/seek")
+    def seek_session(session_id: str, request: SessionSeekRequest) -> dict[str, object]:
+        session = find_session(session_id)
+        if request.index >= session.chunk_count:
+            raise_api_error(404, "CHUNK_NOT_FOUND", "The session has no chunk at this index.")
+        session.seek(request.index, request.paused)
+        return session.status()
+
+    @application.get("/api/sessions/{session_id}/chunks/{index}")
+    def get_session_chunk(session_id: str, index: int) -> Response:
+        session = find_session(session_id)
+        if index < 0 or index >= session.chunk_count:
+            raise_api_error(404, "CHUNK_NOT_FOUND", "The session has no chunk at this index.")
+        try:
+            chunk = session.request(index)
+        except InvalidVoiceError as error:
+            raise_api_error(400, "INVALID_VOICE", str(error))
+        except OverflowError as error:
+            reject_admission(error)
+        except BackendNotReadyError:
+            raise_api_error(503, "NOT_READY", "The TTS model is not ready.")
+        if chunk.audio is not None:
+            return Response(content=chunk.audio, media_type="audio/wav")
+        future = chunk.future
+        if future is None:
+            raise_api_error(409, "CHUNK_PENDING", "The chunk has not been scheduled yet.")
+        try:
+            completed_path = future.result(timeout=runtime.config.synthesis_timeout_seconds)
+            audio = Path(completed_path).read_bytes()
         except FutureTimeoutError:
-            runtime.mark_timed_out(future)
-            future.add_done_callback(lambda _future: runtime.cleanup_path(output_path))
             raise_api_error(504, "SYNTHESIS_TIMEOUT", "Speech synthesis timed out.")
+        except Exception:
+            raise_api_error(500, "SYNTHESIS_FAILED", "Speech synthesis failed.")
+        return Response(content=audio, media_type="audio/wav")
+
+    @application.delete("/api/sessions/{session_id}")
+    def delete_session(session_id: str) -> dict[str, bool]:
+        if not sessions.remove(session_id):
+            raise_api_error(404, "SESSION_NOT_FOUND", "No reading session exists for this id.")
+        return {"ok": True}
+
+    @application.websocket("/api/stream")
+    async def stream(websocket: WebSocket) -> None:
+        await websocket.accept()
+        if not runtime.ready:
+            await websocket.close(code=1013, reason="The TTS model is not ready.")
+            return
+        await StreamChannel(websocket, runtime, service_config, client_id_of(websocket)).run()
+
+    @application.get("/api/audio/{result_key}")
+    def addressed_audio(result_key: str, http_request: Request) -> Response:
+        if not runtime.has_audio_identity(result_key):
+            raise_api_error(404, "AUDIO_NOT_FOUND", "No audio is known for this key.")
+        headers = {**audio_headers(result_key), "Cache-Control": AUDIO_CACHE_CONTROL}
+        if etag_matches(http_request.headers.get("if-none-match"), headers["ETag"], wildcard=False):
+            return Response(status_code=304, headers=headers)
+        try:
+            audio = runtime.addressed_audio(result_key)
+        except BackendNotReadyError:
+            raise_api_error(503, "NOT_READY", "The TTS model is not ready.")
+        if audio is None:
+            raise_api_error(404, "AUDIO_NOT_CACHED", "The audio for this key is no longer cached.")
+        return audio_response(http_request, audio, headers)
+
+    @application.get("/api/results/{result_key}")
+    def timed_out_result(result_key: str) -> FileResponse:
+        retained = runtime.claim_result(result_key, completed_only=True)
+        if retained is None:
+            if runtime.has_retained_result(result_key):
+                raise_api_error(409, "RESULT_PENDING", "Speech synthesis is still running.")
+            raise_api_error(404, "RESULT_NOT_FOUND", "No retained result exists for this key.")
+        return wait_for_audio(*retained, result_key)
+
+    def wait_for_audio(future: Future[str], output_path: str, result_key: str) -> FileResponse:
+        try:
+            completed_path = future.result(timeout=runtime.config.synthesis_timeout_seconds)
+        except FutureTimeoutError:
+            runtime.mark_timed_out(future)
+            runtime.retain_result(result_key, future, output_path)
+            raise_api_error(504, "SYNTHESIS_TIMEOUT", "Speech synthesis timed out.", result_key=result_key)
         except Exception:
             runtime.cleanup_path(output_path)
             raise_api_error(500, "SYNTHESIS_FAILED", "Speech synthesis failed.")
@@ -440,6 +4202,7 @@ def create_app(
         return FileResponse(
             completed_path,
             media_type="audio/wav",
+            headers=audio_headers(result_key),
             background=BackgroundTask(runtime.cleanup_path, completed_path),
         )
 
@@ -447,3 +4210,4 @@ def create_app(
 
 
 app = create_app()
+_MODULE_LOADED = time.perf_counter()
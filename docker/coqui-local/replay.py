@@ -0,0 +1,393 @@
+from __future__ import annotations
+
+import argparse
+import heapq
+import io
+import itertools
+import json
+import math
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+import wave
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, Sequence
+
+
+DEFAULT_URL = "http://127.0.0.1:5002"
+DEFAULT_SECONDS_PER_CHAR = 0.02
+SYNTHETIC_FRAME_RATE = 16000
+SYNTHETIC_SECONDS_PER_CHAR = 0.06
+_WORDS = (
+    "amber", "harbor", "lantern", "meadow", "orbit", "pepper", "quiet", "river",
+    "signal", "timber", "velvet", "willow", "canyon", "ember", "glacier", "marble",
+)
+
+Poster = Callable[[dict[str, object]], tuple[int, str | None]]
+
+
+@dataclass(frozen=True)
+class TraceRecord:
+    at: float
+    chars: int
+    sentences: int
+    outcome: str
+    model: str | None = None
+    voice: str | None = None
+    deadline: float | None = None
+    inference: float | None = None
+
+
+@dataclass(frozen=True)
+class Scenario:
+    queue_capacity: int
+    workers: int
+    timeout_seconds: float
+    queue_work_seconds: float
+
+    @property
+    def label(self) -> str:
+        return f"capacity={self.queue_capacity} workers={self.workers} timeout={self.timeout_seconds:g}s"
+
+
+@dataclass
+class ReplayResult:
+    label: str
+    requests: int = 0
+    outcomes: Counter[str] = field(default_factory=Counter)
+    latencies: list[float] = field(default_factory=list)
+    busy_seconds: float | None = None
+    span_seconds: float = 0.0
+
+    def summary(self) -> dict[str, object]:
+        ordered = sorted(self.latencies)
+        utilization = None
+        if self.busy_seconds is not None and self.span_seconds > 0:
+            utilization = round(self.busy_seconds / self.span_seconds, 3)
+        return {
+            "label": self.label,
+            "requests": self.requests,
+            "outcomes": dict(sorted(self.outcomes.items())),
+            "p50_seconds": _percentile(ordered, 0.50),
+            "p95_seconds": _percentile(ordered, 0.95),
+            "max_seconds": round(ordered[-1], 3) if ordered else None,
+            "utilization": utilization,
+        }
+
+
+def _percentile(ordered: Sequence[float], fraction: float) -> float | None:
+    if not ordered:
+        return None
+    return round(ordered[max(0, math.ceil(fraction * len(ordered)) - 1)], 3)
+
+
+def _optional_float(value: object) -> float | None:
+    return None if value is None else float(value)  # type: ignore[arg-type]
+
+
+def load_trace(path: str | Path) -> list[TraceRecord]:
+    records: list[TraceRecord] = []
+    with Path(path).open(encoding="utf-8") as handle:
+        for number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+                records.append(
+                    TraceRecord(
+                        at=float(entry["at"]),
+                        chars=int(entry["chars"]),
+                        sentences=max(1, int(entry.get("sentences") or 1)),
+                        outcome=str(entry["outcome"]),
+                        model=entry.get("model"),
+                        voice=entry.get("voice"),
+                        deadline=_optional_float(entry.get("deadline")),
+                        inference=_optional_float(entry.get("inference")),
+                    )
+                )
+            except (KeyError, TypeError, ValueError) as error:
+                raise ValueError(f"{path}:{number}: invalid trace record") from error
+    # Jobs are logged when they finish, so file order is completion order.
+    records.sort(key=lambda record: record.at)
+    return records
+
+
+def fit_latency(records: Iterable[TraceRecord]) -> tuple[float, float]:
+    samples = [(float(record.chars), record.inference) for record in records if record.inference and record.chars > 0]
+    if not samples:
+        return 0.0, DEFAULT_SECONDS_PER_CHAR
+    count = len(samples)
+    mean_x = sum(x for x, _y in samples) / count
+    mean_y = sum(y for _x, y in samples) / count
+    variance = sum((x - mean_x) ** 2 for x, _y in samples) / count
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in samples) / count / variance if variance > 1e-9 else 0.0
+    intercept = mean_y - slope * mean_x
+    if slope <= 0 or intercept < 0:
+        return 0.0, mean_y / mean_x
+    return intercept, slope
+
+
+def simulate(
+    records: Sequence[TraceRecord],
+    scenario: Scenario,
+    latency: tuple[float, float] | None = None,
+) -> ReplayResult:
+    # A deterministic FIFO model of the admission rules in app.py: the job
+    # count limit, the queued-work budget and the deadline prediction, with
+    # an idle queue always admitting one request.
+    intercept, slope = latency or fit_latency(records)
+    result = ReplayResult(scenario.label, busy_seconds=0.0)
+    origin = records[0].at if records else 0.0
+    free_at = [0.0] * scenario.workers
+    in_system: list[tuple[float, float]] = []
+    for record in records:
+        result.requests += 1
+        arrival = record.at - origin
+        result.span_seconds = max(result.span_seconds, arrival)
+        if record.outcome == "cached":
+            result.outcomes["cached"] += 1
+            result.latencies.append(0.0)
+            continue
+        in_system = [(start, finish) for start, finish in in_system if finish > arrival]
+        service = record.inference if record.inference is not None else intercept + slope * record.chars
+        start = max(arrival, free_at[0])
+        if in_system:
+            deadline = scenario.timeout_seconds
+            if record.deadline is not None:
+                deadline = min(deadline, record.deadline)
+            queued_work = sum(finish - max(began, arrival) for began, finish in in_system)
+            if len(in_system) >= scenario.queue_capacity or queued_work + service > scenario.queue_work_seconds:
+                result.outcomes["queue_full"] += 1
+                continue
+            if start - arrival + service > deadline:
+                result.outcomes["deadline_unreachable"] += 1
+                continue
+        finish = start + service
+        heapq.heapreplace(free_at, finish)
+        in_system.append((start, finish))
+        result.busy_seconds = (result.busy_seconds or 0.0) + service / scenario.workers
+        result.span_seconds = max(result.span_seconds, finish)
+        latency_seconds = finish - arrival
+        result.latencies.append(latency_seconds)
+        result.outcomes["timed_out" if latency_seconds > scenario.timeout_seconds else "completed"] += 1
+    return result
+
+
+def synthetic_text(chars: int, sentences: int, seed: int) -> str:
+    # Text of the recorded shape. A non-zero seed leads with a unique token so
+    # replayed misses stay misses; seed 0 repeats so recorded hits can hit.
+    sentences = max(1, min(sentences, max(1, chars // 12)))
+    budget = max(sentences * 2, chars - (sentences - 1))
+    words = itertools.cycle(_WORDS[seed % len(_WORDS) :] + _WORDS[: seed % len(_WORDS)])
+    parts: list[str] = []
+    for index in range(sentences):
+        share = budget // (sentences - index)
+        budget -= share
+        body = f"Run{seed}" if index == 0 and seed else next(words).capitalize()
+        while len(body) < share - 1:
+            body += " " + next(words)
+        parts.append(body[: share - 1].rstrip() + ".")
+    return " ".join(parts)
+
+
+def post_tts(base_url: str, body: dict[str, object], timeout: float) -> tuple[int, str | None]:
+    request = urllib.request.Request(
+        base_url.rstrip("/") + "/api/tts",
+        data=json.dumps(body).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            response.read()
+            return response.status, None
+    except urllib.error.HTTPError as error:
+        try:
+            code = json.load(error).get("error", {}).get("code")
+        except (AttributeError, ValueError):
+            code = None
+        return error.code, code
+    except OSError:
+        return 0, "TRANSPORT_ERROR"
+
+
+def drive(
+    records: Sequence[TraceRecord],
+    post: Poster,
+    *,
+    speed: float = 1.0,
+    concurrency: int = 64,
+    keep_voices: bool = True,
+    sleep: Callable[[float], None] = time.sleep,
+    clock: Callable[[], float] = time.monotonic,
+) -> ReplayResult:
+    result = ReplayResult(f"live speed={speed:g}x")
+    lock = threading.Lock()
+    origin = records[0].at if records else 0.0
+
+    def send(body: dict[str, object]) -> None:
+        started = clock()
+        status, code = post(body)
+        elapsed = clock() - started
+        with lock:
+            if status == 200:
+                result.outcomes["completed"] += 1
+                result.latencies.append(elapsed)
+            elif code == "SYNTHESIS_TIMEOUT":
+                result.outcomes["timed_out"] += 1
+            else:
+                result.outcomes[(code or f"http_{status}").lower()] += 1
+
+    began = clock()
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="replay") as pool:
+        for index, record in enumerate(records, start=1):
+            delay = (record.at - origin) / speed - (clock() - began)
+            if delay > 0:
+                sleep(delay)
+            seed = 0 if record.outcome == "cached" else index
+            body: dict[str, object] = {"text": synthetic_text(record.chars, record.sentences, seed)}
+            if keep_voices:
+                body.update({"voice": record.voice, "model": record.model})
+            if record.deadline is not None:
+                body["deadline_seconds"] = record.deadline
+            result.requests += 1
+            pool.submit(send, body)
+    result.span_seconds = clock() - began
+    return result
+
+
+class SyntheticTTS:
+    def __init__(self, intercept: float, seconds_per_char: float, speed: float = 1.0) -> None:
+        self.intercept = intercept
+        self.seconds_per_char = seconds_per_char
+        self.speed = speed
+
+    def tts_to_file(self, *, text: str, file_path: str, speaker: str | None = None) -> None:
+        time.sleep((self.intercept + self.seconds_per_char * len(text)) / self.speed)
+        output = io.BytesIO()
+        with wave.open(output, "wb") as writer:
+            writer.setnchannels(1)
+            writer.setsampwidth(2)
+            writer.setframerate(SYNTHETIC_FRAME_RATE)
+            writer.writeframes(b"\x00\x00" * int(SYNTHETIC_FRAME_RATE * SYNTHETIC_SECONDS_PER_CHAR * len(text)))
+        Path(file_path).write_bytes(output.getvalue())
+
+
+def format_table(results: Iterable[ReplayResult]) -> str:
+    lines = []
+    for result in results:
+        summary = result.summary()
+        outcomes = " ".join(f"{name}={count}" for name, count in sorted(result.outcomes.items()))
+        lines.append(
+            f"{summary['label']}: requests={summary['requests']} {outcomes} "
+            f"p50={summary['p50_seconds']}s p95={summary['p95_seconds']}s max={summary['max_seconds']}s "
+            f"utilization={summary['utilization']}"
+        )
+    return "\n".join(lines)
+
+
+def _report(results: list[ReplayResult], as_json: bool) -> None:
+    if as_json:
+        for result in results:
+            print(json.dumps(result.summary(), sort_keys=True))
+    else:
+        print(format_table(results))
+
+
+def _serve(arguments: argparse.Namespace) -> int:  # pragma: no cover - starts a real server
+    import uvicorn
+
+    from app import ServiceConfig, create_app
+
+    intercept, slope = arguments.intercept, arguments.seconds_per_char
+    if arguments.trace:
+        intercept, slope = fit_latency(load_trace(arguments.trace))
+    backend = SyntheticTTS(intercept, slope, arguments.speed)
+    application = create_app(config=ServiceConfig.from_environment(), model_loader=lambda _config: backend)
+    uvicorn.run(application, host=arguments.host, port=arguments.port, workers=1, access_log=False)
+    return 0
+
+
+def _positive_int(raw: str) -> int:
+    value = int(raw)
+    if value <= 0:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return value
+
+
+def _positive_float(raw: str) -> float:
+    value = float(raw)
+    if not math.isfinite(value) or value <= 0:
+        raise argparse.ArgumentTypeError("must be a positive finite number")
+    return value
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Replay an anonymized TTS request trace (TRACE_PATH).")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    simulate_parser = commands.add_parser("simulate", help="Model the trace under alternative settings.")
+    simulate_parser.add_argument("trace")
+    simulate_parser.add_argument("--queue-capacity", type=_positive_int, nargs="+", default=[16])
+    simulate_parser.add_argument("--workers", type=_positive_int, nargs="+", default=[1])
+    simulate_parser.add_argument("--timeout", type=_positive_float, nargs="+", default=[120.0])
+    simulate_parser.add_argument("--queue-work-seconds", type=_positive_float, default=60.0)
+    simulate_parser.add_argument("--json", action="store_true")
+
+    drive_parser = commands.add_parser("drive", help="Send the trace to a running instance.")
+    drive_parser.add_argument("trace")
+    drive_parser.add_argument("--url", default=DEFAULT_URL)
+    drive_parser.add_argument("--speed", type=_positive_float, default=1.0)
+    drive_parser.add_argument("--concurrency", type=_positive_int, default=64)
+    drive_parser.add_argument("--request-timeout", type=_positive_float, default=300.0)
+    drive_parser.add_argument("--ignore-voices", action="store_true")
+    drive_parser.add_argument("--json", action="store_true")
+
+    serve_parser = commands.add_parser("serve", help="Run the service with a synthetic latency-model backend.")
+    serve_parser.add_argument("--trace", help="Fit the synthetic latency from this trace.")
+    serve_parser.add_argument("--intercept", type=float, default=0.1)
+    serve_parser.add_argument("--seconds-per-char", type=float, default=DEFAULT_SECONDS_PER_CHAR)
+    serve_parser.add_argument("--speed", type=_positive_float, default=1.0)
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=5002)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    arguments = build_parser().parse_args(argv)
+    if arguments.command == "serve":
+        return _serve(arguments)
+    try:
+        records = load_trace(arguments.trace)
+    except (OSError, ValueError) as error:
+        print(error, file=sys.stderr)
+        return 1
+    if arguments.command == "simulate":
+        latency = fit_latency(records)
+        results = [
+            simulate(records, Scenario(capacity, workers, timeout, arguments.queue_work_seconds), latency)
+            for capacity, workers, timeout in itertools.product(
+                arguments.queue_capacity, arguments.workers, arguments.timeout
+            )
+        ]
+    else:
+        results = [
+            drive(
+                records,
+                lambda body: post_tts(arguments.url, body, arguments.request_timeout),
+                speed=arguments.speed,
+                concurrency=arguments.concurrency,
+                keep_voices=not arguments.ignore_voices,
+            )
+        ]
+    _report(results, arguments.json)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
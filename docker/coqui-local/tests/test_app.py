@@ -1,16 +1,23 @@
 from __future__ import annotations
 
+import io
+import json
 import os
+import sys
 import threading
 import time
+import wave
+from collections import Counter
 from concurrent.futures import Future
 from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
+from starlette.requests import HTTPConnection
+from starlette.websockets import WebSocketDisconnect
 
 import app as app_module
-from app import InvalidVoiceError, ServiceConfig, SynthesisRuntime, create_app
+from app import InferenceProcessError, InvalidVoiceError, ServiceConfig, SynthesisRuntime, create_app
 
 
 class FakeTTS:
@@ -34,6 +41,33 @@ class FakeTTS:
                 self.active -= 1
 
 
+def wav_bytes(frame_count: int, *, frame_rate: int = 1000, sample: bytes = b"\x01\x00") -> bytes:
+    output = io.BytesIO()
+    with wave.open(output, "wb") as writer:
+        writer.setnchannels(1)
+        writer.setsampwidth(2)
+        writer.setframerate(frame_rate)
+        writer.writeframes(sample * frame_count)
+    return output.getvalue()
+
+
+class WavTTS(FakeTTS):
+    def tts_to_file(self, *, text: str, file_path: str, speaker: str | None = None) -> None:
+        self.calls.append({"text": text, "speaker": speaker})
+        Path(file_path).write_bytes(wav_bytes(len(text)))
+
+
+class HangingTTS(FakeTTS):
+    def tts_to_file(self, *, text: str, file_path: str, speaker: str | None = None) -> None:
+        if "hang" in text:
+            time.sleep(60)
+        if "crash" in text:
+            os._exit(1)
+        if "fail" in text:
+            raise RuntimeError("backend failure")
+        super().tts_to_file(text=text, file_path=file_path, speaker=speaker)
+
+
 class FailingTTS(FakeTTS):
     def tts_to_file(self, *, text: str, file_path: str, speaker: str | None = None) -> None:
         raise RuntimeError("backend failure")
@@ -67,6 +101,14 @@ class SubmitFailExecutor:
         return None
 
 
+class IdleExecutor:
+    def submit(self, *_args: object, **_kwargs: object) -> Future[str]:
+        return Future()
+
+    def shutdown(self, **_kwargs: object) -> None:
+        return None
+
+
 def config(**overrides: object) -> ServiceConfig:
     values: dict[str, object] = {
         "model_name": "fake-model",
@@ -100,6 +142,23 @@ def wait_until(predicate: object, timeout: float = 2.0) -> None:
         ("SYNTH_TIMEOUT_SECONDS", "0"),
         ("SYNTH_TIMEOUT_SECONDS", "nan"),
         ("SYNTH_TIMEOUT_SECONDS", "inf"),
+        ("AUDIO_CACHE_MAX_BYTES", "-1"),
+        ("SYNTH_QUEUE_WORK_SECONDS", "0"),
+        ("SYNTH_COST_SECONDS_PER_CHAR", "nan"),
+        ("SENTENCE_SILENCE_MS", "bad"),
+        ("INFERENCE_ISOLATION", "fiber"),
+        ("INFERENCE_HARD_TIMEOUT_SECONDS", "0"),
+        ("INFERENCE_STANDBY", "maybe"),
+        ("LIVENESS_STALL_MULTIPLIER", "0"),
+        ("INFERENCE_RECYCLE_AFTER_JOBS", "-1"),
+        ("CLIENT_RATE_PER_SECOND", "-1"),
+        ("CLIENT_RATE_PER_SECOND", "inf"),
+        ("CLIENT_BURST", "0"),
+        ("TARGET_FIRST_AUDIO_SECONDS", "0"),
+        ("POSTPROCESS", "sometimes"),
+        ("LOUDNESS_TARGET_DBFS", "3"),
+        ("TRACE_MAX_BYTES", "-1"),
+        ("LONG_TEXT_MAX_IN_FLIGHT", "0"),
         ("COQUI_MODEL", ""),
     ],
 )
@@ -126,7 +185,11 @@ def test_liveness_readiness_and_voices_report_queue_state() -> None:
         assert client.get("/api/ping").json() == {"ok": True}
         ready = client.get("/api/ready")
         assert ready.status_code == 200
-        assert ready.json() == {
+        startup = ready.json().pop("startup")
+        assert startup["runtime_start_seconds"] >= 0 and startup["app_module_seconds"] > 0
+        assert startup["process_ready_seconds"] >= startup["before_app_import_seconds"] >= 0
+        assert "TTS" not in startup["heavy_modules_loaded"]
+        assert {key: value for key, value in ready.json().items() if key != "startup"} == {
             "ok": True,
             "ready": True,
             "accepting_requests": True,
@@ -135,10 +198,68 @@ def test_liveness_readiness_and_voices_report_queue_state() -> None:
             "active_inference": 0,
             "queued_futures": 0,
             "timed_out_running": 0,
+            "estimated_wait_seconds": 0.0,
         }
         assert client.get("/api/voices").json() == {"voices": ["p225", "p226"]}
 
 
+def test_voice_catalog_reports_metadata_measured_performance_and_validators() -> None:
+    backend = WavTTS()
+    application = create_app(
+        config=config(model_name="tts_models/en/vctk/vits"), model_loader=lambda _config: backend
+    )
+
+    with TestClient(application) as client:
+        listing = client.get("/api/voices")
+        assert listing.json() == {"voices": ["p225", "p226"]}
+        assert listing.headers["cache-control"] == app_module.VOICE_LIST_CACHE_CONTROL
+        assert client.get("/api/voices", headers={"If-None-Match": listing.headers["etag"]}).status_code == 304
+
+        empty = client.get("/api/voices/catalog").json()
+        assert empty["model"] == "tts_models/en/vctk/vits" and empty["default_voice"] == "p225"
+        assert empty["voices"][1] == {
+            "name": "p226",
+            "language": "en",
+            "sample_rate": None,
+            "observations": 0,
+            "real_time_factor": None,
+            "p95_seconds": None,
+        }
+
+        assert client.post("/api/tts", json={"text": "Hello there. Again.", "voice": "p226"}).status_code == 200
+        catalog = client.get("/api/voices/catalog")
+        assert catalog.headers["cache-control"] == app_module.VOICE_CATALOG_CACHE_CONTROL
+        p225, p226 = catalog.json()["voices"]
+        assert p225["observations"] == 0
+        assert (p226["sample_rate"], p226["observations"]) == (1000, 2)
+        assert p226["real_time_factor"] > 0 and p226["p95_seconds"] > 0
+        assert client.get("/api/voices/catalog", headers={"If-None-Match": catalog.headers["etag"]}).status_code == 304
+        assert client.get("/api/voices/catalog", params={"model": "missing"}).status_code == 400
+
+    assert app_module.model_language("tts_models/multilingual/multi-dataset/xtts_v2") is None
+    assert app_module.model_language("tts_models/de/thorsten/vits") == "de"
+
+
+def test_voice_performance_uses_recent_window_for_rtf_and_p95() -> None:
+    performance = app_module.VoicePerformance(window=20)
+    key = ("fake-model", "p225")
+    for index in range(40):
+        performance.observe(key, 0.1 * (index % 20 + 1), wav_bytes(1000))
+    performance.observe(key, float("nan"), wav_bytes(1000))
+    profile = performance.profile(key, "p225", "en")
+    assert profile.observations == 20
+    assert profile.sample_rate == 1000
+    assert profile.p95_seconds == pytest.approx(1.9)
+    assert profile.real_time_factor == pytest.approx(1.05)
+
+    performance.observe(("fake-model", "p226"), 0.5, b"RIFFnot-a-wave")
+    opaque = performance.profile(("fake-model", "p226"), "p226", None)
+    assert (opaque.observations, opaque.sample_rate, opaque.real_time_factor) == (1, None, None)
+    assert opaque.p95_seconds == 0.5
+    model = app_module.LoadedModel("fake-model", FakeTTS(), ("p225", "p226"), 0.0, 0)
+    assert model.voice_index == frozenset({"p225", "p226"})
+
+
 def test_synthesis_returns_audio_and_cleans_temp_file() -> None:
     backend = FakeTTS()
     application = create_app(config=config(), model_loader=lambda _config: backend)
@@ -235,7 +356,7 @@ def test_queue_is_bounded_model_inference_never_overlaps_and_readiness_saturates
 def test_timeout_remains_visible_until_underlying_work_finishes() -> None:
     backend = BlockingTTS()
     application = create_app(
-        config=config(queue_capacity=1, synthesis_timeout_seconds=0.01),
+        config=config(queue_capacity=1, synthesis_timeout_seconds=0.01, cost_seconds_per_char=0.0001),
         model_loader=lambda _config: backend,
     )
 
@@ -249,12 +370,99 @@ def test_timeout_remains_visible_until_underlying_work_finishes() -> None:
         assert client.get("/api/ready").status_code == 503
 
         backend.release.set()
-        wait_until(lambda: application.state.runtime.tracked_temp_paths() == ())
         wait_until(lambda: application.state.runtime.metrics().slots_in_use == 0)
         assert application.state.runtime.metrics().timed_out_running == 0
+        assert application.state.runtime.metrics().retained_results == 1
         assert client.get("/api/ready").status_code == 200
 
 
+@pytest.mark.parametrize(
+    ("text", "kills", "respawns"), [("Please hang.", 1, 1), ("Please crash.", 0, 1), ("Please fail.", 0, 0)]
+)
+def test_process_isolation_recovers_from_hung_and_crashed_inference(text: str, kills: int, respawns: int) -> None:
+    application = create_app(
+        config=config(
+            inference_isolation="process",
+            inference_start_method="fork",
+            inference_hard_timeout_seconds=0.5,
+            synthesis_timeout_seconds=10.0,
+        ),
+        model_loader=lambda _config: HangingTTS(),
+    )
+
+    with TestClient(application) as client:
+        assert client.get("/api/voices").json() == {"voices": ["p225", "p226"]}
+        failed = client.post("/api/tts", json={"text": text, "voice": "p225"})
+        assert failed.status_code == 500
+        assert failed.json()["error"]["code"] == "SYNTHESIS_FAILED"
+
+        recovered = client.post("/api/tts", json={"text": "Hello", "voice": "p225"})
+        assert recovered.status_code == 200
+        assert recovered.content.startswith(b"RIFF")
+        metrics = client.get("/api/metrics").json()
+        assert metrics["inference_isolation"] == "process"
+        assert metrics["inference_kills"] == kills
+        assert metrics["inference_respawns"] == respawns
+        assert (metrics["inference_last_recovery_seconds"] is None) == (respawns == 0)
+        assert metrics["slots_in_use"] == 0
+
+
+@pytest.mark.parametrize("standby", [True, False])
+def test_process_isolation_recycles_worker_after_job_limit_without_dropping_capacity(standby: bool) -> None:
+    application = create_app(
+        config=config(
+            inference_isolation="process",
+            inference_start_method="fork",
+            inference_standby=standby,
+            inference_recycle_after_jobs=2,
+        ),
+        model_loader=lambda _config: HangingTTS(),
+    )
+
+    with TestClient(application) as client:
+        for index in range(6):
+            response = client.post("/api/tts", json={"text": f"Sentence {index}", "voice": "p225"})
+            assert response.status_code == 200
+            if index == 1:
+                wait_until(lambda: application.state.runtime._models.get().backend._standby.done())
+        metrics = client.get("/api/metrics").json()
+        assert metrics["inference_recycles"] >= 2
+        assert metrics["inference_respawns"] == 0
+        assert metrics["inference_jobs"] <= 2
+        assert metrics["inference_rss_bytes"] > 0
+        assert metrics["process_rss_bytes"] > 0
+        event = metrics["inference_recycle_events"][0]
+        assert event["reason"] == "jobs"
+        assert event["jobs"] == 2
+
+
+def test_process_isolation_recycles_worker_above_rss_threshold() -> None:
+    application = create_app(
+        config=config(inference_isolation="process", inference_start_method="fork", inference_recycle_rss_bytes=1),
+        model_loader=lambda _config: HangingTTS(),
+    )
+
+    with TestClient(application) as client:
+        wait_until(lambda: application.state.runtime._models.get().backend._standby.done())
+        assert client.post("/api/tts", json={"text": "Hello", "voice": "p225"}).status_code == 200
+        metrics = client.get("/api/metrics").json()
+        assert metrics["inference_recycles"] >= 1
+        assert {event["reason"] for event in metrics["inference_recycle_events"]} == {"rss"}
+
+
+def test_process_isolation_startup_failure_leaves_service_not_ready() -> None:
+    def broken_loader(_config: ServiceConfig) -> FakeTTS:
+        raise RuntimeError("model missing")
+
+    application = create_app(
+        config=config(inference_isolation="process", inference_start_method="fork"),
+        model_loader=broken_loader,
+    )
+    with pytest.raises(InferenceProcessError, match="model missing"):
+        with TestClient(application):
+            pass
+
+
 @pytest.mark.parametrize("failure", ["mkstemp", "close", "submit"])
 def test_pre_submit_failures_restore_queue_capacity(
     monkeypatch: pytest.MonkeyPatch,
@@ -265,7 +473,9 @@ def test_pre_submit_failures_restore_queue_capacity(
     runtime.start()
 
     if failure == "mkstemp":
-        monkeypatch.setattr(app_module.tempfile, "mkstemp", lambda **_kwargs: (_ for _ in ()).throw(OSError("disk full")))
+        monkeypatch.setattr(
+            app_module.tempfile, "mkstemp", lambda **_kwargs: (_ for _ in ()).throw(OSError("disk full"))
+        )
     elif failure == "close":
         real_close = os.close
 
@@ -311,6 +521,50 @@ def test_cleanup_failure_remains_tracked_until_retry_succeeds(monkeypatch: pytes
     runtime.shutdown()
 
 
+def test_liveness_fails_when_active_job_stops_making_progress() -> None:
+    backend = BlockingTTS()
+    application = create_app(
+        config=config(liveness_stall_multiplier=1.0, liveness_min_stall_seconds=0.05),
+        model_loader=lambda _config: backend,
+    )
+
+    with TestClient(application) as client:
+        live = client.get("/api/live")
+        assert live.status_code == 200
+        assert live.json()["alive"] is True
+        assert live.json()["progress_age_seconds"] is None
+
+        assert client.post("/api/jobs", json={"text": "Slow", "voice": "p225"}).status_code == 202
+        assert backend.started.wait(timeout=2)
+        wait_until(lambda: client.get("/api/live").status_code == 503)
+        stalled = client.get("/api/live").json()["error"]
+        assert stalled["code"] == "INFERENCE_STALLED"
+        assert stalled["progress_age_seconds"] > stalled["stall_limit_seconds"]
+        assert client.get("/api/metrics").json()["liveness"]["reason"] == "INFERENCE_STALLED"
+
+        backend.release.set()
+        wait_until(lambda: client.get("/api/live").status_code == 200)
+
+
+def test_liveness_fails_when_queued_work_is_never_picked_up() -> None:
+    application = create_app(
+        config=config(liveness_min_stall_seconds=0.05),
+        model_loader=lambda _config: FakeTTS(),
+    )
+
+    with TestClient(application) as client:
+        application.state.runtime._executor = IdleExecutor()
+        assert client.post("/api/jobs", json={"text": "Queued", "voice": "p225"}).status_code == 202
+        wait_until(lambda: client.get("/api/live").status_code == 503)
+        error = client.get("/api/live").json()["error"]
+        assert error["code"] == "WORKER_NOT_DRAINING"
+        assert error["oldest_queued_seconds"] > 0.05
+        assert error["heartbeat_age_seconds"] > 0.05
+
+        application.state.runtime._heartbeat = time.monotonic()
+        assert application.state.runtime.liveness().alive is True
+
+
 def test_shutdown_returns_with_blocked_inference_and_work_finishes_later() -> None:
     backend = BlockingTTS()
     runtime = SynthesisRuntime(config(queue_capacity=1), lambda _config: backend)
@@ -331,7 +585,9 @@ def test_shutdown_returns_with_blocked_inference_and_work_finishes_later() -> No
 def test_unexpected_error_uses_stable_generic_envelope(monkeypatch: pytest.MonkeyPatch) -> None:
     application = create_app(config=config(), model_loader=lambda _config: FakeTTS())
     with TestClient(application, raise_server_exceptions=False) as client:
-        monkeypatch.setattr(application.state.runtime, "metrics", lambda: (_ for _ in ()).throw(RuntimeError("secret path")))
+        monkeypatch.setattr(
+            application.state.runtime, "metrics", lambda: (_ for _ in ()).throw(RuntimeError("secret path"))
+        )
         response = client.get("/api/ready")
         assert response.status_code == 500
         assert response.json() == {
@@ -435,6 +691,7 @@ def test_missing_or_empty_backend_output_is_generic_and_cleaned(backend: FakeTTS
         {"json": {}},
         {"json": {"text": 3}},
         {"json": {"text": "Hello", "voice": 3}},
+        {"json": {"text": "Hello", "deadline_seconds": 0}},
     ],
 )
 def test_invalid_request_shapes_use_stable_envelope(request_kwargs: dict[str, object]) -> None:
@@ -504,7 +761,7 @@ def test_accounting_invariants_fail_closed() -> None:
     runtime.start()
 
     runtime._slots_in_use = runtime.config.queue_capacity
-    with pytest.raises(RuntimeError, match="exceeded capacity"):
+    with pytest.raises(OverflowError, match="queue is full"):
         runtime._acquire_slot()
     assert runtime._slots_in_use == runtime.config.queue_capacity
 
@@ -514,5 +771,1821 @@ def test_accounting_invariants_fail_closed() -> None:
 
     runtime._queued_futures = 0
     with pytest.raises(RuntimeError, match="Queued synthesis accounting became negative"):
-        runtime._run_synthesis(FakeTTS(), "Hello", "p225", "/tmp/unused.wav")
+        runtime._run_synthesis(runtime._models.get(), "Hello", "p225", "/tmp/unused.wav")
     runtime.shutdown()
+
+
+def test_sentence_segmentation_keeps_abbreviations_and_normalizes_whitespace() -> None:
+    text = 'Dr. Smith met J. Doe  at noon. "Really?" she asked!  It was\nlate'
+    assert app_module.segment_sentences(text) == [
+        "Dr. Smith met J. Doe at noon.",
+        '"Really?"',
+        "she asked!",
+        "It was late",
+    ]
+    assert app_module.segment_sentences("No boundary here") == ["No boundary here"]
+
+
+def test_stitching_inserts_consistent_silence_and_rejects_mixed_formats() -> None:
+    stitched = app_module.stitch_wav([wav_bytes(3), wav_bytes(2)], silence_ms=10)
+    audio_format, frames = app_module.read_pcm_wav(stitched)
+    assert audio_format == (1, 2, 1000)
+    assert frames == b"\x01\x00" * 3 + b"\x00\x00" * 10 + b"\x01\x00" * 2
+    assert app_module.stitch_wav([b"single"], silence_ms=10) == b"single"
+    with pytest.raises(ValueError):
+        app_module.stitch_wav([wav_bytes(1), wav_bytes(1, frame_rate=2000)], silence_ms=10)
+    with pytest.raises(ValueError):
+        app_module.stitch_wav([], silence_ms=10)
+
+
+def test_sentence_cache_reuses_audio_across_differently_packed_chunks() -> None:
+    backend = WavTTS()
+    application = create_app(config=config(sentence_silence_ms=0), model_loader=lambda _config: backend)
+
+    with TestClient(application) as client:
+        first = client.post("/api/tts", json={"text": "One. Two.", "voice": "p225"})
+        second = client.post("/api/tts", json={"text": "Two. Three.", "voice": "p225"})
+        assert first.status_code == 200
+        assert second.status_code == 200
+        assert [call["text"] for call in backend.calls] == ["One.", "Two.", "Three."]
+        assert app_module.read_pcm_wav(second.content)[1] == b"\x01\x00" * len("Two.Three.")
+
+        metrics = client.get("/api/metrics").json()
+        assert metrics["sentence_cache_hits"] == 1
+        assert metrics["sentence_cache_misses"] == 3
+        assert metrics["sentence_cache_hit_rate"] == 0.25
+        assert metrics["request_cache_hits"] == 0
+        assert metrics["audio_cache_entries"] == 3
+        assert application.state.runtime.tracked_temp_paths() == ()
+
+
+def test_fully_cached_request_is_served_without_queue_or_tempfile(monkeypatch: pytest.MonkeyPatch) -> None:
+    backend = WavTTS()
+    application = create_app(config=config(), model_loader=lambda _config: backend)
+
+    with TestClient(application) as client:
+        assert client.post("/api/tts", json={"text": "One. Two.", "voice": "p225"}).status_code == 200
+        monkeypatch.setattr(
+            application.state.runtime,
+            "submit",
+            lambda *_args: (_ for _ in ()).throw(AssertionError("cache hit must not be queued")),
+        )
+        cached = client.post("/api/tts", json={"text": "Two.  One.", "voice": "p225"})
+        assert cached.status_code == 200
+        assert cached.headers["content-type"].startswith("audio/wav")
+        assert len(backend.calls) == 2
+
+        metrics = client.get("/api/metrics").json()
+        assert metrics["request_cache_hits"] == 1
+        assert metrics["request_cache_misses"] == 1
+        assert metrics["request_cache_hit_rate"] == 0.5
+        assert metrics["sentence_cache_hits"] == 2
+
+
+def test_disabled_audio_cache_synthesizes_every_request() -> None:
+    backend = WavTTS()
+    application = create_app(config=config(audio_cache_max_bytes=0), model_loader=lambda _config: backend)
+
+    with TestClient(application) as client:
+        for _ in range(2):
+            assert client.post("/api/tts", json={"text": "Hello.", "voice": "p226"}).status_code == 200
+        assert len(backend.calls) == 2
+        assert client.get("/api/metrics").json()["audio_cache_entries"] == 0
+
+
+def test_long_text_is_segmented_pipelined_and_assembled_in_order() -> None:
+    backend = WavTTS()
+    application = create_app(
+        config=config(max_text_chars=40, queue_capacity=1, sentence_silence_ms=0, max_long_text_chars=400),
+        model_loader=lambda _config: backend,
+    )
+    sentences = [f"Sentence number {index} of the section." for index in range(6)]
+    text = " ".join(sentences)
+    runtime = application.state.runtime
+    queued: list[int] = []
+    original_submit = runtime.submit
+
+    def submit(*args: object, **kwargs: object) -> tuple[object, str]:
+        queued.append(runtime.metrics().slots_in_use)
+        return original_submit(*args, **kwargs)
+
+    with TestClient(application) as client:
+        runtime.submit = submit
+        response = client.post("/api/tts/long", json={"text": text, "voice": "p226"})
+        assert response.status_code == 200
+        assert response.headers["x-segment-count"] == "6"
+        assert [call["text"] for call in backend.calls] == sentences
+        assert max(queued) <= 1
+        _format, frames = app_module.read_pcm_wav(response.content)
+        assert len(frames) == 2 * sum(len(sentence) for sentence in sentences)
+
+        streamed = client.post("/api/tts/long", json={"text": text, "voice": "p226", "stream": True})
+        assert streamed.status_code == 200
+        assert streamed.content[4:8] == streamed.content[40:44] == b"\xff\xff\xff\xff"
+        assert streamed.content[44:] == response.content[44:]
+        assert len(backend.calls) == 6
+
+        metrics = client.get("/api/metrics").json()
+        assert (metrics["long_text_requests"], metrics["long_text_segments"]) == (2, 12)
+        assert runtime.tracked_temp_paths() == ()
+
+        assert client.post("/api/tts/long", json={"text": "x. " * 200}).json()["error"]["code"] == "TEXT_TOO_LONG"
+        assert client.post("/api/tts/long", json={"text": "  "}).json()["error"]["code"] == "EMPTY_TEXT"
+        invalid = client.post("/api/tts/long", json={"text": text, "voice": "nobody"})
+        assert invalid.json()["error"]["code"] == "INVALID_VOICE"
+
+    disabled = create_app(config=config(max_long_text_chars=0), model_loader=lambda _config: FakeTTS())
+    with TestClient(disabled) as client:
+        assert client.post("/api/tts/long", json={"text": "Hello."}).status_code == 404
+
+
+def test_long_text_failures_reject_fail_or_truncate_without_leaking_files() -> None:
+    class FailingWavTTS(WavTTS):
+        def tts_to_file(self, *, text: str, file_path: str, speaker: str | None = None) -> None:
+            if "fail" in text:
+                raise RuntimeError("backend failure")
+            super().tts_to_file(text=text, file_path=file_path, speaker=speaker)
+
+    application = create_app(
+        config=config(max_text_chars=40, sentence_silence_ms=0), model_loader=lambda _config: FailingWavTTS()
+    )
+    text = "This first segment works fine. This second one will fail. A third never runs at all."
+
+    with TestClient(application) as client:
+        failed = client.post("/api/tts/long", json={"text": text, "voice": "p225"})
+        assert failed.status_code == 500
+        assert failed.json()["error"]["code"] == "SYNTHESIS_FAILED"
+
+        streamed = client.post("/api/tts/long", json={"text": text, "voice": "p225", "stream": True})
+        assert streamed.status_code == 200
+        assert streamed.content[44:] == app_module.read_pcm_wav(wav_bytes(30))[1]
+        wait_until(lambda: application.state.runtime.tracked_temp_paths() == ())
+
+    blocking = BlockingTTS()
+    busy = create_app(config=config(queue_capacity=1), model_loader=lambda _config: blocking)
+    with TestClient(busy) as client:
+        job = client.post("/api/jobs", json={"text": "Occupied.", "voice": "p225"}).json()
+        assert blocking.started.wait(timeout=2)
+        rejected = client.post("/api/tts/long", json={"text": "Queue is full.", "voice": "p225"})
+        assert rejected.status_code == 429
+        assert rejected.json()["error"]["code"] == "QUEUE_FULL"
+        blocking.release.set()
+        assert client.get(f"/api/jobs/{job['job_id']}", params={"wait": 2}).json()["state"] == "completed"
+
+
+def test_long_text_rate_limited_mid_request_reports_the_client_limit() -> None:
+    application = create_app(
+        config=config(
+            max_text_chars=40,
+            sentence_silence_ms=0,
+            long_text_max_in_flight=1,
+            client_rate_per_second=0.01,
+            client_burst=1,
+            trusted_proxies=("testclient",),
+        ),
+        model_loader=lambda _config: WavTTS(),
+    )
+    text = "This first segment is admitted. The second one exceeds the client rate."
+
+    with TestClient(application) as client:
+        started = time.monotonic()
+        rejected = client.post("/api/tts/long", json={"text": text, "voice": "p225"}, headers={"X-Client-Id": "bulk"})
+        assert time.monotonic() - started < 1.0
+        assert rejected.status_code == 429
+        assert rejected.json()["error"]["code"] == "RATE_LIMITED"
+        assert int(rejected.headers["retry-after"]) > 50
+        wait_until(lambda: application.state.runtime.tracked_temp_paths() == ())
+
+
+def test_prewarm_corpus_fills_the_cache_after_readiness(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    corpus = tmp_path / "corpus.txt"
+    corpus.write_text("# Options test sample\nThis is a test.\n\nSkip to content. This is a test.\n")
+    backend = WavTTS()
+    application = create_app(
+        config=config(prewarm_corpus_path=str(corpus), prewarm_voices=("p226", "p225")),
+        model_loader=lambda _config: backend,
+    )
+
+    with TestClient(application) as client:
+        wait_until(lambda: client.get("/api/metrics").json()["prewarm"]["state"] == "completed")
+        prewarm = client.get("/api/metrics").json()["prewarm"]
+        assert (prewarm["sentences"], prewarm["warmed"], prewarm["failed"], prewarm["coverage"]) == (4, 4, 0, 1.0)
+        assert backend.calls == [
+            {"text": "This is a test.", "speaker": "p226"},
+            {"text": "Skip to content.", "speaker": "p226"},
+            {"text": "This is a test.", "speaker": "p225"},
+            {"text": "Skip to content.", "speaker": "p225"},
+        ]
+        monkeypatch.setattr(
+            application.state.runtime,
+            "submit",
+            lambda *_args: (_ for _ in ()).throw(AssertionError("pre-warmed text must not be queued")),
+        )
+        response = client.post("/api/tts", json={"text": "This is a test. Skip to content.", "voice": "p225"})
+        assert response.status_code == 200
+        assert client.get("/api/metrics").json()["request_cache_hits"] == 1
+        assert len(backend.calls) == 4
+
+
+def test_prewarm_waits_for_real_traffic_and_reports_failures(tmp_path: Path) -> None:
+    corpus = tmp_path / "corpus.txt"
+    corpus.write_text("Cached already.\nWarm me.\nPlease fail.\n")
+    runtime = SynthesisRuntime(config(prewarm_corpus_path=str(corpus)), lambda _config: HangingTTS())
+    runtime._audio_cache.put(("fake-model", "p225", "Cached already."), b"RIFFcached")
+    runtime._slots_in_use = 1
+    runtime.start()
+    try:
+        wait_until(lambda: runtime.prewarm_status()["state"] == "running")
+        time.sleep(0.1)
+        status = runtime.prewarm_status()
+        assert (status["already_cached"], status["warmed"], status["coverage"]) == (1, 0, pytest.approx(1 / 3))
+        assert runtime._run_prewarm(("fake-model", "p225", "Warm me.")) is None
+
+        runtime._slots_in_use = 0
+        wait_until(lambda: runtime.prewarm_status()["state"] == "completed")
+        status = runtime.prewarm_status()
+        assert (status["warmed"], status["failed"], status["coverage"]) == (1, 1, pytest.approx(2 / 3))
+        assert status["finished_at"] >= status["started_at"]
+    finally:
+        runtime.shutdown()
+
+    missing = SynthesisRuntime(config(prewarm_corpus_path=str(tmp_path / "missing.txt")), lambda _config: FakeTTS())
+    missing.start()
+    try:
+        wait_until(lambda: missing.prewarm_status()["state"] == "failed")
+        assert missing.ready and "FileNotFoundError" in str(missing.prewarm_status()["error"])
+    finally:
+        missing.shutdown()
+    assert SynthesisRuntime(config(), lambda _config: FakeTTS()).prewarm_status()["state"] == "disabled"
+
+
+def test_running_prewarm_is_accounted_like_a_job(tmp_path: Path) -> None:
+    corpus = tmp_path / "corpus.txt"
+    corpus.write_text("Warm me.\n")
+    backend = BlockingTTS()
+    runtime = SynthesisRuntime(
+        config(
+            prewarm_corpus_path=str(corpus),
+            cost_seconds_per_char=1.0,
+            liveness_stall_multiplier=0.01,
+            liveness_min_stall_seconds=0.05,
+        ),
+        lambda _config: backend,
+    )
+    runtime.start()
+    try:
+        assert backend.started.wait(timeout=2)
+        assert runtime.metrics().active_inference == 1
+        assert 7.0 < runtime.estimated_wait_seconds() <= 8.0
+        with pytest.raises(app_module.DeadlineUnreachableError):
+            runtime.submit("Hi", "p225", deadline_seconds=5.0)
+
+        wait_until(lambda: runtime.liveness().reason == "INFERENCE_STALLED")
+        assert runtime.liveness().stall_limit_seconds == pytest.approx(0.08)
+
+        backend.release.set()
+        wait_until(lambda: runtime.prewarm_status()["state"] == "completed")
+        assert runtime.metrics().active_inference == 0
+        assert runtime.metrics().queued_work_seconds == 0.0
+        assert runtime.liveness().alive
+    finally:
+        backend.release.set()
+        runtime.shutdown()
+
+
+def test_latency_model_learns_per_voice_fixed_and_per_character_cost() -> None:
+    model = app_module.LatencyModel(prior_seconds_per_char=0.5, decay=1.0)
+    for characters in (10, 20, 40):
+        model.observe(("fake-model", "p225"), characters, 0.1 + 0.1 * characters)
+    model.observe(("fake-model", "p225"), 0, 5.0)
+
+    intercept, slope = model.coefficients(("fake-model", "p225"))
+    assert intercept == pytest.approx(0.1)
+    assert slope == pytest.approx(0.1)
+    assert model.estimate(("fake-model", "p225"), 100) == pytest.approx(10.1)
+    assert model.estimate(("fake-model", "p226"), 100) == pytest.approx(50.0)
+    assert model.estimate(("fake-model", "p225"), 0) == 0.0
+    assert model.snapshot()["fake-model:p225"]["observations"] == 3
+
+
+def test_capabilities_recommend_chunk_sizes_from_the_measured_latency_curve() -> None:
+    application = create_app(
+        config=config(cost_seconds_per_char=0.02, target_first_audio_seconds=5.0),
+        model_loader=lambda _config: FakeTTS(),
+    )
+
+    with TestClient(application) as client:
+        prior = client.get("/api/capabilities").json()
+        assert prior["max_text_chars"] == 500
+        assert prior["chunking"]["voice"] == "p225"
+        assert prior["chunking"]["measured"] is False
+        assert (prior["chunking"]["target_chars"], prior["chunking"]["max_chars"]) == (250, 500)
+
+        latency = application.state.runtime._latency_model
+        for characters in (32, 64, 128):
+            latency.observe(("fake-model", "p226"), characters, 0.5 + characters / 16)
+            latency.observe(("fake-model", "p225"), characters, characters / 1000)
+        slow = client.get("/api/capabilities", params={"voice": "p226"}).json()["chunking"]
+        assert slow["measured"] is True
+        assert 70 <= slow["target_chars"] <= 72
+        assert 150 <= slow["max_chars"] <= 152
+        fast = client.get("/api/capabilities").json()["chunking"]
+        assert (fast["target_chars"], fast["max_chars"]) == (500, 500)
+
+        invalid = client.get("/api/capabilities", params={"voice": "unknown"})
+        assert invalid.status_code == 400
+        assert invalid.json()["error"]["code"] == "INVALID_VOICE"
+
+
+def test_admission_is_weighted_by_estimated_work_not_request_count() -> None:
+    backend = BlockingTTS()
+    runtime = SynthesisRuntime(
+        config(queue_capacity=8, queue_work_seconds=1.0, cost_seconds_per_char=0.01),
+        lambda _config: backend,
+    )
+    runtime.start()
+    first, first_path = runtime.submit("x" * 50, "p225")
+    assert backend.started.wait(timeout=2)
+
+    with pytest.raises(OverflowError):
+        runtime.submit("y" * 60, "p225")
+    short = [runtime.submit(f"Short {index}", "p225") for index in range(3)]
+    metrics = runtime.metrics()
+    assert metrics.slots_in_use == 4
+    assert metrics.queued_work_seconds == pytest.approx(0.5 + 3 * 0.07)
+    assert metrics.accepting_requests is True
+
+    backend.release.set()
+    for future, output_path in [(first, first_path), *short]:
+        assert future.result(timeout=2) == output_path
+        runtime.cleanup_path(output_path)
+    wait_until(lambda: runtime.metrics().slots_in_use == 0)
+    assert runtime.metrics().queued_work_seconds == 0.0
+    assert "fake-model:p225" in runtime.latency_profile()
+    runtime.shutdown()
+
+
+def test_idle_queue_admits_request_larger_than_work_budget_and_cached_sentences_are_free() -> None:
+    backend = WavTTS()
+    runtime = SynthesisRuntime(
+        config(queue_work_seconds=0.1, cost_seconds_per_char=0.01),
+        lambda _config: backend,
+    )
+    runtime.start()
+    future, output_path = runtime.submit("A sentence that costs more than the budget.", "p225")
+    assert future.result(timeout=2) == output_path
+    runtime.cleanup_path(output_path)
+
+    assert runtime._estimate_cost("fake-model", "p225", "A sentence that costs more than the budget.") == 0.0
+    assert runtime._estimate_cost("fake-model", "p226", "A sentence that costs more than the budget.") > 0.1
+    runtime.shutdown()
+
+
+def test_estimated_cost_charges_the_latency_intercept_once_per_sentence() -> None:
+    runtime = SynthesisRuntime(config(), lambda _config: WavTTS())
+    runtime.start()
+    for characters in (10, 20, 40):
+        runtime._latency_model.observe(("fake-model", "p225"), characters, 0.5 + characters * 0.01)
+    sentences = ["One short sentence.", "Another sentence here.", "A third one."]
+
+    cost = runtime._estimate_cost("fake-model", "p225", " ".join(sentences))
+    assert cost == pytest.approx(sum(0.5 + len(sentence) * 0.01 for sentence in sentences))
+    runtime.shutdown()
+
+
+def test_requests_that_cannot_meet_their_deadline_are_shed_with_retry_after() -> None:
+    backend = BlockingTTS()
+    application = create_app(
+        config=config(
+            queue_capacity=4, queue_work_seconds=100.0, cost_seconds_per_char=0.1, synthesis_timeout_seconds=10.0
+        ),
+        model_loader=lambda _config: backend,
+    )
+
+    with TestClient(application) as client:
+        runtime = application.state.runtime
+        first, first_path = runtime.submit("x" * 50, "p225")
+        assert backend.started.wait(timeout=2)
+
+        ready = client.get("/api/ready")
+        assert ready.status_code == 200
+        assert 4.0 < ready.json()["estimated_wait_seconds"] <= 5.0
+
+        shed = client.post("/api/tts", json={"text": "Hi", "voice": "p225", "deadline_seconds": 2})
+        assert shed.status_code == 429
+        assert shed.json()["error"]["code"] == "DEADLINE_UNREACHABLE"
+        assert shed.headers["retry-after"] in {"3", "4"}
+        assert runtime.metrics().deadline_rejections == 1
+        assert runtime.metrics().slots_in_use == 1
+
+        second, second_path = runtime.submit("Hi", "p225", deadline_seconds=10.0)
+        backend.release.set()
+        for future, output_path in ((first, first_path), (second, second_path)):
+            assert future.result(timeout=2) == output_path
+            runtime.cleanup_path(output_path)
+        wait_until(lambda: runtime.metrics().slots_in_use == 0)
+        assert runtime.metrics().service_rate > 1.0
+
+
+def test_idle_queue_still_sheds_a_request_whose_own_cost_exceeds_its_deadline() -> None:
+    backend = WavTTS()
+    runtime = SynthesisRuntime(config(cost_seconds_per_char=0.1), lambda _config: backend)
+    runtime.start()
+
+    with pytest.raises(app_module.DeadlineUnreachableError) as rejected:
+        runtime.submit("x" * 50, "p225", deadline_seconds=2.0)
+    assert rejected.value.retry_after_seconds == pytest.approx(3.0)
+    assert runtime.metrics().deadline_rejections == 1
+    assert runtime.metrics().slots_in_use == 0
+    assert backend.calls == []
+
+    future, output_path = runtime.submit("Hi", "p225", deadline_seconds=2.0)
+    assert future.result(timeout=2) == output_path
+    runtime.cleanup_path(output_path)
+    runtime.shutdown()
+
+
+def test_queue_full_rejections_advertise_retry_after() -> None:
+    backend = BlockingTTS()
+    application = create_app(config=config(queue_capacity=1), model_loader=lambda _config: backend)
+
+    with TestClient(application) as client:
+        future, output_path = application.state.runtime.submit("Busy", "p225")
+        assert backend.started.wait(timeout=2)
+        rejected = client.post("/api/tts", json={"text": "Second", "voice": "p225"})
+        assert rejected.status_code == 429
+        assert int(rejected.headers["retry-after"]) >= 1
+        ready = client.get("/api/ready")
+        assert ready.status_code == 503
+        assert int(ready.headers["retry-after"]) >= 1
+
+        backend.release.set()
+        assert future.result(timeout=2) == output_path
+        application.state.runtime.cleanup_path(output_path)
+
+
+def test_measured_service_rate_scales_estimated_wait() -> None:
+    runtime = SynthesisRuntime(config(), lambda _config: FakeTTS())
+    runtime._observe_service_rate(2.0, 1.0)
+    runtime._observe_service_rate(0.0, 1.0)
+    assert runtime.metrics().service_rate == pytest.approx(1.2)
+    runtime._queued_work_seconds = 6.0
+    assert runtime.estimated_wait_seconds() == pytest.approx(5.0)
+
+
+def test_timed_out_result_is_served_to_identical_retry_without_new_inference() -> None:
+    backend = BlockingTTS()
+    application = create_app(
+        config=config(
+            queue_capacity=2, synthesis_timeout_seconds=0.05, cost_seconds_per_char=0.0001, audio_cache_max_bytes=0
+        ),
+        model_loader=lambda _config: backend,
+    )
+
+    with TestClient(application) as client:
+        runtime = application.state.runtime
+        timed_out = client.post("/api/tts", json={"text": "Slow  retry", "voice": "p225"})
+        assert timed_out.status_code == 504
+        result_key = timed_out.json()["error"]["result_key"]
+        assert result_key == runtime.result_key("Slow retry", "p225")
+
+        pending = client.get(f"/api/results/{result_key}")
+        assert pending.status_code == 409
+        assert pending.json()["error"]["code"] == "RESULT_PENDING"
+
+        backend.release.set()
+        wait_until(lambda: runtime.metrics().slots_in_use == 0)
+        retry = client.post("/api/tts", json={"text": "Slow retry", "voice": "p225"})
+        assert retry.status_code == 200
+        assert retry.content == b"RIFFblocked-wave"
+        assert len(backend.calls) == 1
+        assert runtime.metrics().retained_result_hits == 1
+        assert runtime.metrics().retained_results == 0
+        assert runtime.tracked_temp_paths() == ()
+        assert client.get(f"/api/results/{result_key}").json()["error"]["code"] == "RESULT_NOT_FOUND"
+
+
+def test_retry_joins_running_timed_out_job_and_result_key_endpoint_serves_it() -> None:
+    backend = BlockingTTS()
+    application = create_app(
+        config=config(queue_capacity=2, synthesis_timeout_seconds=0.05, cost_seconds_per_char=0.0001),
+        model_loader=lambda _config: backend,
+    )
+
+    with TestClient(application) as client:
+        runtime = application.state.runtime
+        first = client.post("/api/tts", json={"text": "Joined", "voice": "p225"})
+        second = client.post("/api/tts", json={"text": "Joined", "voice": "p225"})
+        assert first.status_code == 504
+        assert second.status_code == 504
+        assert second.json()["error"]["result_key"] == first.json()["error"]["result_key"]
+        assert runtime.metrics().slots_in_use == 1
+
+        backend.release.set()
+        wait_until(lambda: runtime.metrics().slots_in_use == 0)
+        fetched = client.get(f"/api/results/{first.json()['error']['result_key']}")
+        assert fetched.status_code == 200
+        assert fetched.content == b"RIFFblocked-wave"
+        assert len(backend.calls) == 1
+
+
+def test_retained_results_expire_and_failed_jobs_are_not_retained() -> None:
+    backend = BlockingTTS()
+    runtime = SynthesisRuntime(config(timed_out_result_ttl_seconds=0.05), lambda _config: backend)
+    runtime.start()
+    future, output_path = runtime.submit("Expiring", "p225")
+    runtime.mark_timed_out(future)
+    runtime.retain_result("expiring", future, output_path)
+    backend.release.set()
+    assert future.result(timeout=2) == output_path
+    assert runtime.tracked_temp_paths() == (output_path,)
+    time.sleep(0.06)
+    runtime.sweep_retained_results()
+    assert runtime.claim_result("expiring") is None
+    assert runtime.tracked_temp_paths() == ()
+
+    failed: Future[str] = Future()
+    runtime.retain_result("failed", failed, output_path)
+    failed.set_exception(RuntimeError("backend failure"))
+    assert runtime.has_retained_result("failed") is False
+    runtime.shutdown()
+
+
+def test_duplicate_timed_out_results_keep_the_first_entry_and_drop_the_other_output() -> None:
+    backend = BlockingTTS()
+    runtime = SynthesisRuntime(config(queue_capacity=3), lambda _config: backend)
+    runtime.start()
+    running, running_path = runtime.submit("Twice", "p225")
+    assert backend.started.wait(timeout=2)
+    queued, queued_path = runtime.submit("Twice", "p225")
+    spare, spare_path = runtime.submit("Twice", "p225")
+
+    runtime.retain_result("twice", queued, queued_path)
+    runtime.retain_result("twice", spare, spare_path)
+    assert spare.cancelled()
+    runtime.retain_result("twice", running, running_path)
+    assert not running.cancelled()
+
+    backend.release.set()
+    assert queued.result(timeout=2) == queued_path
+    wait_until(lambda: runtime.tracked_temp_paths() == (queued_path,))
+    assert runtime.claim_result("twice", completed_only=True) == (queued, queued_path)
+    runtime.cleanup_path(queued_path)
+    runtime.shutdown()
+
+
+def test_job_api_reports_queue_positions_and_serves_audio_when_complete() -> None:
+    backend = BlockingTTS()
+    application = create_app(config=config(), model_loader=lambda _config: backend)
+
+    with TestClient(application) as client:
+        submitted = [client.post("/api/jobs", json={"text": f"Job {index}", "voice": "p225"}) for index in range(3)]
+        assert [response.status_code for response in submitted] == [202, 202, 202]
+        job_ids = [response.json()["job_id"] for response in submitted]
+        assert backend.started.wait(timeout=2)
+
+        statuses = [client.get(f"/api/jobs/{job_id}").json() for job_id in job_ids]
+        assert [(status["state"], status["queue_position"]) for status in statuses] == [
+            ("running", None),
+            ("queued", 0),
+            ("queued", 1),
+        ]
+        pending = client.get(f"/api/jobs/{job_ids[0]}/audio")
+        assert pending.status_code == 409
+        assert pending.json()["error"]["code"] == "JOB_PENDING"
+
+        backend.release.set()
+        last = client.get(f"/api/jobs/{job_ids[2]}", params={"wait": 2}).json()
+        assert last["state"] == "completed"
+        assert last["audio_url"] == f"/api/jobs/{job_ids[2]}/audio"
+        for job_id in job_ids:
+            audio = client.get(f"/api/jobs/{job_id}/audio")
+            assert audio.status_code == 200
+            assert audio.content == b"RIFFblocked-wave"
+        assert client.get("/api/metrics").json()["retained_jobs"] == 3
+        assert client.get("/api/jobs/unknown").json()["error"]["code"] == "JOB_NOT_FOUND"
+
+
+def test_job_api_completes_cached_requests_immediately_and_reports_failures() -> None:
+    backend = WavTTS()
+    application = create_app(config=config(), model_loader=lambda _config: backend)
+
+    with TestClient(application) as client:
+        assert client.post("/api/tts", json={"text": "Cached.", "voice": "p225"}).status_code == 200
+        cached = client.post("/api/jobs", json={"text": "Cached.", "voice": "p225"}).json()
+        assert cached["state"] == "completed"
+        assert client.get(cached["audio_url"]).content.startswith(b"RIFF")
+        assert len(backend.calls) == 1
+
+        invalid = client.post("/api/jobs", json={"text": "Hello", "voice": "missing"})
+        assert invalid.json()["error"]["code"] == "INVALID_VOICE"
+
+    failing = create_app(config=config(), model_loader=lambda _config: FailingTTS())
+    with TestClient(failing) as client:
+        job_id = client.post("/api/jobs", json={"text": "Broken", "voice": "p225"}).json()["job_id"]
+        status = client.get(f"/api/jobs/{job_id}", params={"wait": 2}).json()
+        assert status["state"] == "failed"
+        assert status["error"]["code"] == "SYNTHESIS_FAILED"
+        assert client.get(f"/api/jobs/{job_id}/audio").status_code == 500
+        wait_until(lambda: failing.state.runtime.tracked_temp_paths() == ())
+
+
+def test_job_retention_is_bounded_and_evicted_results_are_cleaned() -> None:
+    backend = FakeTTS()
+    application = create_app(config=config(max_retained_jobs=1), model_loader=lambda _config: backend)
+
+    with TestClient(application) as client:
+        first = client.post("/api/jobs", json={"text": "First", "voice": "p225"}).json()["job_id"]
+        assert client.get(f"/api/jobs/{first}", params={"wait": 2}).json()["state"] == "completed"
+        second = client.post("/api/jobs", json={"text": "Second", "voice": "p225"}).json()["job_id"]
+        assert client.get(f"/api/jobs/{second}", params={"wait": 2}).json()["state"] == "completed"
+
+        assert client.get(f"/api/jobs/{first}").status_code == 404
+        assert len(application.state.runtime.tracked_temp_paths()) == 1
+    assert application.state.runtime.tracked_temp_paths() == ()
+
+
+def test_expired_jobs_are_swept() -> None:
+    runtime = SynthesisRuntime(config(), lambda _config: FakeTTS())
+    runtime.start()
+    registry = app_module.JobRegistry(runtime, ttl_seconds=0.01, max_jobs=4)
+    future, output_path = runtime.submit("Hello", "p225")
+    job = registry.add(future, output_path)
+    assert future.result(timeout=2) == output_path
+    wait_until(lambda: job.completed_at is not None)
+    time.sleep(0.02)
+    assert registry.get(job.job_id) is None
+    assert runtime.tracked_temp_paths() == ()
+    runtime.shutdown()
+
+
+def test_document_packing_respects_paragraphs_targets_and_hard_limits() -> None:
+    text = "One. Two. Three.\n\nFour is here. " + "word " * 6 + "\n\n" + "x" * 12
+    assert app_module.pack_chunks(text, target_chars=10, max_chars=12) == [
+        "One. Two.",
+        "Three.",
+        "Four is",
+        "here.",
+        "word word",
+        "word word",
+        "word word",
+        "x" * 12,
+    ]
+    assert app_module.pack_chunks("y" * 25, target_chars=10, max_chars=10) == ["y" * 10, "y" * 10, "y" * 5]
+
+
+def test_session_reads_ahead_within_lookahead_and_follows_fetch_position() -> None:
+    backend = BlockingTTS()
+    application = create_app(
+        config=config(session_target_chunk_chars=8, session_lookahead_chunks=2, queue_capacity=8),
+        model_loader=lambda _config: backend,
+    )
+
+    with TestClient(application) as client:
+        created = client.post("/api/sessions", json={"text": "One. Two. Three. Four. Five.", "voice": "p225"})
+        assert created.status_code == 201
+        session = created.json()
+        assert session["chunks"] == ["One.", "Two.", "Three.", "Four.", "Five."]
+        assert backend.started.wait(timeout=2)
+        assert session["chunk_states"][3:] == ["pending", "pending"]
+        assert application.state.runtime.metrics().slots_in_use == 3
+
+        backend.release.set()
+        first = client.get(f"/api/sessions/{session['session_id']}/chunks/0")
+        assert first.status_code == 200
+        assert first.content == b"RIFFblocked-wave"
+        assert client.get(f"/api/sessions/{session['session_id']}/chunks/1").status_code == 200
+        wait_until(
+            lambda: client.get(f"/api/sessions/{session['session_id']}").json()["chunk_states"]
+            == ["ready", "ready", "ready", "ready", "pending"]
+        )
+        assert [call["text"] for call in backend.calls] == ["One.", "Two.", "Three.", "Four."]
+        assert client.get("/api/metrics").json()["active_sessions"] == 1
+
+
+def test_session_read_ahead_refills_off_the_inference_worker(monkeypatch: pytest.MonkeyPatch) -> None:
+    backend = BlockingTTS()
+    application = create_app(
+        config=config(session_target_chunk_chars=8, session_lookahead_chunks=1, queue_capacity=1),
+        model_loader=lambda _config: backend,
+    )
+    runtime = application.state.runtime
+    refills: list[str] = []
+    unblock = threading.Event()
+    original_submit = runtime.submit
+
+    def submit(text: str, *args: object, **kwargs: object) -> tuple[object, str]:
+        if text == "Two.":
+            refills.append(threading.current_thread().name)
+            if len(refills) > 1:
+                unblock.wait(timeout=5)
+        return original_submit(text, *args, **kwargs)
+
+    monkeypatch.setattr(runtime, "submit", submit)
+    with TestClient(application) as client:
+        # "Two." does not fit the one-slot queue at creation; it is refilled
+        # when "One." completes.
+        session_id = client.post("/api/sessions", json={"text": "One. Two.", "voice": "p225"}).json()["session_id"]
+        assert backend.started.wait(timeout=2)
+        assert len(refills) == 1
+        backend.release.set()
+        wait_until(lambda: len(refills) == 2)
+        assert refills[1].startswith("coqui-readahead")
+
+        # The refill is blocked in submit, yet the inference worker still serves other requests.
+        assert client.post("/api/tts", json={"text": "Unrelated.", "voice": "p225"}).status_code == 200
+        wait_until(lambda: runtime.metrics().slots_in_use == 0)
+        unblock.set()
+        wait_until(lambda: client.get(f"/api/sessions/{session_id}").json()["chunk_states"] == ["ready", "ready"])
+
+
+def test_session_seek_reprioritizes_pauses_and_delete_cleans_up() -> None:
+    backend = BlockingTTS()
+    application = create_app(
+        config=config(session_target_chunk_chars=8, session_lookahead_chunks=1, queue_capacity=8),
+        model_loader=lambda _config: backend,
+    )
+
+    with TestClient(application) as client:
+        session_id = client.post(
+            "/api/sessions",
+            json={"text": "One. Two. Three. Four. Five.", "voice": "p225"},
+        ).json()["session_id"]
+        assert backend.started.wait(timeout=2)
+
+        seeked = client.post(f"/api/sessions/{session_id}/seek", json={"index": 3, "paused": True})
+        assert seeked.status_code == 200
+        assert seeked.json()["paused"] is True
+        assert seeked.json()["chunk_states"] == ["running", "pending", "pending", "pending", "pending"]
+
+        backend.release.set()
+        fetched = client.get(f"/api/sessions/{session_id}/chunks/3")
+        assert fetched.status_code == 200
+        assert client.get(f"/api/sessions/{session_id}").json()["chunk_states"][4] == "pending"
+        resumed = client.post(f"/api/sessions/{session_id}/seek", json={"index": 3, "paused": False}).json()
+        assert resumed["chunk_states"][3] == "ready"
+        wait_until(lambda: client.get(f"/api/sessions/{session_id}").json()["chunk_states"][4] == "ready")
+        assert "Two." not in [call["text"] for call in backend.calls]
+
+        assert client.delete(f"/api/sessions/{session_id}").json() == {"ok": True}
+        assert client.get(f"/api/sessions/{session_id}").json()["error"]["code"] == "SESSION_NOT_FOUND"
+        assert client.delete(f"/api/sessions/{session_id}").status_code == 404
+        wait_until(lambda: application.state.runtime.tracked_temp_paths() == ())
+
+
+def test_session_requests_are_validated() -> None:
+    application = create_app(
+        config=config(max_document_chars=20, max_sessions=1),
+        model_loader=lambda _config: FakeTTS(),
+    )
+
+    with TestClient(application) as client:
+        assert client.post("/api/sessions", json={"text": "  "}).json()["error"]["code"] == "EMPTY_TEXT"
+        assert client.post("/api/sessions", json={"text": "x" * 21}).status_code == 413
+        assert client.post("/api/sessions", json={"text": "Hi", "voice": "missing"}).status_code == 400
+        assert client.post("/api/sessions", json={"text": "Hi", "lookahead_chunks": -1}).status_code == 422
+
+        first = client.post("/api/sessions", json={"text": "Hi", "voice": "p225"}).json()["session_id"]
+        second = client.post("/api/sessions", json={"text": "Hi", "voice": "p225"}).json()["session_id"]
+        assert client.get(f"/api/sessions/{first}").status_code == 404
+        assert client.get(f"/api/sessions/{second}/chunks/1").json()["error"]["code"] == "CHUNK_NOT_FOUND"
+        assert client.post(f"/api/sessions/{second}/seek", json={"index": 1}).status_code == 404
+        assert client.get(f"/api/sessions/{second}/chunks/0").status_code == 200
+
+
+def receive_stream_events(websocket: object, until: object) -> list[dict[str, object]]:
+    events: list[dict[str, object]] = []
+    while not (callable(until) and until(events)):
+        message = websocket.receive()  # type: ignore[attr-defined]
+        if message.get("text") is not None:
+            events.append(json.loads(message["text"]))
+        else:
+            events.append({"type": "binary", "bytes": message["bytes"]})
+    return events
+
+
+def audio_ids(events: list[dict[str, object]]) -> list[object]:
+    return [event["id"] for event in events if event["type"] == "audio"]
+
+
+def test_stream_channel_delivers_binary_audio_and_progress_events() -> None:
+    backend = FakeTTS()
+    application = create_app(config=config(), model_loader=lambda _config: backend)
+
+    with TestClient(application) as client, client.websocket_connect("/api/stream") as websocket:
+        websocket.send_text(json.dumps({"type": "synthesize", "id": "a", "text": "First", "voice": "p225"}))
+        websocket.send_text(json.dumps({"type": "synthesize", "id": "b", "text": "Second", "voice": "p225"}))
+        events = receive_stream_events(
+            websocket,
+            lambda received: sum(1 for event in received if event["type"] == "binary") == 2,
+        )
+
+        assert sorted(audio_ids(events)) == ["a", "b"]
+        assert {"type": "accepted", "id": "a", "pending": 1} in events
+        assert {"type": "progress", "id": "a", "state": "submitted"} in events
+        header_index = next(index for index, event in enumerate(events) if event["type"] == "audio")
+        assert events[header_index]["bytes"] == len(b"RIFFtest-wave")
+        assert events[header_index + 1] == {"type": "binary", "bytes": b"RIFFtest-wave"}
+    wait_until(lambda: application.state.runtime.tracked_temp_paths() == ())
+    assert application.state.runtime.metrics().slots_in_use == 0
+
+
+def test_stream_channel_applies_priority_pause_and_cancel_controls() -> None:
+    backend = BlockingTTS()
+    application = create_app(config=config(stream_max_in_flight=1), model_loader=lambda _config: backend)
+
+    with TestClient(application) as client, client.websocket_connect("/api/stream") as websocket:
+        for item_id in ("a", "b", "c", "d"):
+            websocket.send_text(json.dumps({"type": "synthesize", "id": item_id, "text": item_id, "voice": "p225"}))
+        websocket.send_text(json.dumps({"type": "priority", "id": "c", "priority": 5}))
+        websocket.send_text(json.dumps({"type": "cancel", "ids": ["d"]}))
+        websocket.send_text(json.dumps({"type": "pause"}))
+        events = receive_stream_events(websocket, lambda received: {"type": "paused"} in received)
+        assert {"type": "priority", "id": "c", "priority": 5} in events
+        assert {"type": "cancelled", "id": "d"} in events
+
+        backend.release.set()
+        wait_until(lambda: len(backend.calls) == 1)
+        websocket.send_text(json.dumps({"type": "resume"}))
+        events = receive_stream_events(websocket, lambda received: len(audio_ids(received)) == 3)
+        assert audio_ids(events) == ["a", "c", "b"]
+        assert [call["text"] for call in backend.calls] == ["a", "c", "b"]
+
+
+def test_stream_channel_submits_off_the_event_loop_and_cancels_chunks_being_dispatched(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    backend = BlockingTTS()
+    application = create_app(config=config(stream_max_in_flight=1), model_loader=lambda _config: backend)
+    entered = threading.Event()
+    release = threading.Event()
+    released: list[bool] = []
+
+    with TestClient(application) as client:
+        runtime = application.state.runtime
+        submit = runtime.submit
+
+        def slow_submit(text: str, *args: object, **kwargs: object) -> tuple[Future[str], str]:
+            if text == "Slow":
+                entered.set()
+                released.append(release.wait(timeout=2))
+            return submit(text, *args, **kwargs)
+
+        monkeypatch.setattr(runtime, "submit", slow_submit)
+        with client.websocket_connect("/api/stream") as websocket:
+            websocket.send_text(json.dumps({"type": "synthesize", "id": "a", "text": "First", "voice": "p225"}))
+            websocket.send_text(json.dumps({"type": "synthesize", "id": "b", "text": "Slow", "voice": "p225"}))
+            accepted = {"type": "accepted", "id": "b", "pending": 1}
+            receive_stream_events(websocket, lambda received: accepted in received)
+            backend.release.set()
+            assert entered.wait(timeout=2)
+            websocket.send_text(json.dumps({"type": "cancel", "ids": ["b"]}))
+            events = receive_stream_events(websocket, lambda received: {"type": "cancelled", "id": "b"} in received)
+            release.set()
+            assert "b" not in audio_ids(events)
+        wait_until(lambda: runtime.tracked_temp_paths() == ())
+        wait_until(lambda: runtime.metrics().slots_in_use == 0)
+    assert released == [True]
+
+
+def test_stream_channel_handles_control_frames_while_a_submit_is_blocked(monkeypatch: pytest.MonkeyPatch) -> None:
+    application = create_app(config=config(), model_loader=lambda _config: WavTTS())
+    entered = threading.Event()
+    release = threading.Event()
+    returned = threading.Event()
+
+    with TestClient(application) as client:
+        runtime = application.state.runtime
+        submit = runtime.submit
+
+        def blocked_submit(text: str, *args: object, **kwargs: object) -> tuple[Future[str], str]:
+            entered.set()
+            release.wait(timeout=5)
+            returned.set()
+            return submit(text, *args, **kwargs)
+
+        monkeypatch.setattr(runtime, "submit", blocked_submit)
+        with client.websocket_connect("/api/stream") as websocket:
+            websocket.send_text(json.dumps({"type": "synthesize", "id": "a", "text": "Hello.", "voice": "p225"}))
+            assert entered.wait(timeout=2)
+            websocket.send_text(json.dumps({"type": "cancel", "ids": ["a"]}))
+            websocket.send_text(json.dumps({"type": "pause"}))
+            events = receive_stream_events(websocket, lambda received: {"type": "paused"} in received)
+            assert {"type": "cancelled", "id": "a"} in events
+            assert not returned.is_set()
+            release.set()
+            websocket.send_text(json.dumps({"type": "resume"}))
+            events = receive_stream_events(websocket, lambda received: {"type": "resumed"} in received)
+            assert "a" not in audio_ids(events)
+            wait_until(lambda: runtime.tracked_temp_paths() == ())
+
+            release.clear()
+            returned.clear()
+            entered.clear()
+            websocket.send_text(json.dumps({"type": "synthesize", "id": "b", "text": "Again.", "voice": "p225"}))
+            assert entered.wait(timeout=2)
+        release.set()
+        wait_until(lambda: runtime.tracked_temp_paths() == ())
+        wait_until(lambda: runtime.metrics().slots_in_use == 0)
+        assert runtime.metrics().queued_futures == 0
+
+
+def test_stream_channel_reports_invalid_messages_and_seek_cancels_work() -> None:
+    backend = BlockingTTS()
+    application = create_app(
+        config=config(max_text_chars=5, stream_max_pending=1), model_loader=lambda _config: backend
+    )
+
+    with TestClient(application) as client, client.websocket_connect("/api/stream") as websocket:
+        websocket.send_text("{")
+        websocket.send_bytes(b"binary")
+        websocket.send_text(json.dumps({"type": "synthesize", "text": "Hi"}))
+        websocket.send_text(json.dumps({"type": "synthesize", "id": "long", "text": "Too long"}))
+        websocket.send_text(json.dumps({"type": "synthesize", "id": "empty", "text": " "}))
+        websocket.send_text(json.dumps({"type": "synthesize", "id": "voice", "text": "Hi", "voice": "missing"}))
+        websocket.send_text(json.dumps({"type": "synthesize", "id": "a", "text": "Hi", "voice": "p225"}))
+        websocket.send_text(json.dumps({"type": "synthesize", "id": "a", "text": "Hi", "voice": "p225"}))
+        submitted = {"type": "progress", "id": "a", "state": "submitted"}
+        events = receive_stream_events(websocket, lambda received: submitted in received)
+        websocket.send_text(json.dumps({"type": "priority", "id": "a", "priority": 1}))
+        websocket.send_text(json.dumps({"type": "seek"}))
+        events += receive_stream_events(websocket, lambda received: {"type": "seeked"} in received)
+
+        codes = [event["error"]["code"] for event in events if event["type"] == "error"]  # type: ignore[index]
+        assert codes == [
+            "INVALID_REQUEST",
+            "INVALID_REQUEST",
+            "INVALID_REQUEST",
+            "TEXT_TOO_LONG",
+            "EMPTY_TEXT",
+            "INVALID_VOICE",
+            "DUPLICATE_ID",
+            "NOT_PENDING",
+        ]
+        assert {"type": "cancelled", "id": "a"} in events
+        backend.release.set()
+    wait_until(lambda: application.state.runtime.tracked_temp_paths() == ())
+    wait_until(lambda: application.state.runtime.metrics().slots_in_use == 0)
+
+
+def test_stream_channel_closes_when_not_ready() -> None:
+    application = create_app(config=config(), model_loader=lambda _config: FakeTTS())
+    client = TestClient(application)
+    with client.websocket_connect("/api/stream") as websocket:
+        with pytest.raises(WebSocketDisconnect) as closed:
+            websocket.receive_text()
+        assert closed.value.code == 1013
+
+
+def test_admin_endpoints_are_disabled_without_token_and_reject_bad_tokens() -> None:
+    disabled = create_app(config=config(), model_loader=lambda _config: FakeTTS())
+    with TestClient(disabled) as client:
+        response = client.get("/api/admin/memory")
+        assert response.status_code == 404
+        assert response.json()["error"]["code"] == "NOT_FOUND"
+
+    enabled = create_app(config=config(admin_token="secret"), model_loader=lambda _config: FakeTTS())
+    with TestClient(enabled) as client:
+        for headers in ({}, {"Authorization": "Bearer wrong"}, {"Authorization": "secret"}):
+            response = client.get("/api/admin/memory", headers=headers)
+            assert response.status_code == 401
+            assert response.headers["www-authenticate"] == "Bearer"
+            assert response.json()["error"]["code"] == "UNAUTHORIZED"
+    assert "secret" not in repr(config(admin_token="secret"))
+
+
+def test_admin_settings_resize_queue_and_limits_live() -> None:
+    backend = BlockingTTS()
+    application = create_app(
+        config=config(admin_token="secret", queue_capacity=1), model_loader=lambda _config: backend
+    )
+    headers = {"Authorization": "Bearer secret"}
+
+    with TestClient(application) as client:
+        assert client.get("/api/admin/settings").status_code == 401
+        first = client.post("/api/jobs", json={"text": "First.", "voice": "p225"}).json()
+        assert backend.started.wait(timeout=2)
+        assert client.post("/api/jobs", json={"text": "Second.", "voice": "p225"}).status_code == 429
+
+        grown = client.post("/api/admin/settings", json={"queue_capacity": 2}, headers=headers).json()
+        assert grown["settings"]["queue_capacity"] == 2
+        second = client.post("/api/jobs", json={"text": "Second.", "voice": "p225"}).json()
+
+        shrunk = client.post(
+            "/api/admin/settings",
+            json={"queue_capacity": 1, "max_text_chars": 5, "synthesis_timeout_seconds": 0.5},
+            headers=headers,
+        )
+        assert shrunk.status_code == 200
+        metrics = client.get("/api/metrics").json()
+        assert (metrics["queue_capacity"], metrics["slots_in_use"]) == (1, 2)
+        assert client.post("/api/jobs", json={"text": "Third", "voice": "p225"}).status_code == 429
+        assert client.post("/api/tts", json={"text": "Too long", "voice": "p225"}).status_code == 413
+        assert client.get("/api/capabilities").json()["max_text_chars"] == 5
+
+        backend.release.set()
+        for job in (first, second):
+            assert client.get(f"/api/jobs/{job['job_id']}", params={"wait": 2}).json()["state"] == "completed"
+        wait_until(lambda: application.state.runtime.metrics().slots_in_use == 0)
+        assert client.post("/api/tts", json={"text": "Third", "voice": "p225"}).status_code == 200
+
+        assert client.post("/api/admin/settings", json={}, headers=headers).json()["error"]["code"] == "EMPTY_UPDATE"
+        for invalid in ({"queue_capacity": 0}, {"synthesis_timeout_seconds": "inf"}, {"max_text_chars": -1}):
+            assert client.post("/api/admin/settings", json=invalid, headers=headers).status_code == 422
+        assert client.post("/api/admin/settings", json={"queue_capacity": 1}, headers=headers).status_code == 200
+
+        metrics = client.get("/api/metrics").json()
+        assert metrics["config_changes"] == 2
+        assert metrics["settings"] == client.get("/api/admin/settings", headers=headers).json()["settings"]
+        assert metrics["settings"] == {
+            "queue_capacity": 1,
+            "queue_work_seconds": 60.0,
+            "synthesis_timeout_seconds": 0.5,
+            "max_text_chars": 5,
+        }
+        grown_event, shrunk_event = metrics["config_change_events"]
+        assert grown_event["changes"] == {"queue_capacity": {"from": 1, "to": 2}}
+        assert shrunk_event["changes"]["max_text_chars"] == {"from": 500, "to": 5}
+
+
+def test_memory_endpoint_reports_rss_structures_and_tracemalloc_growth() -> None:
+    application = create_app(config=config(admin_token="secret"), model_loader=lambda _config: FakeTTS())
+    headers = {"Authorization": "Bearer secret"}
+
+    with TestClient(application) as client:
+        assert client.post("/api/tts", json={"text": "Hello", "voice": "p225"}).status_code == 200
+        report = client.get("/api/admin/memory", headers=headers).json()
+        assert report["process_rss_bytes"] > 0
+        assert report["torch"] is None
+        assert report["structures"]["audio_cache_entries"] == 1
+        assert report["structures"]["temp_paths"] == 0
+        assert report["structures"]["retained_jobs"] == 0
+        assert report["tracemalloc"] == {"tracing": False}
+
+        started = client.post("/api/admin/memory/tracing", json={"enabled": True, "frames": 4}, headers=headers)
+        assert started.json() == {"ok": True, "tracing": True}
+        retained = [bytearray(1024) for _ in range(256)]
+        traced = client.get("/api/admin/memory", params={"top": 5}, headers=headers).json()["tracemalloc"]
+        assert traced["tracing"] is True
+        assert traced["traced_bytes"] > 256 * 1024
+        assert 0 < len(traced["top_allocations"]) <= 5
+        growth = traced["growth_since_baseline"]
+        assert any(entry["size_diff_bytes"] > 0 for entry in growth)
+        again = client.get("/api/admin/memory", params={"top": 5}, headers=headers).json()["tracemalloc"]
+        assert max(entry["size_diff_bytes"] for entry in again["growth_since_baseline"]) >= 256 * 1024
+        del retained
+
+        assert client.post("/api/admin/memory/baseline", headers=headers).json() == {"ok": True}
+        rebased = client.get("/api/admin/memory", params={"top": 5}, headers=headers).json()["tracemalloc"]
+        assert all(entry["size_diff_bytes"] < 256 * 1024 for entry in rebased["growth_since_baseline"])
+
+        stopped = client.post("/api/admin/memory/tracing", json={"enabled": False}, headers=headers)
+        assert stopped.json() == {"ok": True, "tracing": False}
+        disabled = client.post("/api/admin/memory/baseline", headers=headers)
+        assert disabled.status_code == 409
+        assert disabled.json()["error"]["code"] == "TRACING_DISABLED"
+
+
+def test_torch_memory_stats_reports_loaded_torch(monkeypatch: pytest.MonkeyPatch) -> None:
+    class FakeCuda:
+        @staticmethod
+        def is_available() -> bool:
+            return False
+
+    class FakeTorch:
+        cuda = FakeCuda()
+
+        @staticmethod
+        def get_num_threads() -> int:
+            return 3
+
+    monkeypatch.setitem(sys.modules, "torch", FakeTorch())
+    assert app_module._torch_memory_stats() == {"device": "cpu", "num_threads": 3, "allocator_stats_available": False}
+
+
+def test_cpu_profile_samples_synthesis_thread_as_collapsed_stacks() -> None:
+    backend = BlockingTTS()
+    application = create_app(config=config(admin_token="secret"), model_loader=lambda _config: backend)
+    headers = {"Authorization": "Bearer secret"}
+
+    with TestClient(application) as client:
+        assert client.get("/api/admin/profile", params={"seconds": 0.1}).status_code == 401
+        assert client.post("/api/jobs", json={"text": "Slow", "voice": "p225"}).status_code == 202
+        assert backend.started.wait(timeout=2)
+        response = client.get("/api/admin/profile", params={"seconds": 0.2, "interval_ms": 5}, headers=headers)
+        backend.release.set()
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert int(response.headers["x-profile-samples"]) > 0
+        lines = response.text.splitlines()
+        synthesis = [line for line in lines if line.startswith("coqui-synthesis")]
+        assert synthesis
+        assert any(":_run_synthesis;" in line and ":tts_to_file;" in line for line in synthesis)
+        assert any(line.startswith("event-loop;") for line in lines)
+        for line in lines:
+            stack, count = line.rsplit(" ", 1)
+            assert int(count) > 0
+            assert " " not in stack.split(";", 1)[1]
+
+
+def test_stack_sampler_allows_one_profile_at_a_time() -> None:
+    sampler = app_module.StackSampler(thread_prefix="no-such-thread")
+    with sampler._lock:
+        assert sampler.sample(0.01, 0.001, {}) is None
+    stacks, samples = sampler.sample(0.01, 0.001, {threading.get_ident(): "caller"})
+    assert samples > 0
+    assert all(stack.startswith("caller;") for stack in stacks)
+
+
+def test_stack_sampler_merges_child_profiles_and_skips_failed_children() -> None:
+    def child(seconds: float, interval: float, label: str) -> Counter[str]:
+        return Counter({f"{label};worker:tts_to_file": 3})
+
+    def exited(_seconds: float, _interval: float, _label: str) -> Counter[str]:
+        raise InferenceProcessError("Inference process exited while profiling")
+
+    sampler = app_module.StackSampler(thread_prefix="no-such-thread")
+    stacks, _samples = sampler.sample(0.01, 0.001, {}, {"child": child, "gone": exited})
+    assert stacks == Counter({"child;worker:tts_to_file": 3})
+
+
+def test_cpu_profile_samples_the_inference_child_process() -> None:
+    application = create_app(
+        config=config(
+            admin_token="secret",
+            inference_isolation="process",
+            inference_start_method="fork",
+            inference_hard_timeout_seconds=1.0,
+        ),
+        model_loader=lambda _config: HangingTTS(),
+    )
+    headers = {"Authorization": "Bearer secret"}
+
+    with TestClient(application) as client:
+        runtime = application.state.runtime
+        assert client.post("/api/jobs", json={"text": "Please hang.", "voice": "p225"}).status_code == 202
+        wait_until(lambda: runtime.liveness().active_job_seconds is not None)
+        response = client.get("/api/admin/profile", params={"seconds": 0.3, "interval_ms": 5}, headers=headers)
+        assert response.status_code == 200
+        child = [line for line in response.text.splitlines() if line.startswith("coqui-inference[fake-model];")]
+        assert any(":_inference_worker_main;" in line and ":tts_to_file " in line for line in child)
+        wait_until(lambda: runtime.metrics().slots_in_use == 0, timeout=5)
+
+        runtime._isolated_backends()[0][1].close()
+        with pytest.raises(InferenceProcessError, match="shut down"):
+            runtime._isolated_backends()[0][1].profile(0.01, 0.001, "closed")
+
+
+def test_models_are_loaded_on_demand_and_requests_select_a_model() -> None:
+    loaded: list[str] = []
+
+    def loader(model_config: ServiceConfig) -> FakeTTS:
+        loaded.append(model_config.model_name)
+        backend = WavTTS()
+        if model_config.model_name == "fast-model":
+            backend.speakers = ["fast-a"]
+        return backend
+
+    application = create_app(config=config(available_models=("fake-model", "fast-model")), model_loader=loader)
+    with TestClient(application) as client:
+        assert loaded == ["fake-model"]
+        models = client.get("/api/models").json()
+        assert models["default"] == "fake-model"
+        assert models["models"]["fast-model"]["loaded"] is False
+
+        assert client.get("/api/voices", params={"model": "fast-model"}).json() == {"voices": ["fast-a"]}
+        assert loaded == ["fake-model", "fast-model"]
+        response = client.post("/api/tts", json={"text": "Hello.", "model": "fast-model"})
+        assert response.status_code == 200
+        assert client.post("/api/tts", json={"text": "Hello.", "voice": "p225"}).status_code == 200
+
+        invalid_voice = client.post("/api/tts", json={"text": "Hello.", "voice": "p225", "model": "fast-model"})
+        assert invalid_voice.json()["error"]["code"] == "INVALID_VOICE"
+        for path in ("/api/tts", "/api/jobs", "/api/sessions"):
+            unknown = client.post(path, json={"text": "Hi", "model": "other-model"})
+            assert unknown.status_code == 400
+            assert unknown.json()["error"]["code"] == "INVALID_MODEL"
+        assert client.get("/api/voices", params={"model": "other-model"}).status_code == 400
+
+        profile = client.get("/api/metrics").json()["models"]
+        assert profile["fast-model"]["loaded"] is True
+        assert profile["fast-model"]["hits"] == 1
+        assert profile["fake-model"]["hits"] == 1
+        assert profile["fast-model"]["load_seconds"] >= 0
+        assert set(client.get("/api/metrics").json()["latency_model"]) == {"fake-model:p225", "fast-model:fast-a"}
+
+
+def test_model_registry_evicts_least_recently_used_models_over_budget(monkeypatch: pytest.MonkeyPatch) -> None:
+    memory = {"rss": 1000}
+    backends: dict[str, BlockingTTS] = {}
+
+    def loader(model_config: ServiceConfig) -> FakeTTS:
+        memory["rss"] += 100
+        backends[model_config.model_name] = BlockingTTS()
+        return backends[model_config.model_name]
+
+    monkeypatch.setattr(app_module, "_process_rss_bytes", lambda _pid=None: memory["rss"])
+    runtime = SynthesisRuntime(
+        config(available_models=("fake-model", "fast-model", "slow-model"), model_memory_budget_bytes=150),
+        loader,
+    )
+    runtime.start()
+    busy, busy_path = runtime.submit("Busy", "p225")
+    runtime.validate_voice(None, "fast-model")
+    profile = runtime.model_profile()
+    assert profile["fake-model"]["loaded"] is True
+    assert profile["fast-model"]["loaded"] is True
+    assert profile["fake-model"]["in_flight"] == 1
+
+    backends["fake-model"].release.set()
+    assert busy.result(timeout=2) == busy_path
+    runtime.cleanup_path(busy_path)
+    wait_until(lambda: runtime.model_profile()["fake-model"]["loaded"] is False)
+    assert runtime.model_profile()["fake-model"]["evictions"] == 1
+
+    runtime.validate_voice(None, "slow-model")
+    profile = runtime.model_profile()
+    assert [model for model, entry in profile.items() if entry["loaded"]] == ["slow-model"]
+    assert profile["fast-model"]["evictions"] == 1
+    assert profile["slow-model"]["memory_bytes"] == 100
+
+    runtime.validate_voice(None, None)
+    assert runtime.model_profile()["fake-model"]["loads"] == 2
+    runtime.shutdown()
+    with pytest.raises(app_module.BackendNotReadyError):
+        runtime.voices()
+
+
+def test_model_loaded_between_lookup_and_admission_cannot_evict_the_checked_out_model(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    memory = {"rss": 1000}
+    closed: list[str] = []
+
+    def loader(model_config: ServiceConfig) -> FakeTTS:
+        memory["rss"] += 100
+        backend = FakeTTS()
+        backend.speakers = [model_config.model_name]
+        return backend
+
+    monkeypatch.setattr(app_module, "_process_rss_bytes", lambda _pid=None: memory["rss"])
+    monkeypatch.setattr(app_module, "_close_backend", lambda backend: closed.append(backend.speakers[0]))
+    runtime = SynthesisRuntime(
+        config(available_models=("fake-model", "fast-model"), model_memory_budget_bytes=150),
+        loader,
+    )
+    runtime.start()
+    estimate = runtime._estimate_cost
+
+    def load_other_model_first(*args: object) -> float:
+        runtime.validate_voice(None, "fast-model")
+        return estimate(*args)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(runtime, "_estimate_cost", load_other_model_first)
+    future, output_path = runtime.submit("Hello", "fake-model")
+    assert closed == []
+    assert future.result(timeout=2) == output_path
+    runtime.cleanup_path(output_path)
+    wait_until(lambda: closed == ["fake-model"])
+    assert runtime.model_profile()["fake-model"]["in_flight"] == 0
+    runtime.shutdown()
+
+
+def test_isolated_model_memory_budget_counts_the_standby_process(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(app_module, "_process_rss_bytes", lambda _pid=None: 100)
+
+    def loader(model_config: ServiceConfig) -> FakeTTS:
+        backend = FakeTTS()
+        backend.speakers = [model_config.model_name]
+        return backend
+
+    runtime = SynthesisRuntime(
+        config(
+            available_models=("fake-model", "fast-model"),
+            model_memory_budget_bytes=350,
+            inference_isolation="process",
+            inference_start_method="fork",
+        ),
+        loader,
+    )
+    runtime.start()
+    try:
+        assert runtime.model_profile()["fake-model"]["memory_bytes"] == 200
+        runtime.validate_voice(None, "fast-model")
+        profile = runtime.model_profile()
+        assert [model for model, entry in profile.items() if entry["loaded"]] == ["fast-model"]
+        assert profile["fake-model"]["evictions"] == 1
+    finally:
+        runtime.shutdown()
+
+
+def test_reload_between_lookup_and_admission_drains_the_isolated_backend_in_use(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    runtime = SynthesisRuntime(
+        config(inference_isolation="process", inference_start_method="fork", inference_standby=False),
+        lambda _config: HangingTTS(),
+    )
+    runtime.start()
+    previous = runtime._models.get()
+    estimate = runtime._estimate_cost
+
+    def reload_first(*args: object) -> float:
+        runtime._models.reload("fake-model")
+        return estimate(*args)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(runtime, "_estimate_cost", reload_first)
+    future, output_path = runtime.submit("Hello", "p225")
+    assert previous.retired is True
+    assert future.result(timeout=5) == output_path
+    assert Path(output_path).read_bytes() == b"RIFFtest-wave"
+    runtime.cleanup_path(output_path)
+    wait_until(lambda: previous.backend._closed)
+    assert runtime._models.get() is not previous
+    runtime.shutdown()
+
+
+def test_admin_reload_swaps_in_warmed_model_while_old_one_drains() -> None:
+    generations: list[BlockingTTS] = []
+
+    def loader(model_config: ServiceConfig) -> FakeTTS:
+        if model_config.model_name == "broken-model":
+            raise RuntimeError("weights missing")
+        backend = BlockingTTS()
+        if generations:
+            backend.release.set()
+        generations.append(backend)
+        return backend
+
+    application = create_app(config=config(admin_token="secret"), model_loader=loader)
+    headers = {"Authorization": "Bearer secret"}
+    with TestClient(application) as client:
+        runtime = application.state.runtime
+        old = generations[0]
+        old.release.set()
+        assert client.post("/api/tts", json={"text": "Cached.", "voice": "p225"}).status_code == 200
+        old.release.clear()
+        old.started.clear()
+        draining = client.post("/api/jobs", json={"text": "Draining.", "voice": "p225"}).json()["job_id"]
+        assert old.started.wait(timeout=2)
+
+        assert client.post("/api/admin/models/reload", json={}).status_code == 401
+        started = client.post("/api/admin/models/reload", json={}, headers=headers)
+        assert started.status_code == 202
+        assert started.json()["reload"]["model"] == "fake-model"
+        wait_until(
+            lambda: client.get("/api/admin/models/reload", headers=headers).json()["reload"]["state"] == "completed"
+        )
+        assert len(generations) == 2
+        assert generations[1].calls == [{"text": app_module.MODEL_WARMUP_TEXT, "speaker": "p225"}]
+
+        assert runtime.model_profile()["fake-model"]["loads"] == 2
+        old.release.set()
+        assert client.get(f"/api/jobs/{draining}", params={"wait": 2}).json()["state"] == "completed"
+        assert runtime._audio_cache.get(("fake-model", "p225", "Draining.")) is None
+        assert client.post("/api/tts", json={"text": "Cached.", "voice": "p225"}).status_code == 200
+        assert generations[1].calls[-1] == {"text": "Cached.", "speaker": "p225"}
+
+        switched = client.post(
+            "/api/admin/models/reload", json={"model": "next-model", "make_default": True}, headers=headers
+        )
+        assert switched.status_code == 202
+        wait_until(lambda: client.get("/api/models").json()["default"] == "next-model")
+        assert client.post("/api/tts", json={"text": "Hello.", "voice": "p225"}).status_code == 200
+        assert generations[2].calls[-1] == {"text": "Hello.", "speaker": "p225"}
+
+        client.post("/api/admin/models/reload", json={"model": "broken-model"}, headers=headers)
+        wait_until(
+            lambda: client.get("/api/admin/models/reload", headers=headers).json()["reload"]["state"] == "failed"
+        )
+        status = client.get("/api/admin/models/reload", headers=headers).json()["reload"]
+        assert "weights missing" in status["error"]
+        assert client.get("/api/models").json()["default"] == "next-model"
+        assert "broken-model" not in client.get("/api/models").json()["models"]
+
+
+def test_concurrent_model_reload_is_rejected() -> None:
+    release = threading.Event()
+
+    def loader(model_config: ServiceConfig) -> FakeTTS:
+        if model_config.model_name == "slow-model":
+            release.wait(timeout=5)
+        return FakeTTS()
+
+    application = create_app(config=config(admin_token="secret"), model_loader=loader)
+    headers = {"Authorization": "Bearer secret"}
+    with TestClient(application) as client:
+        slow = client.post("/api/admin/models/reload", json={"model": "slow-model"}, headers=headers)
+        assert slow.status_code == 202
+        rejected = client.post("/api/admin/models/reload", json={}, headers=headers)
+        assert rejected.status_code == 409
+        assert rejected.json()["error"]["code"] == "RELOAD_IN_PROGRESS"
+        release.set()
+        wait_until(lambda: application.state.runtime.reload_status()["state"] == "completed")
+
+
+def test_spool_directory_is_swept_at_startup_and_bounded(tmp_path: Path) -> None:
+    spool = tmp_path / "spool"
+    spool.mkdir()
+    (spool / "chrome-readit-orphan.wav").write_bytes(b"RIFFstale")
+    (spool / "chrome-readit-warmup-orphan.wav").write_bytes(b"RIFFstale")
+    (spool / "unrelated.wav").write_bytes(b"RIFFkeep")
+    application = create_app(
+        config=config(spool_dir=str(spool), spool_max_bytes=20),
+        model_loader=lambda _config: FakeTTS(),
+    )
+
+    with TestClient(application) as client:
+        runtime = application.state.runtime
+        assert sorted(path.name for path in spool.iterdir()) == ["unrelated.wav"]
+        first = client.post("/api/jobs", json={"text": "First", "voice": "p225"}).json()["job_id"]
+        assert client.get(f"/api/jobs/{first}", params={"wait": 2}).json()["state"] == "completed"
+        assert [Path(path).parent for path in runtime.tracked_temp_paths()] == [spool]
+        assert client.post("/api/jobs", json={"text": "Second", "voice": "p225"}).status_code == 202
+        wait_until(lambda: runtime.metrics().spool_bytes >= 20)
+
+        rejected = client.post("/api/tts", json={"text": "Third", "voice": "p225"})
+        assert rejected.status_code == 503
+        assert rejected.json()["error"]["code"] == "SPOOL_FULL"
+        assert "retry-after" in rejected.headers
+        metrics = client.get("/api/metrics").json()
+        assert metrics["spool_swept_files"] == 2
+        assert metrics["spool_rejections"] == 1
+        assert metrics["spool_max_bytes"] == 20
+        assert metrics["slots_in_use"] == 0
+
+
+def test_shared_temp_spool_only_sweeps_orphans_older_than_any_live_job(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(app_module.tempfile, "gettempdir", lambda: str(tmp_path))
+    live = tmp_path / "chrome-readit-other-instance.wav"
+    live.write_bytes(b"RIFFlive")
+    stale = tmp_path / "chrome-readit-stale.wav"
+    stale.write_bytes(b"RIFFstale")
+    settings = config(
+        queue_work_seconds=10.0,
+        inference_hard_timeout_seconds=20.0,
+        timed_out_result_ttl_seconds=5.0,
+        job_result_ttl_seconds=30.0,
+    )
+    old = time.time() - 61
+    os.utime(stale, (old, old))
+
+    runtime = SynthesisRuntime(settings, lambda _config: FakeTTS())
+    runtime.start()
+    assert runtime.spool_dir == str(tmp_path)
+    assert runtime.metrics().spool_swept_files == 1
+    assert sorted(path.name for path in tmp_path.iterdir()) == [live.name]
+    runtime.shutdown()
+
+
+def test_queued_jobs_are_dispatched_round_robin_across_clients() -> None:
+    backend = BlockingTTS()
+    application = create_app(
+        config=config(queue_capacity=8, trusted_proxies=("testclient",)), model_loader=lambda _config: backend
+    )
+
+    def submit(client: TestClient, client_id: str, text: str) -> str:
+        response = client.post("/api/jobs", json={"text": text, "voice": "p225"}, headers={"X-Client-Id": client_id})
+        assert response.status_code == 202
+        return response.json()["job_id"]
+
+    with TestClient(application) as client:
+        submit(client, "prefetcher", "Alpha 0")
+        assert backend.started.wait(timeout=2)
+        queued = [submit(client, "prefetcher", f"Alpha {index}") for index in range(1, 4)]
+        queued += [submit(client, "reader", f"Beta {index}") for index in range(2)]
+        positions = {job_id: client.get(f"/api/jobs/{job_id}").json()["queue_position"] for job_id in queued}
+        assert [positions[job_id] for job_id in queued] == [0, 2, 4, 1, 3]
+
+        clients = client.get("/api/metrics").json()["clients"]
+        assert clients["prefetcher"]["queued"] == 3
+        assert clients["prefetcher"]["in_flight"] == 4
+        assert clients["reader"]["queued"] == 2
+
+        backend.release.set()
+        assert client.get(f"/api/jobs/{queued[2]}", params={"wait": 2}).json()["state"] == "completed"
+        assert [call["text"] for call in backend.calls] == [
+            "Alpha 0",
+            "Alpha 1",
+            "Beta 0",
+            "Alpha 2",
+            "Beta 1",
+            "Alpha 3",
+        ]
+        wait_until(lambda: client.get("/api/metrics").json()["clients"]["prefetcher"]["in_flight"] == 0)
+
+
+def test_per_client_rate_and_slot_limits_reject_only_the_noisy_client() -> None:
+    backend = BlockingTTS()
+    application = create_app(
+        config=config(
+            queue_capacity=8,
+            client_rate_per_second=0.01,
+            client_burst=3,
+            client_max_slots=2,
+            trusted_proxies=("testclient",),
+        ),
+        model_loader=lambda _config: backend,
+    )
+
+    def submit(client: TestClient, client_id: str, text: str) -> object:
+        return client.post("/api/jobs", json={"text": text, "voice": "p225"}, headers={"X-Client-Id": client_id})
+
+    with TestClient(application) as client:
+        assert [submit(client, "noisy", f"Chunk {index}").status_code for index in range(2)] == [202, 202]
+        slot_limited = submit(client, "noisy", "Chunk 2")
+        assert slot_limited.status_code == 429
+        assert slot_limited.json()["error"]["code"] == "CLIENT_QUEUE_FULL"
+        assert "retry-after" in slot_limited.headers
+        assert submit(client, "quiet", "Other").status_code == 202
+
+        backend.release.set()
+        wait_until(lambda: client.get("/api/metrics").json()["clients"]["noisy"]["in_flight"] == 0)
+        assert submit(client, "noisy", "Chunk 3").status_code == 202
+        rate_limited = submit(client, "noisy", "Chunk 4")
+        assert rate_limited.status_code == 429
+        assert rate_limited.json()["error"]["code"] == "RATE_LIMITED"
+        assert int(rate_limited.headers["retry-after"]) > 1
+
+        metrics = client.get("/api/metrics").json()
+        assert metrics["clients"]["noisy"]["slot_rejections"] == 1
+        assert metrics["clients"]["noisy"]["rate_limited"] == 1
+        assert metrics["clients"]["quiet"]["submitted"] == 1
+        assert metrics["client_rejections"] == 2
+
+
+def test_tts_audio_has_validators_conditional_requests_and_addressable_ranges() -> None:
+    backend = FakeTTS()
+    application = create_app(config=config(), model_loader=lambda _config: backend)
+    body = {"text": "Hello there.", "voice": "p225"}
+
+    with TestClient(application) as client:
+        first = client.post("/api/tts", json=body)
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+        audio_url = first.headers["content-location"]
+        assert etag.startswith('W/"') and audio_url.startswith("/api/audio/")
+
+        revalidated = client.post("/api/tts", json=body, headers={"If-None-Match": f'"other", {etag}'})
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+        assert len(backend.calls) == 1
+        assert client.get("/api/metrics").json()["request_cache_hits"] == 0
+        unsynthesized = client.post(
+            "/api/tts", json={"text": "Never said.", "voice": "p225"}, headers={"If-None-Match": "*"}
+        )
+        assert (unsynthesized.status_code, unsynthesized.content) == (200, b"RIFFtest-wave")
+        assert len(backend.calls) == 2
+
+        cached = client.post("/api/tts", json=body, headers={"Range": "bytes=0-3"})
+        assert cached.status_code == 206
+        assert cached.content == b"RIFF"
+
+        full = client.get(audio_url)
+        assert full.status_code == 200
+        assert full.content == b"RIFFtest-wave"
+        assert full.headers["etag"] == etag
+        assert full.headers["accept-ranges"] == "bytes"
+        assert full.headers["cache-control"] == app_module.AUDIO_CACHE_CONTROL
+        tail = client.get(audio_url, headers={"Range": "bytes=-4"})
+        assert (tail.status_code, tail.content, tail.headers["content-range"]) == (206, b"wave", "bytes 9-12/13")
+        stale = client.get(audio_url, headers={"Range": "bytes=0-3", "If-Range": '"other"'})
+        assert (stale.status_code, stale.content) == (200, b"RIFFtest-wave")
+        weak = client.get(audio_url, headers={"Range": "bytes=0-3", "If-Range": etag})
+        assert (weak.status_code, weak.content) == (200, b"RIFFtest-wave")
+        assert client.get(audio_url, headers={"If-None-Match": "*"}).status_code == 200
+        outside = client.get(audio_url, headers={"Range": "bytes=13-"})
+        assert outside.status_code == 416
+        assert outside.json()["error"]["code"] == "RANGE_NOT_SATISFIABLE"
+        assert outside.headers["content-range"] == "bytes */13"
+        assert client.get(audio_url, headers={"If-None-Match": etag}).status_code == 304
+
+        assert client.get("/api/audio/unknown").json()["error"]["code"] == "AUDIO_NOT_FOUND"
+        application.state.runtime._audio_cache.clear()
+        evicted = client.get(audio_url)
+        assert evicted.status_code == 404
+        assert evicted.json()["error"]["code"] == "AUDIO_NOT_CACHED"
+        assert len(backend.calls) == 2
+
+
+def test_audio_validators_change_with_model_reloads_and_output_settings() -> None:
+    application = create_app(config=config(), model_loader=lambda _config: FakeTTS())
+    body = {"text": "Hello there.", "voice": "p225"}
+
+    with TestClient(application) as client:
+        runtime = application.state.runtime
+        first = client.post("/api/tts", json=body)
+        etag = first.headers["etag"]
+        audio_url = first.headers["content-location"]
+
+        assert client.post("/api/tts", json=body, headers={"If-None-Match": etag}).status_code == 304
+
+        runtime._models.reload("fake-model")
+        upgraded = client.post("/api/tts", json=body, headers={"If-None-Match": etag})
+        assert upgraded.status_code == 200
+        assert upgraded.headers["etag"] != etag
+        stale = client.get(audio_url)
+        assert stale.status_code == 404
+        assert stale.json()["error"]["code"] == "AUDIO_NOT_CACHED"
+
+    signatures = {
+        SynthesisRuntime(settings, lambda _config: FakeTTS())._output_signature
+        for settings in (
+            config(),
+            config(sentence_silence_ms=0),
+            config(postprocess=True),
+            config(postprocess=True, loudness_target_dbfs=-16.0),
+        )
+    }
+    assert len(signatures) == 4
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, None),
+        ("bytes=0-3", (0, 3)),
+        ("bytes=5-", (5, 9)),
+        ("bytes=4-99", (4, 9)),
+        ("bytes=-3", (7, 9)),
+        ("bytes=-30", (0, 9)),
+        ("bytes=3-1", None),
+        ("bytes=0-1,4-5", None),
+        ("items=0-1", None),
+        ("bytes=a-b", None),
+        ("bytes=-", None),
+        ("bytes=10-", app_module.RangeNotSatisfiableError),
+        ("bytes=-0", app_module.RangeNotSatisfiableError),
+    ],
+)
+def test_byte_range_parsing(header: str | None, expected: object) -> None:
+    if expected is app_module.RangeNotSatisfiableError:
+        with pytest.raises(app_module.RangeNotSatisfiableError):
+            app_module.parse_byte_range(header, 10)
+    else:
+        assert app_module.parse_byte_range(header, 10) == expected
+
+
+def speech_wav(frame_rate: int = 16000, amplitude: float = 0.05) -> bytes:
+    import numpy as np
+
+    tone = amplitude * np.sin(2 * np.pi * 220 * np.arange(frame_rate // 2) / frame_rate)
+    samples = np.concatenate([np.zeros(frame_rate // 5), tone, np.zeros(frame_rate * 3 // 10)])
+    return app_module.write_pcm_wav((1, 2, frame_rate), np.round(samples * 32767).astype("<i2").tobytes())
+
+
+class SpeechTTS(FakeTTS):
+    def tts_to_file(self, *, text: str, file_path: str, speaker: str | None = None) -> None:
+        self.calls.append({"text": text, "speaker": speaker})
+        Path(file_path).write_bytes(speech_wav())
+
+
+def test_postprocessing_trims_normalizes_and_time_stretches() -> None:
+    np = pytest.importorskip("numpy")
+    processor = app_module.AudioPostProcessor(enabled=True, trim_pad_ms=50, loudness_target_dbfs=-20.0)
+
+    def decode(audio: bytes) -> object:
+        audio_format, frames = app_module.read_pcm_wav(audio)
+        assert audio_format == (1, 2, 16000)
+        return np.frombuffer(frames, dtype="<i2") / 32768
+
+    trimmed = decode(processor.process(speech_wav()))
+    assert len(trimmed) / 16000 == pytest.approx(0.6, abs=0.01)
+    assert 20 * np.log10(np.sqrt(np.mean(np.square(trimmed)))) == pytest.approx(-20.0, abs=0.5)
+
+    stretched = decode(processor.process(speech_wav(), rate=2.0))
+    assert len(stretched) / 16000 == pytest.approx(0.3, abs=0.03)
+    assert np.abs(stretched).max() <= 10 ** (app_module.PEAK_CEILING_DBFS / 20) + 1e-3
+
+    untouched = app_module.AudioPostProcessor(enabled=False, trim_pad_ms=50, loudness_target_dbfs=-20.0)
+    assert untouched.process(speech_wav()) == speech_wav()
+    assert set(processor.snapshot()) == {"decode", "trim", "loudness", "tempo", "encode"}
+    assert processor.snapshot()["trim"]["runs"] == 2
+
+
+@pytest.mark.parametrize("rate", [0.5, 0.75, 1.5, 2.0])
+def test_time_stretch_preserves_the_period_of_voiced_audio(rate: float) -> None:
+    np = pytest.importorskip("numpy")
+    frame_rate, f0 = 16000, 123.0
+    seconds = np.arange(frame_rate) / frame_rate
+    voiced = sum(np.sin(2 * np.pi * f0 * k * seconds + k) / k for k in range(1, 8))[:, None] * 0.3
+
+    def period(samples: object) -> int:
+        middle = samples[len(samples) // 4:3 * len(samples) // 4, 0]
+        middle = middle - middle.mean()
+        autocorrelation = np.correlate(middle, middle, mode="full")[len(middle) - 1:]
+        return 40 + int(np.argmax(autocorrelation[40:400]))
+
+    stretched = app_module.time_stretch(voiced, rate, frame_rate)
+    assert len(stretched) / frame_rate == pytest.approx(1 / rate, abs=0.05)
+    assert period(stretched) == pytest.approx(frame_rate / f0, abs=2)
+
+
+def test_postprocessing_runs_off_the_inference_worker_and_keys_audio_by_rate(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("numpy")
+    backend = SpeechTTS()
+    application = create_app(config=config(postprocess=True, trim_pad_ms=0), model_loader=lambda _config: backend)
+
+    with TestClient(application) as client:
+        processor = application.state.runtime._postprocessor
+        threads: list[str] = []
+        real_process = processor.process
+
+        def record_thread(audio: bytes, rate: float | None = None) -> bytes:
+            threads.append(threading.current_thread().name)
+            return real_process(audio, rate)
+
+        monkeypatch.setattr(processor, "process", record_thread)
+        normal = client.post("/api/tts", json={"text": "Hello.", "voice": "p225"})
+        assert normal.status_code == 200
+        assert len(normal.content) < len(speech_wav())
+        faster = client.post("/api/tts", json={"text": "Hello.", "voice": "p225", "rate": 2.0})
+        assert faster.status_code == 200
+        assert faster.headers["etag"] != normal.headers["etag"]
+        assert len(faster.content) < len(normal.content) * 0.6
+        assert len(backend.calls) == 1
+        assert threads[0].startswith("coqui-postprocess")
+        assert not threads[1].startswith("coqui-synthesis")
+
+        too_fast = client.post("/api/tts", json={"text": "Hello.", "voice": "p225", "rate": 3.0})
+        assert too_fast.status_code == 422
+        stages = client.get("/api/metrics").json()["postprocess"]
+        assert stages["trim"]["runs"] == 2
+        assert stages["tempo"]["runs"] == 1
+        assert stages["loudness"]["total_seconds"] >= 0
+
+
+def test_trace_records_request_shape_and_timings_without_text(tmp_path: Path) -> None:
+    backend = BlockingTTS()
+    trace = tmp_path / "traces" / "requests.jsonl"
+    application = create_app(
+        config=config(queue_capacity=1, trace_path=str(trace), trace_max_bytes=2048),
+        model_loader=lambda _config: backend,
+    )
+
+    with TestClient(application) as client:
+        job = client.post("/api/jobs", json={"text": "Secret first sentence.", "voice": "p225"}).json()
+        assert backend.started.wait(timeout=2)
+        assert client.post("/api/tts", json={"text": "Secret third.", "voice": "p226"}).status_code == 429
+        backend.release.set()
+        assert client.get(f"/api/jobs/{job['job_id']}", params={"wait": 2}).json()["state"] == "completed"
+        wait_until(lambda: application.state.runtime.metrics().trace_records == 2)
+        assert client.post("/api/tts", json={"text": "Secret first sentence.", "voice": "p225"}).status_code == 200
+
+        raw = trace.read_text()
+        assert "Secret" not in raw
+        records = [json.loads(line) for line in raw.splitlines()]
+        assert [record["outcome"] for record in records] == ["queue_full", "completed", "cached"]
+        rejected, completed, cached = records
+        assert (rejected["chars"], rejected["voice"], rejected["sentences"]) == (13, "p226", 1)
+        assert (completed["chars"], completed["sentences"], completed["model"]) == (22, 1, "fake-model")
+        assert completed["queue_wait"] >= 0 and completed["inference"] > 0 and completed["timed_out"] is False
+        assert completed["at"] <= rejected["at"]
+        assert cached["voice"] == "p225"
+
+        for _ in range(40):
+            client.post("/api/tts", json={"text": "Secret first sentence.", "voice": "p225"})
+        metrics = client.get("/api/metrics").json()
+        assert metrics["trace_dropped"] > 0
+        assert trace.stat().st_size <= 2048
+
+
+def test_client_id_header_is_ignored_unless_a_trusted_proxy_sets_it() -> None:
+    backend = BlockingTTS()
+    application = create_app(
+        config=config(queue_capacity=8, client_max_slots=1), model_loader=lambda _config: backend
+    )
+
+    with TestClient(application) as client:
+        first = client.post("/api/jobs", json={"text": "First", "voice": "p225"}, headers={"X-Client-Id": "one"})
+        assert first.status_code == 202
+        rotated = client.post("/api/jobs", json={"text": "Second", "voice": "p225"}, headers={"X-Client-Id": "two"})
+        assert rotated.status_code == 429
+        assert rotated.json()["error"]["code"] == "CLIENT_QUEUE_FULL"
+        assert set(client.get("/api/metrics").json()["clients"]) == {"testclient"}
+        backend.release.set()
+
+
+@pytest.mark.parametrize(
+    ("peer", "header", "expected"),
+    [
+        ("10.0.0.2", "reader-1", "10.0.0.2"),
+        ("10.0.0.1", "reader-1", "reader-1"),
+        ("10.0.0.1", "", "10.0.0.1"),
+        ("10.0.0.1", "x" * 100, "x" * app_module.MAX_CLIENT_ID_CHARS),
+        (None, "reader-1", app_module.DEFAULT_CLIENT_ID),
+    ],
+)
+def test_client_identity_trusts_the_header_only_from_configured_proxies(
+    peer: str | None, header: str, expected: str
+) -> None:
+    scope = {
+        "type": "http",
+        "headers": [(b"x-client-id", header.encode())],
+        "client": None if peer is None else (peer, 1234),
+    }
+    connection = HTTPConnection(scope)
+    assert app_module.client_identity(connection, ("10.0.0.1",)) == expected
@@ -14,6 +14,7 @@ def test_runtime_image_installs_queue_aware_healthcheck() -> None:
     assert "--start-period=15m" in text
     assert 'CMD ["python", "/app/healthcheck.py"]' in text
     assert "urllib.request.urlopen" not in text
+    assert "RUN python -m compileall -q app.py healthcheck.py" in text
 
 
 def test_runtime_image_remains_non_root() -> None:
@@ -21,4 +22,7 @@ def test_runtime_image_remains_non_root() -> None:
 
     assert "useradd --create-home --uid 10001" in text
     assert "USER readit" in text
-    assert 'CMD ["uvicorn", "app:app", "--host", "0.0.0.0", "--port", "5002", "--workers", "1", "--no-access-log"]' in text
+    assert (
+        'CMD ["uvicorn", "app:app", "--host", "0.0.0.0", "--port", "5002", "--workers", "1", "--no-access-log"]'
+        in text
+    )
@@ -5,6 +5,8 @@ import json
 import urllib.error
 from typing import Any
 
+import pytest
+
 import healthcheck
 
 
@@ -32,31 +34,27 @@ def http_error(status: int, payload: dict[str, Any]) -> urllib.error.HTTPError:
     )
 
 
-def test_healthcheck_accepts_ready_service(monkeypatch: Any) -> None:
+def test_healthcheck_accepts_live_service(monkeypatch: Any) -> None:
     monkeypatch.setattr(
         healthcheck.urllib.request,
         "urlopen",
-        lambda *_args, **_kwargs: JsonResponse({"ok": True, "ready": True}),
+        lambda *_args, **_kwargs: JsonResponse({"ok": True, "alive": True}),
     )
 
     assert healthcheck.main() == 0
+    assert healthcheck.URL.endswith("/api/live")
 
 
-def test_healthcheck_treats_queue_saturation_as_healthy(monkeypatch: Any) -> None:
-    def saturated(*_args: object, **_kwargs: object) -> object:
-        raise http_error(503, {"ok": False, "error": {"code": "QUEUE_FULL"}})
-
-    monkeypatch.setattr(healthcheck.urllib.request, "urlopen", saturated)
-    assert healthcheck.main() == 0
-
+@pytest.mark.parametrize("code", ["INFERENCE_STALLED", "WORKER_NOT_DRAINING", "NOT_READY"])
+def test_healthcheck_rejects_stalled_and_not_ready_service(monkeypatch: Any, code: str) -> None:
+    def failing(*_args: object, **_kwargs: object) -> object:
+        raise http_error(503, {"ok": False, "error": {"code": code}})
 
-def test_healthcheck_rejects_not_ready_and_transport_failures(monkeypatch: Any) -> None:
-    def not_ready(*_args: object, **_kwargs: object) -> object:
-        raise http_error(503, {"ok": False, "error": {"code": "NOT_READY"}})
-
-    monkeypatch.setattr(healthcheck.urllib.request, "urlopen", not_ready)
+    monkeypatch.setattr(healthcheck.urllib.request, "urlopen", failing)
     assert healthcheck.main() == 1
 
+
+def test_healthcheck_rejects_transport_failures(monkeypatch: Any) -> None:
     def unavailable(*_args: object, **_kwargs: object) -> object:
         raise OSError("connection refused")
 
@@ -68,34 +66,33 @@ def test_healthcheck_rejects_incomplete_success_payload(monkeypatch: Any) -> Non
     monkeypatch.setattr(
         healthcheck.urllib.request,
         "urlopen",
-        lambda *_args, **_kwargs: JsonResponse({"ok": True, "ready": False}),
+        lambda *_args, **_kwargs: JsonResponse({"ok": True, "alive": False}),
     )
     assert healthcheck.main() == 1
 
 
-def test_healthcheck_rejects_invalid_http_error_payload(monkeypatch: Any) -> None:
-    def invalid_json(*_args: object, **_kwargs: object) -> object:
-        raise urllib.error.HTTPError(
-            healthcheck.URL,
-            503,
-            "failure",
-            hdrs=None,
-            fp=io.BytesIO(b"not-json"),
-        )
+def test_healthcheck_rejects_invalid_success_payload(monkeypatch: Any) -> None:
+    class InvalidResponse(JsonResponse):
+        def read(self, _amount: int | None = None) -> bytes:
+            return b"not-json"
 
-    monkeypatch.setattr(healthcheck.urllib.request, "urlopen", invalid_json)
+    monkeypatch.setattr(
+        healthcheck.urllib.request,
+        "urlopen",
+        lambda *_args, **_kwargs: InvalidResponse({}),
+    )
     assert healthcheck.main() == 1
 
 
-def test_healthcheck_rejects_non_object_queue_error(monkeypatch: Any) -> None:
-    def non_object(*_args: object, **_kwargs: object) -> object:
-        raise urllib.error.HTTPError(
-            healthcheck.URL,
-            503,
-            "failure",
-            hdrs=None,
-            fp=io.BytesIO(b"[]"),
-        )
+@pytest.mark.parametrize("body", [b"[]", b'"alive"', b"null"])
+def test_healthcheck_rejects_non_object_success_payload(monkeypatch: Any, body: bytes) -> None:
+    class NonObjectResponse(JsonResponse):
+        def read(self, _amount: int | None = None) -> bytes:
+            return body
 
-    monkeypatch.setattr(healthcheck.urllib.request, "urlopen", non_object)
+    monkeypatch.setattr(
+        healthcheck.urllib.request,
+        "urlopen",
+        lambda *_args, **_kwargs: NonObjectResponse({}),
+    )
     assert healthcheck.main() == 1
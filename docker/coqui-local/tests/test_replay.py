@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+import app as app_module
+import replay
+from replay import Scenario, TraceRecord
+
+
+def burst(count: int, inference: float = 1.0, **overrides: object) -> list[TraceRecord]:
+    values: dict[str, object] = {"chars": 50, "sentences": 1, "outcome": "completed", "inference": inference}
+    values.update(overrides)
+    return [TraceRecord(at=1000.0, **values) for _ in range(count)]  # type: ignore[arg-type]
+
+
+def test_trace_loading_sorts_by_arrival_and_rejects_bad_lines(tmp_path: Path) -> None:
+    trace = tmp_path / "trace.jsonl"
+    trace.write_text(
+        '{"at":2.0,"chars":10,"sentences":1,"outcome":"completed","inference":0.5,"deadline":null}\n'
+        "\n"
+        '{"at":1.0,"chars":20,"outcome":"queue_full","voice":"p225"}\n'
+    )
+    records = replay.load_trace(trace)
+    assert [(record.at, record.outcome, record.sentences) for record in records] == [
+        (1.0, "queue_full", 1),
+        (2.0, "completed", 1),
+    ]
+    assert records[0].voice == "p225" and records[0].inference is None
+
+    trace.write_text('{"at":"soon","chars":1,"outcome":"completed"}\n')
+    with pytest.raises(ValueError, match=":1:"):
+        replay.load_trace(trace)
+
+
+def test_latency_fit_uses_measured_inference_and_falls_back_to_prior() -> None:
+    records = [TraceRecord(0.0, chars, 1, "completed", inference=0.2 + 0.01 * chars) for chars in (10, 50, 90)]
+    intercept, slope = replay.fit_latency(records)
+    assert intercept == pytest.approx(0.2)
+    assert slope == pytest.approx(0.01)
+    assert replay.fit_latency(burst(2, inference=0.0)) == (0.0, replay.DEFAULT_SECONDS_PER_CHAR)
+
+
+def test_simulation_applies_capacity_workers_and_deadlines_deterministically() -> None:
+    records = burst(4) + [TraceRecord(1000.0, 50, 1, "cached")]
+
+    single = replay.simulate(records, Scenario(queue_capacity=2, workers=1, timeout_seconds=10, queue_work_seconds=60))
+    assert dict(single.outcomes) == {"completed": 2, "queue_full": 2, "cached": 1}
+    assert sorted(single.latencies) == [0.0, 1.0, 2.0]
+    assert single.summary()["utilization"] == 1.0
+
+    wider = replay.simulate(records, Scenario(queue_capacity=4, workers=2, timeout_seconds=10, queue_work_seconds=60))
+    assert dict(wider.outcomes) == {"completed": 4, "cached": 1}
+    assert wider.summary()["p95_seconds"] == 2.0
+
+    strict = replay.simulate(
+        records, Scenario(queue_capacity=4, workers=1, timeout_seconds=1.5, queue_work_seconds=60)
+    )
+    assert strict.outcomes["deadline_unreachable"] == 3
+    budget = replay.simulate(
+        records, Scenario(queue_capacity=4, workers=1, timeout_seconds=10, queue_work_seconds=2.5)
+    )
+    assert budget.outcomes["queue_full"] == 2
+    assert replay.simulate(records, Scenario(4, 1, 10, 60)).summary() == replay.simulate(
+        records, Scenario(4, 1, 10, 60)
+    ).summary()
+
+
+@pytest.mark.parametrize(("chars", "sentences"), [(5, 1), (80, 1), (240, 3), (30, 9)])
+def test_synthetic_text_matches_the_recorded_shape(chars: int, sentences: int) -> None:
+    text = replay.synthetic_text(chars, sentences, seed=7)
+    assert abs(len(text) - chars) <= sentences
+    assert len(app_module.segment_sentences(text)) == min(sentences, max(1, chars // 12))
+    assert replay.synthetic_text(chars, sentences, seed=0) == replay.synthetic_text(chars, sentences, seed=0)
+    assert replay.synthetic_text(chars, sentences, seed=8) != text
+
+
+def test_drive_paces_requests_and_classifies_responses() -> None:
+    now = [0.0]
+    sent: list[dict[str, object]] = []
+    responses = iter([(200, None), (429, "QUEUE_FULL"), (504, "SYNTHESIS_TIMEOUT"), (0, None)])
+
+    def post(body: dict[str, object]) -> tuple[int, str | None]:
+        sent.append(body)
+        return next(responses)
+
+    def sleep(seconds: float) -> None:
+        now[0] += seconds
+
+    records = [
+        TraceRecord(10.0, 20, 1, "completed", voice="p225", model="fake-model", deadline=5.0),
+        TraceRecord(14.0, 20, 1, "cached", voice="p225"),
+        TraceRecord(18.0, 20, 1, "completed"),
+        TraceRecord(18.0, 20, 1, "completed"),
+    ]
+    result = replay.drive(records, post, speed=2.0, concurrency=1, sleep=sleep, clock=lambda: now[0])
+
+    assert now[0] == pytest.approx(4.0)
+    assert sent[0]["voice"] == "p225" and sent[0]["deadline_seconds"] == 5.0
+    assert sent[1]["text"] == replay.synthetic_text(20, 1, seed=0)
+    assert dict(result.outcomes) == {"completed": 1, "queue_full": 1, "timed_out": 1, "http_0": 1}
+    assert result.requests == 4
+
+    anonymous = replay.drive(records[:1], lambda _body: (200, None), keep_voices=False)
+    assert anonymous.outcomes["completed"] == 1
+
+
+def test_cli_simulates_a_sweep_and_reports_bad_traces(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    trace = tmp_path / "trace.jsonl"
+    record = json.dumps({"at": 0, "chars": 40, "outcome": "completed", "inference": 1})
+    trace.write_text(f"{record}\n" * 3)
+
+    assert replay.main(["simulate", str(trace), "--queue-capacity", "1", "3", "--json"]) == 0
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [line["outcomes"] for line in lines] == [{"completed": 1, "queue_full": 2}, {"completed": 3}]
+
+    assert replay.main(["simulate", str(trace), "--timeout", "2"]) == 0
+    assert "capacity=16 workers=1 timeout=2s" in capsys.readouterr().out
+    assert replay.main(["simulate", str(tmp_path / "missing.jsonl")]) == 1
+    with pytest.raises(SystemExit):
+        replay.main(["simulate", str(trace), "--workers", "0"])
+
+
+def test_synthetic_backend_writes_audio_proportional_to_text(tmp_path: Path) -> None:
+    backend = replay.SyntheticTTS(intercept=0.0, seconds_per_char=0.0)
+    output = tmp_path / "out.wav"
+    backend.tts_to_file(text="x" * 10, file_path=str(output))
+    audio_format, frames = app_module.read_pcm_wav(output.read_bytes())
+    assert audio_format == (1, 2, replay.SYNTHETIC_FRAME_RATE)
+    assert len(frames) == 2 * int(replay.SYNTHETIC_FRAME_RATE * replay.SYNTHETIC_SECONDS_PER_CHAR * 10)
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+SERVICE_ROOT = Path(__file__).resolve().parents[1]
+IMPORT_BUDGET_SECONDS = float(os.environ.get("IMPORT_BUDGET_SECONDS", "3"))
+PING_BUDGET_SECONDS = float(os.environ.get("PING_BUDGET_SECONDS", "5"))
+
+# Runs in a fresh interpreter so earlier tests cannot have warmed the imports.
+PROBE = """
+import json, sys, time
+
+class Backend:
+    speakers = ["p225"]
+
+    def tts_to_file(self, *, text, file_path, speaker=None):
+        open(file_path, "wb").write(b"RIFFprobe")
+
+started = time.perf_counter()
+import app
+imported = time.perf_counter()
+heavy = [name for name in app.HEAVY_MODULES if name in sys.modules]
+from fastapi.testclient import TestClient  # the test harness is not part of the budget
+
+serving = time.perf_counter()
+with TestClient(app.create_app(model_loader=lambda _config: Backend())) as client:
+    assert client.get("/api/ping").json() == {"ok": True}
+    ping = imported - started + time.perf_counter() - serving
+    startup = client.get("/api/ready").json()["startup"]
+print(json.dumps({"import": imported - started, "ping": ping, "heavy": heavy, "startup": startup}))
+"""
+
+
+def test_service_import_and_time_to_ping_stay_within_budget() -> None:
+    environment = {key: value for key, value in os.environ.items() if not key.startswith("COQUI_")}
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=SERVICE_ROOT,
+        env=environment,
+        capture_output=True,
+        text=True,
+        timeout=120,
+        check=True,
+    )
+    measured = json.loads(result.stdout.strip().splitlines()[-1])
+
+    assert measured["heavy"] == [], f"importing app loaded {measured['heavy']}; import them where they are used"
+    assert measured["import"] < IMPORT_BUDGET_SECONDS, f"import took {measured['import']:.2f}s"
+    assert measured["ping"] < PING_BUDGET_SECONDS, f"time to ping took {measured['ping']:.2f}s"
+    assert measured["startup"]["heavy_modules_loaded"] == []
+    assert measured["startup"]["app_module_seconds"] <= measured["import"]